@@ -0,0 +1,270 @@
+#!/usr/bin/env python3
+"""
+Benchmark: fused single-prompt evaluation vs. split per-section prompts
+
+Evaluates the same technologies with ``evaluate_technology(mode="split")``
+(three prompts per technology) and ``mode="fused"`` (one prompt, with
+per-section fallback) and reports, for each mode, the number of LLM calls,
+input and output tokens, and wall time, plus how well the two modes agree
+on ``overall_score`` and ``recommended_action``.
+
+By default the LLM is a local stand-in that answers with deterministic
+scores after a delay proportional to the prompt size, so calls, tokens and
+latency can be compared offline (score agreement is then trivially
+perfect). Pass ``--model`` to benchmark a real provider.
+
+Usage:
+    python benchmarks/bench_fused_evaluation.py --technologies out/scouting_results.json
+    python benchmarks/bench_fused_evaluation.py --model gpt-4o-mini --limit 5
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import random
+import re
+import sys
+import threading
+import time
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tech_scout.evaluate_technologies import evaluate_technology
+from tech_scout.evidence import estimate_tokens
+from tech_scout.llm import create_client
+from tech_scout.llm_cache import configure_llm_cache
+from tech_scout.parallel import run_parallel
+
+SAMPLE_TECHNOLOGIES = [
+    {
+        "name": "solid_state_batteries",
+        "title": "Solid-State Batteries",
+        "description": "Lithium batteries with solid electrolytes for higher energy density and safety.",
+        "key_capabilities": ["higher energy density", "non-flammable electrolyte"],
+        "key_players": ["Toyota", "QuantumScape", "Samsung SDI"],
+    },
+    {
+        "name": "perovskite_tandem_solar",
+        "title": "Perovskite-Silicon Tandem Solar Cells",
+        "description": "Stacked perovskite and silicon cells exceeding single-junction efficiency limits.",
+        "key_capabilities": ["30%+ efficiency", "low-cost deposition"],
+        "key_players": ["Oxford PV", "LONGi", "Hanwha Qcells"],
+    },
+    {
+        "name": "small_language_models",
+        "title": "Small Language Models",
+        "description": "Compact language models that run on-device with task-specific fine-tuning.",
+        "key_capabilities": ["on-device inference", "low latency", "privacy"],
+        "key_players": ["Microsoft", "Google", "Mistral AI"],
+    },
+    {
+        "name": "base_editing",
+        "title": "Base Editing",
+        "description": "CRISPR-derived editors that change single DNA bases without double-strand breaks.",
+        "key_capabilities": ["precise point mutations", "reduced off-target damage"],
+        "key_players": ["Beam Therapeutics", "Broad Institute", "Verve Therapeutics"],
+    },
+]
+
+ORGANIZATION_CONTEXT = {
+    "industry": "Diversified Manufacturing",
+    "current_capabilities": ["materials science", "process engineering", "embedded software"],
+    "strategic_priorities": ["Decarbonization", "Product Differentiation", "Operational Efficiency"],
+    "risk_tolerance": "moderate",
+    "investment_horizon": "3-5 years",
+}
+
+
+class CountingClient:
+    """
+    Proxy around an LLM client that records calls, tokens and latency.
+
+    Uses the provider's reported usage when the response carries it and
+    the local token estimate otherwise.
+    """
+
+    def __init__(self, client):
+        self._client = client
+        self._lock = threading.Lock()
+        self.reset()
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self._chat_create))
+        self.messages = SimpleNamespace(create=self._messages_create)
+
+    def reset(self):
+        self.calls = 0
+        self.input_tokens = 0
+        self.output_tokens = 0
+
+    def _record(self, request, response, text):
+        usage = getattr(response, "usage", None)
+        input_tokens = getattr(usage, "prompt_tokens", None) or getattr(usage, "input_tokens", None)
+        output_tokens = getattr(usage, "completion_tokens", None) or getattr(usage, "output_tokens", None)
+        if input_tokens is None:
+            input_tokens = estimate_tokens(json.dumps(request.get("messages"), ensure_ascii=False))
+            input_tokens += estimate_tokens(request.get("system", ""))
+        if output_tokens is None:
+            output_tokens = estimate_tokens(text or "")
+        with self._lock:
+            self.calls += 1
+            self.input_tokens += input_tokens
+            self.output_tokens += output_tokens
+
+    def _chat_create(self, **request):
+        response = self._client.chat.completions.create(**request)
+        self._record(request, response, response.choices[0].message.content)
+        return response
+
+    def _messages_create(self, **request):
+        response = self._client.messages.create(**request)
+        self._record(request, response, response.content[0].text)
+        return response
+
+
+class StandInClient:
+    """
+    Offline OpenAI-style client that answers evaluation prompts.
+
+    Scores are derived from a hash of the technology, so both modes see the
+    same values. Latency is ``base_latency`` plus ``per_token`` seconds per
+    estimated input token. With ``malformed_rate``, a fused response drops
+    one section at that probability to exercise the per-section fallback.
+    """
+
+    SECTION_MARKERS = {
+        "MATURITY JSON": ("maturity_assessment",),
+        "FIT JSON": ("strategic_fit",),
+        "LANDSCAPE JSON": ("competitive_landscape",),
+        "EVALUATION JSON": ("maturity_assessment", "strategic_fit", "competitive_landscape"),
+    }
+
+    def __init__(self, base_latency: float, per_token: float, malformed_rate: float, seed: int = 0):
+        self.base_latency = base_latency
+        self.per_token = per_token
+        self.malformed_rate = malformed_rate
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self._create))
+
+    @staticmethod
+    def _sections(technology: str):
+        digest = hashlib.sha256(technology.encode("utf-8")).digest()
+        return {
+            "maturity_assessment": {
+                "trl_level": 1 + digest[0] % 9,
+                "trl_description": "Stand-in assessment",
+                "maturity_stage": "development",
+                "evidence_strength": 1 + digest[1] % 10,
+                "confidence": 6,
+            },
+            "strategic_fit": {
+                "overall_fit_score": 1 + digest[2] % 10,
+                "build_vs_buy_recommendation": "partner",
+                "time_sensitivity": "important",
+            },
+            "competitive_landscape": {
+                "market_leaders": ["Stand-in Corp"],
+                "competitive_intensity": 1 + digest[3] % 10,
+                "market_timing": "growth",
+            },
+        }
+
+    def _create(self, **request):
+        prompt = request["messages"][-1]["content"]
+        time.sleep(self.base_latency + self.per_token * estimate_tokens(prompt))
+
+        match = re.search(r"<technology>(.*?)</technology>", prompt, re.DOTALL)
+        sections = self._sections(match.group(1).strip() if match else prompt)
+        marker = next(m for m in self.SECTION_MARKERS if m in prompt)
+        names = self.SECTION_MARKERS[marker]
+        if len(names) == 1:
+            payload = sections[names[0]]
+        else:
+            payload = {name: sections[name] for name in names}
+            with self._lock:
+                if self._rng.random() < self.malformed_rate:
+                    payload.pop(self._rng.choice(names))
+
+        text = f"ANALYSIS:\nStand-in analysis.\n\n{marker}:\n```json\n{json.dumps(payload)}\n```"
+        message = SimpleNamespace(content=text)
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)], usage=None)
+
+
+def run_mode(mode, client, model, technologies, organization_context, workers):
+    client.reset()
+    start = time.perf_counter()
+    evaluations = run_parallel(
+        [
+            lambda tech=tech: evaluate_technology(
+                "", client, model, tech, organization_context, save_results=False, mode=mode
+            )
+            for tech in technologies
+        ],
+        max_workers=workers,
+    )
+    elapsed = time.perf_counter() - start
+    print(f"{mode:<6} {client.calls:6d} calls  {client.input_tokens:9,d} in  "
+          f"{client.output_tokens:8,d} out  {elapsed:8.2f} s")
+    return evaluations, {"calls": client.calls, "input": client.input_tokens, "time": elapsed}
+
+
+def load_technologies(path):
+    with open(path, "r") as f:
+        data = json.load(f)
+    return data.get("technologies", []) if isinstance(data, dict) else data
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark fused vs. split technology evaluation.")
+    parser.add_argument("--technologies", type=str, default=None,
+                        help="scouting_results.json or a JSON list of technologies (default: built-in sample).")
+    parser.add_argument("--org-context", type=str, default=None, help="Organization context JSON.")
+    parser.add_argument("--limit", type=int, default=None, help="Evaluate at most this many technologies.")
+    parser.add_argument("--workers", type=int, default=4, help="Technologies evaluated concurrently.")
+    parser.add_argument("--model", type=str, default=None,
+                        help="Benchmark a real model instead of the local stand-in.")
+    parser.add_argument("--latency", type=float, default=0.3, help="Stand-in base latency per call (s).")
+    parser.add_argument("--per-token", type=float, default=0.0002, help="Stand-in latency per input token (s).")
+    parser.add_argument("--malformed-rate", type=float, default=0.1,
+                        help="Stand-in probability of dropping a section from a fused response.")
+    args = parser.parse_args()
+
+    technologies = load_technologies(args.technologies) if args.technologies else SAMPLE_TECHNOLOGIES
+    technologies = technologies[:args.limit] if args.limit else technologies
+    organization_context = ORGANIZATION_CONTEXT
+    if args.org_context:
+        with open(args.org_context, "r") as f:
+            organization_context = json.load(f)
+
+    # Every call must reach the provider
+    configure_llm_cache(None, policy="off")
+
+    if args.model:
+        client, model = create_client(args.model)
+    else:
+        client = StandInClient(args.latency, args.per_token, args.malformed_rate)
+        model = "gpt-4o"
+    counting = CountingClient(client)
+
+    print(f"{len(technologies)} technologies, {args.workers} workers, "
+          f"{'model ' + args.model if args.model else 'local stand-in LLM'}\n")
+    split, split_stats = run_mode("split", counting, model, technologies, organization_context, args.workers)
+    fused, fused_stats = run_mode("fused", counting, model, technologies, organization_context, args.workers)
+
+    diffs = []
+    same_action = 0
+    for a, b in zip(split, fused):
+        rec_a, rec_b = a["overall_recommendation"], b["overall_recommendation"]
+        diffs.append(abs(rec_a["overall_score"] - rec_b["overall_score"]))
+        same_action += rec_a["recommended_action"] == rec_b["recommended_action"]
+
+    print(f"\nCalls:  {split_stats['calls'] / max(fused_stats['calls'], 1):.2f}x fewer with fused")
+    print(f"Input:  {split_stats['input'] / max(fused_stats['input'], 1):.2f}x fewer tokens with fused")
+    print(f"Time:   {split_stats['time'] / max(fused_stats['time'], 1e-9):.2f}x speedup with fused")
+    print(f"overall_score: mean |diff| {sum(diffs) / len(diffs):.2f}, max {max(diffs):.2f}")
+    print(f"recommended_action agreement: {same_action}/{len(diffs)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Benchmark: pooled session layer vs. bare requests.get
+
+Starts a local keep-alive HTTP server as a stand-in for a search API and
+issues the same sequence of requests twice: once with a bare
+``requests.get`` per call (the old behaviour of the search functions) and
+once through ``tech_scout.http_client``. Reports wall time and the number
+of TCP connections the server accepted for each mode.
+
+Usage:
+    python benchmarks/bench_http_session.py --requests 200 --workers 4
+"""
+
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import requests
+
+from tech_scout.http_client import http_get, session_factory
+from tech_scout.parallel import run_parallel
+from tech_scout.rate_limit import configure_rate_limits
+
+PAYLOAD = json.dumps({"results": [{"title": f"Paper {i}"} for i in range(20)]}).encode()
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """Serves a fixed JSON page over HTTP/1.1 keep-alive and counts connections."""
+
+    protocol_version = "HTTP/1.1"
+    connections = 0
+    lock = threading.Lock()
+
+    def setup(self):
+        super().setup()
+        with StandInHandler.lock:
+            StandInHandler.connections += 1
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(PAYLOAD)))
+        self.end_headers()
+        self.wfile.write(PAYLOAD)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def run_mode(name, fetch, url, num_requests, workers):
+    StandInHandler.connections = 0
+    start = time.perf_counter()
+    run_parallel(
+        [lambda i=i: fetch(f"{url}?q={i}").json() for i in range(num_requests)],
+        max_workers=workers,
+    )
+    elapsed = time.perf_counter() - start
+    print(f"{name:<10} {elapsed * 1000:9.1f} ms  "
+          f"{elapsed * 1000 / num_requests:7.2f} ms/req  "
+          f"{StandInHandler.connections:5d} connections")
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the pooled HTTP session layer.")
+    parser.add_argument("--requests", type=int, default=200, help="Requests per mode.")
+    parser.add_argument("--workers", type=int, default=4, help="Concurrent request threads.")
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StandInHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    host, port = server.server_address
+    url = f"http://{host}:{port}/works"
+
+    # The stand-in host is not a real provider; lift its rate limit
+    configure_rate_limits({host: {"rate": 1e6, "burst": 1_000_000}})
+
+    print(f"{args.requests} requests, {args.workers} workers against {url}\n")
+    bare = run_mode("bare", lambda u: requests.get(u, timeout=30), url, args.requests, args.workers)
+    pooled = run_mode("pooled", http_get, url, args.requests, args.workers)
+    print(f"\nSpeedup: {bare / pooled:.2f}x")
+
+    session_factory.close()
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Benchmark: streaming OpenAlex normalization vs. response.json() + sort loop
+
+Builds a synthetic OpenAlex /works page (200 works with long inverted-index
+abstracts by default) and normalizes it two ways: the previous approach
+(parse the whole body with ``json.loads`` and rebuild each abstract by
+sorting (position, word) pairs) and ``iter_openalex_works``, which parses
+the body chunk by chunk and fills a preallocated position array. Reports
+time per page and peak traced memory for each.
+
+The "streaming" row feeds the parser directly, which is what a run with
+``--no-cache`` does. With the response cache on (the default), the body
+goes through ``http_client.StreamingResponse``, which keeps every chunk so
+it can store the complete body; the "stream+cache" row measures that path,
+whose peak memory grows with the full payload like the baseline's.
+
+Usage:
+    python benchmarks/bench_openalex_parse.py --works 200 --abstract-words 400
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tech_scout.http_client import StreamingResponse
+from tech_scout.scout_technologies import iter_openalex_works
+from tech_scout.streaming import CHUNK_SIZE
+
+VOCABULARY = [f"term{i}" for i in range(2000)]
+
+
+def make_page(num_works: int, abstract_words: int) -> bytes:
+    """Serialize a synthetic OpenAlex page."""
+    rng = random.Random(0)
+    works = []
+    for i in range(num_works):
+        inverted = {}
+        for pos in range(abstract_words):
+            inverted.setdefault(rng.choice(VOCABULARY), []).append(pos)
+        works.append({
+            "id": f"https://openalex.org/W{i}",
+            "doi": f"https://doi.org/10.1234/{i}",
+            "title": f"Synthetic work {i}",
+            "publication_year": 2020 + i % 5,
+            "cited_by_count": rng.randint(0, 500),
+            "abstract_inverted_index": inverted,
+            "primary_location": {"source": {"display_name": "Journal of Benchmarks"}},
+            "authorships": [{"author": {"display_name": f"Author {j}"}} for j in range(8)],
+        })
+    page = {"meta": {"count": num_works, "next_cursor": "abc"}, "results": works}
+    return json.dumps(page).encode("utf-8")
+
+
+class FakeResponse:
+    """Serves a body through iter_content() like a streamed response."""
+
+    def __init__(self, body: bytes):
+        self.body = body
+
+    def iter_content(self, chunk_size: int = CHUNK_SIZE):
+        for start in range(0, len(self.body), chunk_size):
+            yield self.body[start:start + chunk_size]
+
+
+def normalize_baseline(body: bytes):
+    """The previous loop: full json.loads, then sort-based abstract rebuild."""
+    papers = []
+    for paper in json.loads(body).get("results", []):
+        abstract = ""
+        abstract_inv = paper.get("abstract_inverted_index")
+        if abstract_inv and isinstance(abstract_inv, dict):
+            word_positions = []
+            for word, positions in abstract_inv.items():
+                for pos in positions:
+                    word_positions.append((pos, word))
+            word_positions.sort()
+            abstract = " ".join(word for _, word in word_positions)
+        venue = ((paper.get("primary_location") or {}).get("source") or {}).get("display_name", "")
+        authors = [
+            a["author"]["display_name"] for a in paper.get("authorships", []) or []
+            if a.get("author", {}).get("display_name")
+        ]
+        papers.append({
+            "title": paper.get("title", "") or "",
+            "abstract": abstract,
+            "authors": authors,
+            "year": paper.get("publication_year"),
+            "citations": paper.get("cited_by_count", 0) or 0,
+            "venue": venue,
+            "doi": paper.get("doi"),
+            "source": "openalex",
+        })
+    return papers
+
+
+def normalize_streaming(body: bytes):
+    return list(iter_openalex_works(FakeResponse(body)))
+
+
+def normalize_streaming_cached(body: bytes):
+    """Streaming parse through the wrapper used when the response cache is on."""
+    stored = []
+    return list(iter_openalex_works(StreamingResponse(FakeResponse(body), stored.append)))
+
+
+def measure(fn, body: bytes, repeats: int):
+    start = time.perf_counter()
+    for _ in range(repeats):
+        result = fn(body)
+    elapsed = (time.perf_counter() - start) / repeats
+
+    tracemalloc.start()
+    fn(body)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark OpenAlex page normalization")
+    parser.add_argument("--works", type=int, default=200, help="Works per page")
+    parser.add_argument("--abstract-words", type=int, default=400, help="Words per abstract")
+    parser.add_argument("--repeats", type=int, default=5, help="Timed repetitions")
+    args = parser.parse_args()
+
+    body = make_page(args.works, args.abstract_words)
+    print(f"Page: {args.works} works, {len(body) / 1e6:.1f} MB")
+
+    base_time, base_peak, base_result = measure(normalize_baseline, body, args.repeats)
+    stream_time, stream_peak, stream_result = measure(normalize_streaming, body, args.repeats)
+    cached_time, cached_peak, cached_result = measure(normalize_streaming_cached, body, args.repeats)
+    assert base_result == stream_result == cached_result, "Normalizers disagree"
+
+    print(f"{'mode':<12} {'ms/page':>10} {'peak MB':>10}")
+    print(f"{'baseline':<12} {base_time * 1000:>10.1f} {base_peak / 1e6:>10.1f}")
+    print(f"{'streaming':<12} {stream_time * 1000:>10.1f} {stream_peak / 1e6:>10.1f}")
+    print(f"{'stream+cache':<12} {cached_time * 1000:>10.1f} {cached_peak / 1e6:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
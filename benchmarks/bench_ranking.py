@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Benchmark: evidence ranking (BM25 scoring + MMR selection)
+
+Builds a synthetic corpus with a realistic vocabulary (Zipf-distributed
+words, abstracts of a few hundred words) and runs ``score_records`` and
+``rank_records`` over it, reporting wall time and peak traced memory for
+each. MMR runs over a bounded candidate pool with hashed float32 feature
+vectors, so ``rank_records`` should cost little more than scoring.
+
+Usage:
+    python benchmarks/bench_ranking.py --records 20000 --vocabulary 60000 --limit 200
+"""
+
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from tech_scout.ranking import rank_records, score_records
+
+DOMAIN = "Energy Storage"
+FOCUS_AREAS = [
+    "solid state batteries",
+    "sodium ion cells",
+    "grid scale storage",
+    "battery recycling",
+    "thermal management",
+]
+
+
+def make_records(num_records: int, vocabulary_size: int, abstract_words: int):
+    """Synthetic papers whose words follow a Zipf distribution, with focus-area terms mixed in."""
+    rng = np.random.default_rng(0)
+    vocabulary = np.array([f"w{i}" for i in range(vocabulary_size)])
+    topical = " ".join([DOMAIN] + FOCUS_AREAS).lower().split()
+    records = []
+    for i in range(num_records):
+        ranks = np.minimum(rng.zipf(1.1, abstract_words), vocabulary_size) - 1
+        words = list(vocabulary[ranks])
+        words.extend(rng.choice(topical, size=rng.integers(0, 12)))
+        rng.shuffle(words)
+        records.append({
+            "title": " ".join(words[:10]),
+            "abstract": " ".join(words[10:]),
+            "year": 2020 + i % 6,
+            "citations": int(rng.integers(0, 500)),
+        })
+    return records
+
+
+def measure(fn):
+    start = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark evidence ranking")
+    parser.add_argument("--records", type=int, default=20000, help="Records to rank")
+    parser.add_argument("--vocabulary", type=int, default=60000, help="Distinct words")
+    parser.add_argument("--abstract-words", type=int, default=185, help="Words per record")
+    parser.add_argument("--limit", type=int, default=200, help="Records to select")
+    args = parser.parse_args()
+
+    records = make_records(args.records, args.vocabulary, args.abstract_words)
+    print(f"Corpus: {len(records)} records, ~{args.abstract_words} words each, "
+          f"limit {args.limit}, {len(FOCUS_AREAS)} focus areas")
+
+    rows = [
+        ("score", measure(lambda: score_records(records, DOMAIN, FOCUS_AREAS))),
+        ("rank", measure(lambda: rank_records(records, DOMAIN, FOCUS_AREAS, args.limit))),
+    ]
+
+    print(f"{'step':<8} {'seconds':>10} {'peak MB':>10}")
+    for name, (elapsed, peak) in rows:
+        print(f"{name:<8} {elapsed:>10.2f} {peak / 1e6:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -25,8 +25,16 @@ load_dotenv()
 
 from tech_scout.llm import create_client, AVAILABLE_LLMS
 from tech_scout.scout_technologies import scout_technologies, generate_search_queries
-from tech_scout.evaluate_technologies import batch_evaluate_technologies
+from tech_scout.evaluate_technologies import EVALUATION_MODES, batch_evaluate_technologies
 from tech_scout.generate_report import generate_scouting_report
+from tech_scout.corpus_store import default_corpus_path, open_corpus
+from tech_scout.llm_cache import (
+    DEFAULT_POLICY,
+    LLM_CACHE_POLICIES,
+    configure_llm_cache,
+    default_llm_cache_dir,
+)
+from tech_scout.rate_limit import configure_rate_limits
 
 
 def print_banner():
@@ -164,6 +172,85 @@ Examples:
         default=3,
         help="Number of years to look back for papers and patents.",
     )
+    parser.add_argument(
+        "--max-workers",
+        type=int,
+        default=4,
+        help="Number of (query, source) searches to run concurrently (1 = sequential).",
+    )
+    parser.add_argument(
+        "--eval-workers",
+        type=int,
+        default=4,
+        help="Number of technologies to evaluate concurrently (1 = sequential).",
+    )
+    parser.add_argument(
+        "--eval-mode",
+        type=str,
+        default="split",
+        choices=EVALUATION_MODES,
+        help="split: one prompt per evaluation section; fused: one prompt per "
+             "technology, re-running only sections that fail to parse.",
+    )
+    parser.add_argument(
+        "--batch-api",
+        action="store_true",
+        help="Submit evaluation prompts through the provider's batch API "
+             "(cheaper, but results may take hours).",
+    )
+    parser.add_argument(
+        "--pack-fit",
+        action="store_true",
+        help="Score strategic fit for several technologies per prompt "
+             "(sized to the model's context and response limits).",
+    )
+    parser.add_argument(
+        "--re-evaluate",
+        action="store_true",
+        help="Evaluate every technology again instead of reusing stored "
+             "evaluations of unchanged technologies.",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Disable the on-disk search response cache.",
+    )
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Ignore cached search responses and refetch (fresh responses are still cached).",
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Only fetch records published since the previous run in the output directory "
+             "and merge them into its results.",
+    )
+    parser.add_argument(
+        "--no-corpus",
+        action="store_true",
+        help="Do not write records to (or read evidence from) the local corpus store.",
+    )
+    parser.add_argument(
+        "--map-reduce",
+        action="store_true",
+        help="Run discovery over the whole collected corpus in prompt-sized shards "
+             "and merge the results, instead of one call over the top-ranked records.",
+    )
+    parser.add_argument(
+        "--shard-concurrency",
+        type=int,
+        default=4,
+        help="Discovery shards processed concurrently in --map-reduce mode.",
+    )
+    parser.add_argument(
+        "--llm-cache",
+        type=str,
+        default=DEFAULT_POLICY,
+        choices=LLM_CACHE_POLICIES,
+        help="Reuse LLM responses for identical prompts: always, deterministic "
+             "(temperature 0 only) or off (default: TECHSCOUT_LLM_CACHE or off).",
+    )
     
     # Organization context
     parser.add_argument(
@@ -197,6 +284,19 @@ def load_config(args):
         "skip_report": args.skip_report,
         "num_reflections": args.num_reflections,
         "year_lookback": args.year_lookback,
+        "max_workers": args.max_workers,
+        "eval_workers": args.eval_workers,
+        "eval_mode": args.eval_mode,
+        "use_batch_api": args.batch_api,
+        "reuse_evaluations": not args.re_evaluate,
+        "pack_strategic_fit": args.pack_fit,
+        "use_cache": not args.no_cache,
+        "refresh_cache": args.refresh,
+        "incremental": args.incremental,
+        "use_corpus": not args.no_corpus,
+        "map_reduce": args.map_reduce,
+        "shard_concurrency": args.shard_concurrency,
+        "llm_cache": args.llm_cache,
         "organization_context": None,
     }
     
@@ -220,6 +320,7 @@ def load_config(args):
             config["domain"] = prompt_config.get("domain", config["domain"])
             config["focus_areas"] = prompt_config.get("focus_areas", config["focus_areas"])
             config["system_prompt"] = prompt_config.get("system", None)
+            config["rate_limits"] = prompt_config.get("rate_limits")
         
         # Load seed_queries.json
         queries_file = osp.join(template_dir, "seed_queries.json")
@@ -285,6 +386,13 @@ def run_scouting_pipeline(config, client, model):
     output_dir = config["output_dir"]
     os.makedirs(output_dir, exist_ok=True)
     
+    # Apply per-host search budgets from the template or config file
+    configure_rate_limits(config.get("rate_limits"))
+    
+    llm_cache = configure_llm_cache(
+        default_llm_cache_dir(output_dir), policy=config.get("llm_cache", DEFAULT_POLICY)
+    )
+    
     print("\n" + "="*60)
     print("PHASE 1: TECHNOLOGY DISCOVERY")
     print("="*60)
@@ -321,6 +429,13 @@ def run_scouting_pipeline(config, client, model):
         skip_search=config.get("skip_search", False),
         num_reflections=config.get("num_reflections", 3),
         year_lookback=config.get("year_lookback", 3),
+        max_workers=config.get("max_workers", 4),
+        use_cache=config.get("use_cache", True),
+        refresh_cache=config.get("refresh_cache", False),
+        incremental=config.get("incremental", False),
+        use_corpus=config.get("use_corpus", True),
+        map_reduce=config.get("map_reduce", False),
+        shard_concurrency=config.get("shard_concurrency", 4),
     )
     
     technologies = scouting_results.get("technologies", [])
@@ -340,9 +455,19 @@ def run_scouting_pipeline(config, client, model):
             model=model,
             technologies=technologies,
             organization_context=config.get("organization_context"),
+            max_workers=config.get("eval_workers", 4),
+            mode=config.get("eval_mode", "split"),
+            use_batch_api=config.get("use_batch_api", False),
+            reuse_evaluations=config.get("reuse_evaluations", True),
+            pack_strategic_fit=config.get("pack_strategic_fit", False),
+            progress_callback=lambda done, total, tech, _: print(
+                f"  [{done}/{total}] Evaluated {tech.get('name', 'Unknown')}"
+            ),
         )
         evaluations = evaluation_results.get("individual_evaluations", [])
-        print(f"\nCompleted evaluation of {len(evaluations)} technologies")
+        reuse = evaluation_results["evaluation_reuse"]
+        print(f"\nCompleted evaluation of {len(evaluations)} technologies "
+              f"({reuse['evaluated']} evaluated, {reuse['reused']} reused)")
     
     # Phase 3: Report Generation
     if not config.get("skip_report", False):
@@ -351,14 +476,23 @@ def run_scouting_pipeline(config, client, model):
         print("="*60)
         print_time()
         
-        report_path = generate_scouting_report(
-            base_dir=output_dir,
-            client=client,
-            model=model,
-            scouting_results=scouting_results,
-            evaluations=evaluations,
-            output_format=config.get("report_format", "markdown"),
-        )
+        corpus = None
+        if config.get("use_corpus", True):
+            corpus = open_corpus(default_corpus_path(output_dir), create=False)
+        
+        try:
+            report_path = generate_scouting_report(
+                base_dir=output_dir,
+                client=client,
+                model=model,
+                scouting_results=scouting_results,
+                evaluations=evaluations,
+                output_format=config.get("report_format", "markdown"),
+                corpus=corpus,
+            )
+        finally:
+            if corpus is not None:
+                corpus.close()
         print(f"\nReport generated: {report_path}")
     
     # Summary
@@ -368,6 +502,9 @@ def run_scouting_pipeline(config, client, model):
     print_time()
     print(f"\nResults saved to: {output_dir}")
     print(f"Technologies discovered: {len(technologies)}")
+    if llm_cache is not None:
+        stats = llm_cache.get_stats()
+        print(f"LLM response cache ({stats['policy']}): {stats['hits']} hits, {stats['misses']} misses")
     
     if technologies:
         print("\nTop 5 Technologies by Strategic Relevance:")
@@ -21,6 +21,9 @@ from tech_scout.llm import create_client, AVAILABLE_LLMS
 from tech_scout.scout_technologies import scout_technologies, generate_search_queries
 from tech_scout.evaluate_technologies import batch_evaluate_technologies
 from tech_scout.generate_report import generate_scouting_report
+from tech_scout.corpus_store import default_corpus_path, open_corpus
+from tech_scout.llm_cache import DEFAULT_POLICY, LLM_CACHE_POLICIES, configure_llm_cache, default_llm_cache_dir
+from tech_scout.rate_limit import configure_rate_limits
 
 # Page Config
 st.set_page_config(
@@ -379,8 +382,23 @@ if 'pending_question' not in st.session_state:
     st.session_state.pending_question = None
 
 # === DEEP DIVE HELPER FUNCTIONS ===
-def get_technology_context(tech_name, scouting_results):
-    """Extract relevant context for a specific technology from scouting results."""
+@st.cache_resource
+def _open_corpus_store(path):
+    return open_corpus(path)
+
+def get_corpus(output_dir):
+    """Return the local corpus store for a results directory (None if there is none yet)."""
+    path = default_corpus_path(output_dir)
+    return _open_corpus_store(path) if os.path.exists(path) else None
+
+def get_technology_context(tech_name, scouting_results, corpus=None):
+    """
+    Extract relevant context for a specific technology from scouting results.
+    
+    With a corpus store, related records are pulled by full-text match over
+    everything collected so far; otherwise the run's raw data is scanned for
+    keyword matches.
+    """
     context = {
         "technology": None,
         "related_papers": [],
@@ -395,6 +413,15 @@ def get_technology_context(tech_name, scouting_results):
             context["technology"] = tech
             break
     
+    # Pull evidence from the corpus store when available
+    if corpus is not None and corpus.count() > 0:
+        evidence = corpus.evidence_for(context["technology"] or {"name": tech_name})
+        context["related_papers"] = evidence["papers"]
+        context["related_patents"] = evidence["patents"]
+        context["related_news"] = evidence["news"]
+        context["trend_insights"] = scouting_results.get("trend_insights", {})
+        return context
+    
     # Get raw data references
     raw_data = scouting_results.get("raw_data", {})
     tech_keywords = tech_name.lower().replace("_", " ").split()
@@ -611,6 +638,11 @@ with st.sidebar:
     # Model Selection
     selected_model = st.selectbox("🤖 AI Model", AVAILABLE_LLMS, index=AVAILABLE_LLMS.index("gpt-4o") if "gpt-4o" in AVAILABLE_LLMS else 0, help="Select the language model for analysis")
     
+    # Search Parallelism
+    max_workers = st.slider("⚡ Parallel Searches", min_value=1, max_value=16, value=4, help="Number of (query, source) searches to run concurrently")
+    eval_workers = st.slider("🔬 Parallel Evaluations", min_value=1, max_value=16, value=4, help="Number of technologies to evaluate concurrently")
+    fused_evaluation = st.checkbox("🧬 Fused Evaluation", value=False, help="Assess maturity, strategic fit and competitive landscape in one prompt per technology (fewer calls and tokens)")
+    
     st.markdown("---")
     
     # API Status with custom styling
@@ -641,6 +673,10 @@ with st.sidebar:
     st.markdown('<p style="font-size: 0.75rem; text-transform: uppercase; letter-spacing: 0.1em; color: #667eea !important; font-weight: 600; margin-bottom: 12px;">Output</p>', unsafe_allow_html=True)
     output_dir = st.text_input("📁 Results Directory", "./scouting_results")
     os.makedirs(output_dir, exist_ok=True)
+    incremental = st.checkbox("🔁 Incremental Refresh", value=False, help="Only fetch records published since the last run in this directory and merge them into its results")
+    map_reduce = st.checkbox("🧩 Map-Reduce Discovery", value=False, help="Analyze the whole collected corpus in parallel shards instead of only the top-ranked records")
+    llm_cache_policy = st.selectbox("🧠 LLM Response Cache", LLM_CACHE_POLICIES, index=LLM_CACHE_POLICIES.index(DEFAULT_POLICY) if DEFAULT_POLICY in LLM_CACHE_POLICIES else LLM_CACHE_POLICIES.index("off"), help="Reuse responses for identical prompts: always, deterministic (temperature 0 only) or off")
+    configure_llm_cache(default_llm_cache_dir(output_dir), policy=llm_cache_policy)
     
     # Footer
     st.markdown("---")
@@ -664,6 +700,7 @@ def load_template_config(template_name):
             p = json.load(f)
             config["domain"] = p.get("domain", "")
             config["focus_areas"] = p.get("focus_areas", [])
+            config["rate_limits"] = p.get("rate_limits")
             
     return config
 
@@ -727,6 +764,7 @@ with tab1:
                     with st.spinner(f"🔍 Scanning for {domain} technologies..."):
                         # Initialize Client
                         client, model_name = create_client(selected_model)
+                        configure_rate_limits(template_config.get("rate_limits"))
                         
                         # Generate search queries first
                         st.info("🧠 Generating intelligent search queries...")
@@ -752,7 +790,10 @@ with tab1:
                             search_queries=search_queries,
                             skip_search=False,
                             num_reflections=2,
-                            year_lookback=2  # Search 2024-2026 (last 2 years)
+                            year_lookback=2,  # Search 2024-2026 (last 2 years)
+                            max_workers=max_workers,
+                            incremental=incremental,
+                            map_reduce=map_reduce,
                         )
                         
                         st.session_state.scouting_results = results
@@ -879,7 +920,8 @@ with tab1:
                                 # Get technology context
                                 tech_context = get_technology_context(
                                     selected_tech.get("name", ""),
-                                    st.session_state.scouting_results
+                                    st.session_state.scouting_results,
+                                    corpus=get_corpus(output_dir)
                                 )
                                 
                                 # Generate response
@@ -974,16 +1016,25 @@ with tab2:
                         
                         client, model_name = create_client(selected_model)
                         
+                        eval_progress = st.progress(0.0, text="Evaluating technologies...")
+                        
+                        def on_evaluated(done, total, tech, _):
+                            eval_progress.progress(done / total, text=f"Evaluated {done}/{total}: {tech.get('name', 'Unknown')}")
+                        
                         eval_results = batch_evaluate_technologies(
                             base_dir=output_dir,
                             client=client,
                             model=selected_model,
                             technologies=techs_to_eval,
-                            organization_context=None
+                            organization_context=None,
+                            max_workers=eval_workers,
+                            mode="fused" if fused_evaluation else "split",
+                            progress_callback=on_evaluated,
                         )
                         
                         st.session_state.evaluations = eval_results.get("individual_evaluations", [])
-                        st.success("✅ Evaluation Complete!")
+                        reuse = eval_results["evaluation_reuse"]
+                        st.success(f"✅ Evaluation Complete! ({reuse['evaluated']} evaluated, {reuse['reused']} reused)")
                         
                     except Exception as e:
                         st.error(f"❌ Evaluation failed: {str(e)}")
@@ -1139,7 +1190,8 @@ with tab3:
                         model=selected_model,
                         scouting_results=st.session_state.scouting_results,
                         evaluations=st.session_state.evaluations,
-                        output_format="markdown"
+                        output_format="markdown",
+                        corpus=get_corpus(output_dir)
                     )
                     
                     # Auto-archive if enabled
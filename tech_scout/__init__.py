@@ -11,11 +11,13 @@ This module provides tools for automated technology scouting, including:
 from tech_scout.llm import (
     create_client,
     get_response_from_llm,
+    aget_response_from_llm,
     extract_json_between_markers,
     AVAILABLE_LLMS,
 )
 from tech_scout.scout_technologies import (
     scout_technologies,
+    ascout_technologies,
     search_papers,
     search_patents,
     search_news,
@@ -26,6 +28,7 @@ from tech_scout.evaluate_technologies import (
     assess_maturity,
     analyze_competitive_landscape,
     batch_evaluate_technologies,
+    evaluate_for_organizations,
 )
 from tech_scout.generate_report import (
     generate_scouting_report,
@@ -38,10 +41,12 @@ __all__ = [
     # LLM utilities
     "create_client",
     "get_response_from_llm",
+    "aget_response_from_llm",
     "extract_json_between_markers",
     "AVAILABLE_LLMS",
     # Scouting
     "scout_technologies",
+    "ascout_technologies",
     "search_papers",
     "search_patents", 
     "search_news",
@@ -51,6 +56,7 @@ __all__ = [
     "assess_maturity",
     "analyze_competitive_landscape",
     "batch_evaluate_technologies",
+    "evaluate_for_organizations",
     # Reporting
     "generate_scouting_report",
     "generate_executive_summary",
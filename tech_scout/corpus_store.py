@@ -0,0 +1,439 @@
+"""
+Corpus Store Module
+
+This module provides a persistent, SQLite-backed store for every paper,
+patent and news record collected by the scout, so evidence is shared across
+runs and templates instead of living only inside each run's
+scouting_results.json.
+
+Each record is stored once per identity (DOI, patent number, URL or
+normalized title) together with its content hash, first-seen and last-seen
+timestamps, and the (query, source, domain) hits that returned it. Titles,
+abstracts and author/assignee names are indexed with SQLite FTS5, so
+discovery, deep dive and reporting can pull evidence by full-text match
+without re-searching the remote APIs.
+
+Writes are batched (one transaction per ``batch_size`` records) and the
+full-text index is only rewritten when a record's content changes, so the
+store stays fast at millions of rows.
+"""
+
+import hashlib
+import json
+import os
+import os.path as osp
+import re
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Sequence
+
+from tech_scout.dedup import normalize_title, record_keys
+from tech_scout.ranking import STOPWORDS, record_year
+
+CORPUS_FILENAME = "corpus.sqlite"
+
+# Records written per transaction
+DEFAULT_BATCH_SIZE = 1000
+
+# BM25 column weights for (title, body, names)
+FTS_WEIGHTS = (3.0, 1.0, 0.5)
+
+# Records of each kind returned by evidence_for()
+EVIDENCE_LIMITS = {"papers": 20, "patents": 20, "news": 15}
+
+_WORD = re.compile(r"\w+", re.UNICODE)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS records (
+    id INTEGER PRIMARY KEY,
+    kind TEXT NOT NULL,
+    record_key TEXT NOT NULL UNIQUE,
+    content_hash TEXT NOT NULL,
+    title TEXT,
+    body TEXT,
+    names TEXT,
+    year INTEGER,
+    data TEXT NOT NULL,
+    first_seen REAL NOT NULL,
+    last_seen REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_records_kind_last_seen ON records (kind, last_seen);
+
+CREATE TABLE IF NOT EXISTS provenance (
+    record_key TEXT NOT NULL,
+    query TEXT NOT NULL,
+    source TEXT NOT NULL,
+    domain TEXT NOT NULL,
+    first_seen REAL NOT NULL,
+    last_seen REAL NOT NULL,
+    PRIMARY KEY (record_key, query, source, domain)
+) WITHOUT ROWID;
+
+CREATE VIRTUAL TABLE IF NOT EXISTS records_fts USING fts5(
+    title, body, names,
+    content='records', content_rowid='id',
+    tokenize='unicode61 remove_diacritics 2'
+);
+
+CREATE TRIGGER IF NOT EXISTS records_ai AFTER INSERT ON records BEGIN
+    INSERT INTO records_fts (rowid, title, body, names)
+    VALUES (new.id, new.title, new.body, new.names);
+END;
+CREATE TRIGGER IF NOT EXISTS records_ad AFTER DELETE ON records BEGIN
+    INSERT INTO records_fts (records_fts, rowid, title, body, names)
+    VALUES ('delete', old.id, old.title, old.body, old.names);
+END;
+CREATE TRIGGER IF NOT EXISTS records_au AFTER UPDATE ON records
+WHEN old.content_hash != new.content_hash BEGIN
+    INSERT INTO records_fts (records_fts, rowid, title, body, names)
+    VALUES ('delete', old.id, old.title, old.body, old.names);
+    INSERT INTO records_fts (rowid, title, body, names)
+    VALUES (new.id, new.title, new.body, new.names);
+END;
+"""
+
+# Only last_seen changes when an unchanged record is seen again; the FTS
+# update trigger fires on content_hash changes only
+_UPSERT_RECORD = """
+INSERT INTO records
+    (kind, record_key, content_hash, title, body, names, year, data, first_seen, last_seen)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (record_key) DO UPDATE SET
+    content_hash = excluded.content_hash,
+    title = excluded.title,
+    body = excluded.body,
+    names = excluded.names,
+    year = excluded.year,
+    data = excluded.data,
+    last_seen = excluded.last_seen
+"""
+
+_UPSERT_PROVENANCE = """
+INSERT INTO provenance (record_key, query, source, domain, first_seen, last_seen)
+VALUES (?, ?, ?, ?, ?, ?)
+ON CONFLICT (record_key, query, source, domain) DO UPDATE SET last_seen = excluded.last_seen
+"""
+
+
+def default_corpus_path(base_dir: str) -> str:
+    """Corpus location: TECHSCOUT_CORPUS_PATH if set, else <base_dir>/corpus.sqlite."""
+    return os.getenv("TECHSCOUT_CORPUS_PATH") or osp.join(base_dir, CORPUS_FILENAME)
+
+
+def corpus_record_key(record: Dict, kind: str) -> str:
+    """
+    Stable identity of a record within the store.
+
+    Uses the strongest key from dedup.record_keys() (DOI, patent number,
+    URL), then the normalized title, then the content hash.
+    """
+    keys = record_keys(record, kind)
+    if keys:
+        return f"{kind}:{keys[0]}"
+    title = normalize_title(record.get("title") or "")
+    if title:
+        return f"{kind}:title:{title}"
+    return f"{kind}:hash:{content_hash(record)}"
+
+
+def _encode(record: Dict) -> str:
+    fields = {k: v for k, v in record.items() if k != "provenance"}
+    return json.dumps(fields, sort_keys=True, ensure_ascii=False, default=str)
+
+
+def content_hash(record: Dict) -> str:
+    """SHA-256 of a record's fields (provenance excluded), independent of key order."""
+    return hashlib.sha256(_encode(record).encode("utf-8")).hexdigest()
+
+
+def _names(record: Dict) -> str:
+    """Authors, assignees, inventors, venue and source as one searchable string."""
+    parts = []
+    for field in ("authors", "assignees", "inventors", "venue", "source"):
+        value = record.get(field)
+        for item in value if isinstance(value, list) else [value]:
+            if isinstance(item, dict):
+                item = item.get("name") or item.get("extracted_name") or ""
+                if isinstance(item, dict):
+                    item = item.get("value", "")
+            if item:
+                parts.append(str(item))
+    return " ".join(parts)
+
+
+def match_expression(text: str) -> str:
+    """
+    Turn free text into a safe FTS5 query: each word is quoted (so operators
+    and punctuation in titles cannot break the syntax) and words are OR-ed,
+    leaving BM25 to rank records that match more of them higher.
+    """
+    words = []
+    for word in _WORD.findall(text.lower()):
+        if word not in STOPWORDS and word not in words:
+            words.append(word)
+    return " OR ".join(f'"{word}"' for word in words)
+
+
+class CorpusStore:
+    """
+    Persistent record store with full-text search.
+
+    Safe to share across threads; SQLite's WAL mode lets several processes
+    (e.g. a CLI run and the Streamlit app) use the same file.
+    """
+
+    def __init__(self, path: str, batch_size: int = DEFAULT_BATCH_SIZE):
+        directory = osp.dirname(osp.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self.path = path
+        self.batch_size = batch_size
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._conn.commit()
+
+    def add_records(
+        self,
+        records: Iterable[Dict],
+        kind: str,
+        query: Optional[str] = None,
+        source: Optional[str] = None,
+        domain: str = "",
+    ) -> int:
+        """
+        Insert or refresh records in batches.
+
+        New records are inserted with first_seen = last_seen = now. Records
+        already in the store get last_seen = now, and their fields and
+        full-text entry are replaced only if the content hash changed.
+
+        Args:
+            records: Normalized records of one kind; a "provenance" list of
+                {"query", "source"} hits (as produced by RecordIndex) is stored
+                alongside
+            kind: "papers", "patents" or "news"
+            query: Query recorded as provenance for records without one
+            source: Source recorded as provenance for records without one
+            domain: Scouting domain recorded with every provenance hit
+
+        Returns:
+            Number of records that were not in the store before
+        """
+        added = 0
+        batch: List[Dict] = []
+        for record in records:
+            batch.append(record)
+            if len(batch) >= self.batch_size:
+                added += self._write_batch(batch, kind, query, source, domain)
+                batch = []
+        if batch:
+            added += self._write_batch(batch, kind, query, source, domain)
+        return added
+
+    def _write_batch(
+        self,
+        batch: List[Dict],
+        kind: str,
+        query: Optional[str],
+        source: Optional[str],
+        domain: str,
+    ) -> int:
+        now = time.time()
+        rows = []
+        hits = []
+        for record in batch:
+            key = corpus_record_key(record, kind)
+            data = _encode(record)
+            rows.append((
+                kind,
+                key,
+                hashlib.sha256(data.encode("utf-8")).hexdigest(),
+                record.get("title") or "",
+                record.get("abstract") or record.get("description") or "",
+                _names(record),
+                record_year(record),
+                data,
+                now,
+                now,
+            ))
+            provenance = record.get("provenance") or [
+                {"query": query, "source": source or record.get("source") or kind}
+            ]
+            for hit in provenance:
+                hits.append((key, hit.get("query") or "", hit.get("source") or "", domain, now, now))
+
+        keys = list({row[1] for row in rows})
+        with self._lock:
+            existing = self._conn.execute(
+                f"SELECT COUNT(*) FROM records WHERE record_key IN ({','.join('?' * len(keys))})",
+                keys,
+            ).fetchone()[0]
+            with self._conn:
+                self._conn.executemany(_UPSERT_RECORD, rows)
+                self._conn.executemany(_UPSERT_PROVENANCE, hits)
+        return len(keys) - existing
+
+    def search(
+        self,
+        text: str,
+        kinds: Optional[Sequence[str]] = None,
+        limit: int = 50,
+        domain: Optional[str] = None,
+        min_year: Optional[int] = None,
+        seen_since: Optional[datetime] = None,
+        raw: bool = False,
+    ) -> List[Dict]:
+        """
+        Full-text search over titles, abstracts and names, best match first.
+
+        Args:
+            text: Free text (words are OR-ed and ranked by BM25), or an FTS5
+                query when ``raw`` is True
+            kinds: Restrict to these record kinds
+            limit: Maximum number of records
+            domain: Only records returned by a search for this domain
+            min_year: Only records published in or after this year
+            seen_since: Only records (re)seen at or after this time
+            raw: Pass ``text`` to FTS5 unchanged
+
+        Returns:
+            Stored records, each with "provenance", "first_seen" and
+            "last_seen" (ISO timestamps) and its BM25 "score" (lower is better)
+        """
+        expression = text if raw else match_expression(text)
+        if not expression:
+            return []
+
+        weights = ", ".join(str(w) for w in FTS_WEIGHTS)
+        sql = [
+            f"SELECT r.record_key, r.data, r.first_seen, r.last_seen, bm25(records_fts, {weights}) AS score",
+            "FROM records_fts JOIN records r ON r.id = records_fts.rowid",
+            "WHERE records_fts MATCH ?",
+        ]
+        params: List = [expression]
+        if kinds:
+            sql.append(f"AND r.kind IN ({','.join('?' * len(kinds))})")
+            params.extend(kinds)
+        if min_year is not None:
+            sql.append("AND r.year >= ?")
+            params.append(min_year)
+        if seen_since is not None:
+            sql.append("AND r.last_seen >= ?")
+            params.append(seen_since.timestamp())
+        if domain is not None:
+            sql.append("AND r.record_key IN (SELECT record_key FROM provenance WHERE domain = ?)")
+            params.append(domain)
+        sql.append("ORDER BY score LIMIT ?")
+        params.append(limit)
+
+        with self._lock:
+            rows = self._conn.execute("\n".join(sql), params).fetchall()
+            provenance = self._provenance([row[0] for row in rows])
+
+        results = []
+        for key, data, first_seen, last_seen, score in rows:
+            record = json.loads(data)
+            record["provenance"] = provenance.get(key, [])
+            record["first_seen"] = datetime.fromtimestamp(first_seen).isoformat()
+            record["last_seen"] = datetime.fromtimestamp(last_seen).isoformat()
+            record["score"] = score
+            results.append(record)
+        return results
+
+    def _provenance(self, keys: List[str]) -> Dict[str, List[Dict]]:
+        provenance: Dict[str, List[Dict]] = {}
+        if not keys:
+            return provenance
+        rows = self._conn.execute(
+            "SELECT record_key, query, source, domain FROM provenance "
+            f"WHERE record_key IN ({','.join('?' * len(keys))}) ORDER BY first_seen",
+            keys,
+        ).fetchall()
+        for key, query, source, domain in rows:
+            provenance.setdefault(key, []).append(
+                {"query": query, "source": source, "domain": domain}
+            )
+        return provenance
+
+    def evidence_for(
+        self,
+        technology: Dict,
+        limits: Optional[Dict[str, int]] = None,
+        domain: Optional[str] = None,
+    ) -> Dict[str, List[Dict]]:
+        """
+        Pull the best-matching papers, patents and news for a technology.
+
+        Matches on the technology's title, name and key capabilities.
+
+        Args:
+            technology: Technology dict from scout_technologies
+            limits: Records per kind (defaults to EVIDENCE_LIMITS)
+            domain: Only records returned by a search for this domain
+
+        Returns:
+            Dict mapping each kind to its records, best match first
+        """
+        text = " ".join([
+            technology.get("title") or "",
+            (technology.get("name") or "").replace("_", " "),
+            " ".join(technology.get("key_capabilities") or []),
+        ])
+        return {
+            kind: self.search(text, kinds=[kind], limit=limit, domain=domain)
+            for kind, limit in (limits or EVIDENCE_LIMITS).items()
+        }
+
+    def count(self, kind: Optional[str] = None) -> int:
+        """Number of stored records, optionally of one kind."""
+        with self._lock:
+            if kind is None:
+                return self._conn.execute("SELECT COUNT(*) FROM records").fetchone()[0]
+            return self._conn.execute(
+                "SELECT COUNT(*) FROM records WHERE kind = ?", (kind,)
+            ).fetchone()[0]
+
+    def get_stats(self) -> Dict:
+        """Return record counts per kind and the number of provenance hits."""
+        with self._lock:
+            kinds = dict(self._conn.execute(
+                "SELECT kind, COUNT(*) FROM records GROUP BY kind"
+            ).fetchall())
+            hits = self._conn.execute("SELECT COUNT(*) FROM provenance").fetchone()[0]
+        return {"records": kinds, "provenance": hits}
+
+    def optimize(self):
+        """Merge the full-text index segments (worth running after large imports)."""
+        with self._lock:
+            self._conn.execute("INSERT INTO records_fts (records_fts) VALUES ('optimize')")
+            self._conn.commit()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def __enter__(self) -> "CorpusStore":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def open_corpus(path: str, create: bool = True) -> Optional[CorpusStore]:
+    """
+    Open the corpus store at ``path``.
+
+    Args:
+        path: Database file
+        create: If False, return None instead of creating a missing store
+
+    Returns:
+        The store, or None
+    """
+    if not create and not osp.exists(path):
+        return None
+    return CorpusStore(path)
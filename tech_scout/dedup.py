@@ -0,0 +1,308 @@
+"""
+Record Deduplication Module
+
+This module provides an incremental deduplication index for collected
+papers, patents and news. Records are matched on strong identifiers (DOI,
+patent number, arXiv ID, URL) and, failing those, on near-duplicate
+normalized titles using word shingles with MinHash/LSH candidate lookup, so
+adding a record stays roughly constant-time at tens of thousands of records.
+Records whose strong identifiers disagree are never merged on title alone.
+
+Duplicates are merged into the first-ranked copy and every hit is kept as
+provenance (which queries and sources returned the record).
+"""
+
+import hashlib
+import re
+import struct
+import unicodedata
+from typing import Dict, Iterable, List, Optional, Tuple
+from urllib.parse import urlparse, parse_qsl, urlencode
+
+# MinHash signature size and LSH banding (BANDS * ROWS == NUM_PERM)
+NUM_PERM = 16
+BANDS = 8
+ROWS = 2
+
+# Minimum shingle Jaccard similarity for two titles to count as duplicates
+TITLE_SIMILARITY_THRESHOLD = 0.8
+
+_UNPACK_SIGNATURE = struct.Struct(f"<{NUM_PERM}I").unpack
+
+_NON_WORD = re.compile(r"[^\w\s]+", re.UNICODE)
+_CJK = re.compile(r"[\u3040-\u30ff\u3400-\u4dbf\u4e00-\u9fff\uac00-\ud7af]")
+_TRACKING_PARAMS = {"fbclid", "gclid", "oc"}
+_ARXIV_URL = re.compile(r"arxiv\.org/(?:abs|pdf)/([^?#]+?)(?:v\d+)?(?:\.pdf)?$", re.IGNORECASE)
+
+# Key types that identify exactly one work; differing values mean different records
+STRONG_KEY_TYPES = ("doi", "patent", "arxiv")
+
+
+def normalize_title(title: str) -> str:
+    """Lowercase, NFKC-normalize and strip punctuation and extra whitespace."""
+    title = unicodedata.normalize("NFKC", title or "").lower()
+    return " ".join(_NON_WORD.sub(" ", title).split())
+
+
+def normalize_doi(doi: str) -> str:
+    """Strip resolver prefixes and lowercase a DOI."""
+    doi = (doi or "").strip().lower()
+    for prefix in ("https://doi.org/", "http://doi.org/", "https://dx.doi.org/",
+                   "http://dx.doi.org/", "doi:"):
+        if doi.startswith(prefix):
+            doi = doi[len(prefix):]
+    return doi if doi.startswith("10.") else ""
+
+
+def normalize_patent_number(number: str) -> str:
+    """Uppercase a patent number and drop separators ("US 2023/0123" -> "US20230123")."""
+    return re.sub(r"[^0-9A-Z]", "", (number or "").upper())
+
+
+def normalize_url(url: str) -> str:
+    """Lowercase scheme and host, drop fragments, tracking params and trailing slashes."""
+    url = (url or "").strip()
+    if not url:
+        return ""
+    parsed = urlparse(url)
+    query = [
+        (k, v) for k, v in parse_qsl(parsed.query, keep_blank_values=True)
+        if not k.lower().startswith("utm_") and k.lower() not in _TRACKING_PARAMS
+    ]
+    return (f"{(parsed.hostname or '').lower()}{parsed.path.rstrip('/')}"
+            f"{'?' + urlencode(sorted(query)) if query else ''}")
+
+
+def title_shingles(normalized_title: str) -> frozenset:
+    """
+    Shingle a normalized title: word bigrams for space-delimited text and
+    character trigrams for CJK text.
+    """
+    if _CJK.search(normalized_title):
+        text = normalized_title.replace(" ", "")
+        if len(text) < 3:
+            return frozenset([text]) if text else frozenset()
+        return frozenset(text[i:i + 3] for i in range(len(text) - 2))
+    words = normalized_title.split()
+    if len(words) < 2:
+        return frozenset(words)
+    return frozenset(f"{a} {b}" for a, b in zip(words, words[1:]))
+
+
+def _minhash_bands(shingles: frozenset) -> List[Tuple]:
+    # One 64-byte BLAKE2b digest per shingle yields NUM_PERM independent
+    # 32-bit hashes; the column-wise minimum is the MinHash signature.
+    rows = [
+        _UNPACK_SIGNATURE(hashlib.blake2b(s.encode("utf-8"), digest_size=4 * NUM_PERM).digest())
+        for s in shingles
+    ]
+    signature = [min(column) for column in zip(*rows)]
+    return [(band, tuple(signature[band * ROWS:(band + 1) * ROWS])) for band in range(BANDS)]
+
+
+def _jaccard(a: frozenset, b: frozenset) -> float:
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+def record_keys(record: Dict, kind: str) -> List[str]:
+    """Return the strong identity keys of a record (DOI, patent number, arXiv ID, URL)."""
+    keys = []
+    if kind == "papers":
+        doi = normalize_doi(record.get("doi") or "")
+        if doi:
+            keys.append(f"doi:{doi}")
+    elif kind == "patents":
+        number = normalize_patent_number(record.get("patent_number") or "")
+        if number:
+            keys.append(f"patent:{number}")
+    url = normalize_url(record.get("url") or "")
+    if url:
+        keys.append(f"url:{url}")
+    if kind == "papers":
+        arxiv = _ARXIV_URL.search((record.get("url") or "").strip())
+        if arxiv:
+            keys.append(f"arxiv:{arxiv.group(1).lower()}")
+    return keys
+
+
+def _strong_keys(keys: Iterable[str]) -> Dict[str, set]:
+    """Group the DOI, patent number and arXiv keys among ``keys`` by type."""
+    grouped: Dict[str, set] = {}
+    for key in keys:
+        key_type = key.partition(":")[0]
+        if key_type in STRONG_KEY_TYPES:
+            grouped.setdefault(key_type, set()).add(key)
+    return grouped
+
+
+def _conflicting(a: Dict[str, set], b: Dict[str, set]) -> bool:
+    """Whether two records carry different identifiers of the same strong type."""
+    return any(key_type in b and not (values & b[key_type]) for key_type, values in a.items())
+
+
+class _Entry:
+    __slots__ = ("record", "order", "provenance", "shingles", "strong_keys")
+
+    def __init__(self, record: Dict, order: Tuple, shingles: frozenset):
+        self.record = record
+        self.order = order
+        self.provenance: Dict[Tuple, Tuple[str, str]] = {}
+        self.shingles = shingles
+        self.strong_keys: Dict[str, set] = {}
+
+
+class RecordIndex:
+    """
+    Incremental deduplication index for one record kind.
+
+    Records can be added in any order; ``records()`` returns unique records
+    sorted by the ``order`` key of their earliest hit, so the output is
+    deterministic even when results arrive concurrently.
+    """
+
+    def __init__(self, kind: str, title_threshold: float = TITLE_SIMILARITY_THRESHOLD):
+        self.kind = kind
+        self.title_threshold = title_threshold
+        self.total_hits = 0
+        self._entries: List[_Entry] = []
+        self._keys: Dict[str, int] = {}
+        self._buckets: Dict[Tuple, List[int]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _signature(self, record: Dict) -> Tuple[List[str], str, frozenset, List[Tuple]]:
+        normalized = normalize_title(record.get("title") or "")
+        title_key = f"title:{normalized}" if normalized else ""
+        shingles = title_shingles(normalized)
+        bands = _minhash_bands(shingles) if len(shingles) >= 2 else []
+        return record_keys(record, self.kind), title_key, shingles, bands
+
+    def _find(
+        self, keys: List[str], title_key: str, shingles: frozenset, bands: List[Tuple]
+    ) -> Optional[int]:
+        for key in keys:
+            if key in self._keys:
+                return self._keys[key]
+
+        # Title matches only merge records whose strong identifiers agree, so
+        # two patents or papers that share a generic title stay separate
+        strong = _strong_keys(keys)
+        if title_key in self._keys:
+            entry_id = self._keys[title_key]
+            if not _conflicting(strong, self._entries[entry_id].strong_keys):
+                return entry_id
+
+        seen = set()
+        for band in bands:
+            for entry_id in self._buckets.get(band, ()):
+                if entry_id in seen:
+                    continue
+                seen.add(entry_id)
+                entry = self._entries[entry_id]
+                if (_jaccard(shingles, entry.shingles) >= self.title_threshold
+                        and not _conflicting(strong, entry.strong_keys)):
+                    return entry_id
+        return None
+
+    def add(
+        self,
+        record: Dict,
+        query: Optional[str] = None,
+        source: Optional[str] = None,
+        order: Tuple = (),
+    ) -> Dict:
+        """
+        Add a record, merging it into an existing duplicate if there is one.
+
+        Args:
+            record: Normalized paper, patent or news dict
+            query: Search query that returned the record
+            source: Provider that returned it (defaults to the record's
+                "source" for papers and patents, or the record kind for news)
+            order: Sort key of this hit, e.g. (query_index, source_index, position);
+                the lowest order among duplicates decides output position
+
+        Returns:
+            The canonical (merged) record
+        """
+        self.total_hits += 1
+        if source is None:
+            source = record.get("source") if self.kind != "news" else self.kind
+        source = source or self.kind
+
+        keys, title_key, shingles, bands = self._signature(record)
+        entry_id = self._find(keys, title_key, shingles, bands)
+        if entry_id is None:
+            entry_id = len(self._entries)
+            entry = _Entry(dict(record), order, shingles)
+            self._entries.append(entry)
+            for band in bands:
+                self._buckets.setdefault(band, []).append(entry_id)
+        else:
+            entry = self._entries[entry_id]
+            if order < entry.order:
+                # The earlier hit becomes the base record
+                entry.record = _merge_records(dict(record), entry.record)
+                entry.order = order
+            else:
+                entry.record = _merge_records(entry.record, record)
+
+        for key_type, values in _strong_keys(keys).items():
+            entry.strong_keys.setdefault(key_type, set()).update(values)
+        for key in keys + ([title_key] if title_key else []):
+            self._keys.setdefault(key, entry_id)
+        entry.provenance.setdefault(order, (query, source))
+        return entry.record
+
+    def find(self, record: Dict) -> Optional[Dict]:
+        """Return the indexed record that duplicates ``record``, or None (without adding it)."""
+        entry_id = self._find(*self._signature(record))
+        return self._entries[entry_id].record if entry_id is not None else None
+
+    def extend(
+        self,
+        records: Iterable[Dict],
+        query: Optional[str] = None,
+        source: Optional[str] = None,
+        order: Tuple = (),
+    ):
+        """Add a batch of records; each gets ``order + (position,)``."""
+        for position, record in enumerate(records):
+            self.add(record, query=query, source=source, order=order + (position,))
+
+    def records(self) -> List[Dict]:
+        """Return unique records in first-hit order, each with a "provenance" list."""
+        results = []
+        for entry in sorted(self._entries, key=lambda e: e.order):
+            provenance = []
+            seen = set()
+            for _, (query, source) in sorted(entry.provenance.items()):
+                if (query, source) not in seen:
+                    seen.add((query, source))
+                    provenance.append({"query": query, "source": source})
+            record = dict(entry.record)
+            record["provenance"] = provenance
+            results.append(record)
+        return results
+
+
+def _merge_records(base: Dict, other: Dict) -> Dict:
+    """Fill empty fields of ``base`` from ``other`` and keep the higher citation count."""
+    for field, value in other.items():
+        if field == "provenance":
+            continue
+        if value and not base.get(field):
+            base[field] = value
+    if other.get("citations") and (other["citations"] or 0) > (base.get("citations") or 0):
+        base["citations"] = other["citations"]
+    return base
+
+
+def deduplicate_records(records: Iterable[Dict], kind: str) -> List[Dict]:
+    """Deduplicate a list of records of one kind, keeping first-seen order."""
+    index = RecordIndex(kind)
+    index.extend(records)
+    return index.records()
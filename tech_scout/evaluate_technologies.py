@@ -5,13 +5,23 @@ This module handles the evaluation and assessment of discovered technologies,
 including maturity assessment, strategic fit analysis, and competitive landscape analysis.
 """
 
+import hashlib
 import json
 import os
 import os.path as osp
-from typing import List, Dict, Optional
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, List, Dict, Optional, Tuple
 from datetime import datetime
 
-from tech_scout.llm import get_response_from_llm, extract_json_between_markers
+from tech_scout.evidence import compact_json, estimate_tokens
+from tech_scout.llm import (
+    MAX_NUM_TOKENS,
+    get_context_window,
+    get_response_from_llm,
+    get_responses_from_llm_batch,
+    extract_json_between_markers,
+)
+from tech_scout.parallel import run_parallel
 
 # =============================================================================
 # EVALUATION PROMPTS
@@ -167,10 +177,319 @@ In <JSON>, provide:
 - "resource_allocation_suggestion": How to allocate resources across top picks
 """
 
+fused_evaluation_prompt = """You are a technology analyst. Evaluate the following technology in one pass: its maturity (Technology Readiness Level framework), its strategic fit with the organization, and its competitive landscape.
+
+<technology>
+{technology}
+</technology>
+
+<evidence>
+Papers: {papers_count} academic papers found
+Patents: {patents_count} patents filed
+News: {news_count} news articles
+Key Players: {key_players}
+</evidence>
+
+<organization_context>
+Industry: {industry}
+Current Capabilities: {current_capabilities}
+Strategic Priorities: {strategic_priorities}
+Risk Tolerance: {risk_tolerance}
+Investment Horizon: {investment_horizon}
+</organization_context>
+
+<market_data>
+Recent Patents by Company: {patent_data}
+Academic Leaders: {academic_leaders}
+Recent Funding/M&A: {funding_data}
+</market_data>
+
+Respond in the following format:
+
+ANALYSIS:
+<ANALYSIS>
+
+EVALUATION JSON:
+```json
+<JSON>
+```
+
+<JSON> must be an object with exactly three keys.
+
+"maturity_assessment": an object with
+- "trl_level": Technology Readiness Level (1-9)
+- "trl_description": Description of the TRL level
+- "maturity_stage": One of ["basic_research", "applied_research", "development", "demonstration", "commercialization", "market_ready"]
+- "evidence_strength": Rating 1-10 for how strong the evidence is
+- "key_milestones_achieved": List of milestones the technology has achieved
+- "remaining_challenges": List of challenges before wider adoption
+- "estimated_years_to_market": Estimate years until market ready (0 if already there)
+- "confidence": Rating 1-10 for confidence in this assessment
+- "rationale": Brief explanation of the assessment
+
+"strategic_fit": an object with
+- "overall_fit_score": Rating 1-10
+- "alignment_with_priorities": Dict mapping each priority to a score (1-10)
+- "capability_gaps": List of capabilities the org would need to develop
+- "build_vs_buy_recommendation": One of ["build_internal", "partner", "acquire", "license", "avoid"]
+- "investment_type": One of ["strategic", "exploratory", "defensive", "opportunistic"]
+- "recommended_investment_level": One of ["significant", "moderate", "minimal", "none"]
+- "key_risks": List of main risks of pursuing this technology
+- "key_opportunities": List of main opportunities
+- "competitive_advantage_potential": Rating 1-10
+- "time_sensitivity": One of ["urgent", "important", "can_wait", "not_time_sensitive"]
+- "recommended_actions": List of specific recommended actions
+
+"competitive_landscape": an object with
+- "market_leaders": List of top 3-5 companies with brief descriptions
+- "emerging_challengers": List of startups or new entrants to watch
+- "academic_hubs": Top universities/research institutions
+- "geographic_concentration": Where is development concentrated
+- "ip_landscape": Assessment of patent landscape (open, fragmented, consolidated)
+- "barriers_to_entry": List of main barriers
+- "partnership_opportunities": Potential partners to consider
+- "acquisition_targets": Potential acquisition targets
+- "competitive_intensity": Rating 1-10
+- "market_timing": One of ["early", "growth", "mature", "declining"]
+- "white_space_opportunities": Areas not well covered by competitors
+"""
+
+packed_strategic_fit_prompt = """You are a strategic technology analyst. Evaluate how well each of the following technologies fits with the strategic objectives of each organization it is paired with.
+
+<technologies>
+{technologies}
+</technologies>
+
+<organizations>
+{organizations}
+</organizations>
+
+Evaluate the strategic fit of each of these technology-organization pairs, each on its own merits:
+{pairs}
+
+Respond in the following format:
+
+ANALYSIS:
+<ANALYSIS>
+
+FIT JSON:
+```json
+<JSON>
+```
+
+In <ANALYSIS>, briefly note the main considerations (a few sentences in total).
+
+<JSON> must be an object with one key per pair ID listed above (e.g. "T1-O1"), each mapping to an object with:
+- "overall_fit_score": Rating 1-10
+- "alignment_with_priorities": Dict mapping each of that organization's priorities to a score (1-10)
+- "capability_gaps": List of capabilities the org would need to develop
+- "build_vs_buy_recommendation": One of ["build_internal", "partner", "acquire", "license", "avoid"]
+- "investment_type": One of ["strategic", "exploratory", "defensive", "opportunistic"]
+- "recommended_investment_level": One of ["significant", "moderate", "minimal", "none"]
+- "key_risks": List of main risks of pursuing this technology
+- "key_opportunities": List of main opportunities
+- "competitive_advantage_potential": Rating 1-10
+- "time_sensitivity": One of ["urgent", "important", "can_wait", "not_time_sensitive"]
+- "recommended_actions": List of specific recommended actions
+
+Write <JSON> compactly, without indentation.
+"""
+
+# Default criteria for compare_technologies()
+DEFAULT_EVALUATION_CRITERIA = [
+    {"name": "strategic_fit", "weight": 0.3, "description": "Alignment with strategic priorities"},
+    {"name": "maturity", "weight": 0.2, "description": "Technology readiness level"},
+    {"name": "market_potential", "weight": 0.2, "description": "Market size and growth potential"},
+    {"name": "competitive_position", "weight": 0.15, "description": "Ability to achieve competitive advantage"},
+    {"name": "implementation_feasibility", "weight": 0.15, "description": "Ease of implementation"},
+]
+
+# Technologies per comparison prompt; larger sets are compared in groups
+# that share COMPARISON_ANCHORS anchor technologies
+COMPARISON_GROUP_SIZE = int(os.getenv("TECHSCOUT_COMPARISON_GROUP_SIZE", "10"))
+COMPARISON_ANCHORS = 3
+
+# Evaluation modes: one prompt per section, or one prompt for all three
+EVALUATION_MODES = ("split", "fused")
+
+# Evaluation sections in output order
+EVALUATION_SECTIONS = ("maturity_assessment", "strategic_fit", "competitive_landscape")
+
+# Fields a section must contain to be accepted from a fused response; the
+# ones generate_recommendation() scores on must also be numbers
+SECTION_REQUIRED_FIELDS = {
+    "maturity_assessment": ("trl_level", "maturity_stage", "evidence_strength"),
+    "strategic_fit": ("overall_fit_score", "build_vs_buy_recommendation", "time_sensitivity"),
+    "competitive_landscape": ("market_leaders", "competitive_intensity", "market_timing"),
+}
+SECTION_NUMERIC_FIELDS = {
+    "maturity_assessment": ("trl_level", "evidence_strength"),
+    "strategic_fit": ("overall_fit_score",),
+    "competitive_landscape": ("competitive_intensity",),
+}
+
+# Bump when evaluations change in a way the prompt texts do not show (e.g.
+# parsing or scoring); edits to the prompts change fingerprints on their own
+EVALUATION_PROMPT_VERSION = "1"
+
+# Evaluations are stored as <base_dir>/evaluations/<fingerprint>.json and
+# their sections as <base_dir>/evaluations/sections/<fingerprint>.json
+EVALUATION_STORE_DIR = "evaluations"
+
+# Sections that depend on the organization context; the others are stored
+# per technology and shared by every organization context
+ORGANIZATION_SECTIONS = ("strategic_fit",)
+
+# Tokens budgeted per strategic fit object in a packed response, and for the
+# analysis before them
+FIT_RESPONSE_TOKENS = 400
+FIT_ANALYSIS_TOKENS = 300
+
+# Share of the model's input window a packed strategic fit prompt may fill
+FIT_PACK_CONTEXT_SHARE = 0.5
+
+# Upper bound on (technology, organization) pairs per packed prompt
+MAX_FIT_PACK = int(os.getenv("TECHSCOUT_FIT_PACK_SIZE", "16"))
+
+# Per-section prompt of each section
+SECTION_PROMPTS = {
+    "maturity_assessment": maturity_assessment_prompt,
+    "strategic_fit": strategic_fit_prompt,
+    "competitive_landscape": competitive_landscape_prompt,
+}
+
 # =============================================================================
 # EVALUATION FUNCTIONS
 # =============================================================================
 
+def _default_evidence(technology: Dict) -> Dict:
+    return {
+        "papers_count": len(technology.get("key_references", [])),
+        "patents_count": 0,
+        "news_count": 0,
+        "key_players": technology.get("key_players", []),
+    }
+
+
+def _default_market_data(technology: Dict) -> Dict:
+    return {
+        "key_players": technology.get("key_players", []),
+        "patent_data": {},
+        "academic_leaders": [],
+        "funding_data": [],
+    }
+
+
+def _organization_fields(organization_context: Dict) -> Dict:
+    """Prompt fields describing the organization."""
+    return {
+        "industry": organization_context.get("industry", "Not specified"),
+        "current_capabilities": compact_json(organization_context.get("current_capabilities", [])),
+        "strategic_priorities": compact_json(organization_context.get("strategic_priorities", [])),
+        "risk_tolerance": organization_context.get("risk_tolerance", "moderate"),
+        "investment_horizon": organization_context.get("investment_horizon", "3-5 years"),
+    }
+
+
+def maturity_request(technology: Dict, evidence: Optional[Dict] = None) -> Dict:
+    """Prompt ("msg") and "system_message" of assess_maturity()."""
+    if evidence is None:
+        evidence = {
+            "papers_count": 0,
+            "patents_count": 0,
+            "news_count": 0,
+            "key_players": [],
+        }
+    return {
+        "msg": maturity_assessment_prompt.format(
+            technology=compact_json(technology),
+            papers_count=evidence.get("papers_count", 0),
+            patents_count=evidence.get("patents_count", 0),
+            news_count=evidence.get("news_count", 0),
+            key_players=", ".join(evidence.get("key_players", [])),
+        ),
+        "system_message": "You are an expert at assessing technology maturity and readiness levels.",
+    }
+
+
+def strategic_fit_request(technology: Dict, organization_context: Dict) -> Dict:
+    """Prompt ("msg") and "system_message" of evaluate_strategic_fit()."""
+    return {
+        "msg": strategic_fit_prompt.format(
+            technology=compact_json(technology),
+            **_organization_fields(organization_context),
+        ),
+        "system_message": "You are a strategic technology advisor helping organizations make technology investment decisions.",
+    }
+
+
+def competitive_landscape_request(technology: Dict, market_data: Optional[Dict] = None) -> Dict:
+    """Prompt ("msg") and "system_message" of analyze_competitive_landscape()."""
+    if market_data is None:
+        market_data = _default_market_data(technology)
+    return {
+        "msg": competitive_landscape_prompt.format(
+            technology=compact_json(technology),
+            key_players=compact_json(market_data.get("key_players", [])),
+            patent_data=compact_json(market_data.get("patent_data", {})),
+            academic_leaders=compact_json(market_data.get("academic_leaders", [])),
+            funding_data=compact_json(market_data.get("funding_data", [])),
+        ),
+        "system_message": "You are a competitive intelligence analyst specializing in emerging technologies.",
+    }
+
+
+def fused_evaluation_request(
+    technology: Dict,
+    organization_context: Dict,
+    evidence: Optional[Dict] = None,
+    market_data: Optional[Dict] = None,
+) -> Dict:
+    """Prompt ("msg") and "system_message" of assess_all_sections()."""
+    evidence = evidence or _default_evidence(technology)
+    market_data = market_data or _default_market_data(technology)
+    return {
+        "msg": fused_evaluation_prompt.format(
+            technology=compact_json(technology),
+            papers_count=evidence.get("papers_count", 0),
+            patents_count=evidence.get("patents_count", 0),
+            news_count=evidence.get("news_count", 0),
+            key_players=compact_json(market_data.get("key_players") or evidence.get("key_players", [])),
+            patent_data=compact_json(market_data.get("patent_data", {})),
+            academic_leaders=compact_json(market_data.get("academic_leaders", [])),
+            funding_data=compact_json(market_data.get("funding_data", [])),
+            **_organization_fields(organization_context),
+        ),
+        "system_message": "You are a technology analyst combining maturity assessment, strategic advisory and competitive intelligence expertise.",
+    }
+
+
+def section_request(
+    section: str,
+    technology: Dict,
+    organization_context: Dict,
+    evidence: Optional[Dict] = None,
+) -> Dict:
+    """Per-section request for one of EVALUATION_SECTIONS."""
+    if section == "maturity_assessment":
+        return maturity_request(technology, evidence)
+    if section == "strategic_fit":
+        return strategic_fit_request(technology, organization_context)
+    return competitive_landscape_request(technology)
+
+
+def validate_section(section: str, data) -> bool:
+    """Whether ``data`` is a usable result for an evaluation section."""
+    if not isinstance(data, dict):
+        return False
+    if any(data.get(field) in (None, "") for field in SECTION_REQUIRED_FIELDS[section]):
+        return False
+    return all(
+        isinstance(data[field], (int, float)) and not isinstance(data[field], bool)
+        for field in SECTION_NUMERIC_FIELDS[section]
+    )
+
+
 def assess_maturity(
     client,
     model: str,
@@ -189,26 +508,11 @@ def assess_maturity(
     Returns:
         Maturity assessment dictionary
     """
-    if evidence is None:
-        evidence = {
-            "papers_count": 0,
-            "patents_count": 0,
-            "news_count": 0,
-            "key_players": [],
-        }
-    
     text, _ = get_response_from_llm(
-        maturity_assessment_prompt.format(
-            technology=json.dumps(technology, indent=2),
-            papers_count=evidence.get("papers_count", 0),
-            patents_count=evidence.get("patents_count", 0),
-            news_count=evidence.get("news_count", 0),
-            key_players=", ".join(evidence.get("key_players", [])),
-        ),
         client=client,
         model=model,
-        system_message="You are an expert at assessing technology maturity and readiness levels.",
         msg_history=[],
+        **maturity_request(technology, evidence),
     )
     
     return extract_json_between_markers(text)
@@ -233,23 +537,200 @@ def evaluate_strategic_fit(
         Strategic fit assessment dictionary
     """
     text, _ = get_response_from_llm(
-        strategic_fit_prompt.format(
-            technology=json.dumps(technology, indent=2),
-            industry=organization_context.get("industry", "Not specified"),
-            current_capabilities=json.dumps(organization_context.get("current_capabilities", [])),
-            strategic_priorities=json.dumps(organization_context.get("strategic_priorities", [])),
-            risk_tolerance=organization_context.get("risk_tolerance", "moderate"),
-            investment_horizon=organization_context.get("investment_horizon", "3-5 years"),
-        ),
         client=client,
         model=model,
-        system_message="You are a strategic technology advisor helping organizations make technology investment decisions.",
         msg_history=[],
+        **strategic_fit_request(technology, organization_context),
     )
     
     return extract_json_between_markers(text)
 
 
+def fit_pack_limits(model: str) -> Tuple[int, int]:
+    """
+    Size limits of a packed strategic fit prompt to ``model``.
+    
+    Returns:
+        Tuple of (input token budget, maximum pairs): FIT_PACK_CONTEXT_SHARE
+        of the input window, and as many pairs as the response allowance
+        (MAX_NUM_TOKENS) holds at FIT_RESPONSE_TOKENS each, at most
+        MAX_FIT_PACK
+    """
+    input_budget = int((get_context_window(model) - MAX_NUM_TOKENS) * FIT_PACK_CONTEXT_SHARE)
+    max_pairs = (MAX_NUM_TOKENS - FIT_ANALYSIS_TOKENS) // FIT_RESPONSE_TOKENS
+    return input_budget, max(1, min(MAX_FIT_PACK, max_pairs))
+
+
+def _organization_line(organization_context: Dict) -> str:
+    fields = _organization_fields(organization_context)
+    return (f"Industry: {fields['industry']}; Current Capabilities: {fields['current_capabilities']}; "
+            f"Strategic Priorities: {fields['strategic_priorities']}; Risk Tolerance: {fields['risk_tolerance']}; "
+            f"Investment Horizon: {fields['investment_horizon']}")
+
+
+def _fit_pack_ids(pairs: List[Tuple[Dict, Dict]]) -> Tuple[Dict[str, str], Dict[str, str], List[str]]:
+    """Technology IDs ("T1") and organization IDs ("O1") by content, and the pair ID ("T1-O2") of each pair."""
+    tech_ids: Dict[str, str] = {}
+    org_ids: Dict[str, str] = {}
+    pair_ids = []
+    for technology, organization_context in pairs:
+        tech_key = compact_json(technology)
+        org_key = _organization_line(organization_context)
+        tech_ids.setdefault(tech_key, f"T{len(tech_ids) + 1}")
+        org_ids.setdefault(org_key, f"O{len(org_ids) + 1}")
+        pair_ids.append(f"{tech_ids[tech_key]}-{org_ids[org_key]}")
+    return tech_ids, org_ids, pair_ids
+
+
+def packed_strategic_fit_request(pairs: List[Tuple[Dict, Dict]]) -> Dict:
+    """Prompt ("msg") and "system_message" scoring several (technology, organization context) pairs at once."""
+    tech_ids, org_ids, pair_ids = _fit_pack_ids(pairs)
+    return {
+        "msg": packed_strategic_fit_prompt.format(
+            technologies="\n".join(f"{tech_id}: {text}" for text, tech_id in tech_ids.items()),
+            organizations="\n".join(f"{org_id}: {text}" for text, org_id in org_ids.items()),
+            pairs=", ".join(pair_ids),
+        ),
+        "system_message": "You are a strategic technology advisor helping organizations make technology investment decisions.",
+    }
+
+
+def parse_packed_strategic_fit(text: str, pairs: List[Tuple[Dict, Dict]]) -> List[Optional[Dict]]:
+    """Per-pair strategic fit from a packed response, in pair order (None where missing or invalid)."""
+    result = extract_json_between_markers(text)
+    if not isinstance(result, dict):
+        result = {}
+    _, _, pair_ids = _fit_pack_ids(pairs)
+    return [
+        result.get(pair_id) if validate_section("strategic_fit", result.get(pair_id)) else None
+        for pair_id in pair_ids
+    ]
+
+
+def plan_fit_packs(pairs: List[Tuple[Dict, Dict]], model: str, max_pack: Optional[int] = None) -> List[List[int]]:
+    """
+    Split (technology, organization context) pairs into packed prompts.
+    
+    Pairs are grouped by organization when there are fewer distinct
+    organizations than technologies (several technologies against one
+    profile) and by technology otherwise (one technology against several
+    profiles), so each technology and profile is written into as few
+    prompts as possible. A pack closes when it reaches the pair limit or
+    the input budget of fit_pack_limits().
+    
+    Args:
+        pairs: (technology, organization context) pairs
+        model: LLM model name
+        max_pack: Pairs per prompt at most (default: fit_pack_limits())
+    
+    Returns:
+        Packs as lists of indices into ``pairs``
+    """
+    input_budget, pair_limit = fit_pack_limits(model)
+    if max_pack is not None:
+        pair_limit = max(1, min(pair_limit, max_pack))
+    
+    keys = [(compact_json(technology), _organization_line(org)) for technology, org in pairs]
+    by_organization = len({org for _, org in keys}) <= len({tech for tech, _ in keys})
+    groups: Dict[str, List[int]] = {}
+    for index, (tech_key, org_key) in enumerate(keys):
+        groups.setdefault(org_key if by_organization else tech_key, []).append(index)
+    
+    base_tokens = estimate_tokens(packed_strategic_fit_prompt)
+    packs: List[List[int]] = []
+    current: List[int] = []
+    seen = set()
+    used = base_tokens
+    for index in (index for group in groups.values() for index in group):
+        tech_key, org_key = keys[index]
+        cost = 4 + sum(estimate_tokens(key) for key in (tech_key, org_key) if key not in seen)
+        if current and (len(current) >= pair_limit or used + cost > input_budget):
+            packs.append(current)
+            current, seen, used = [], set(), base_tokens
+            cost = 4 + estimate_tokens(tech_key) + estimate_tokens(org_key)
+        current.append(index)
+        seen.update((tech_key, org_key))
+        used += cost
+    if current:
+        packs.append(current)
+    return packs
+
+
+def evaluate_strategic_fit_packed(
+    client,
+    model: str,
+    pairs: List[Tuple[Dict, Dict]],
+    max_workers: int = 4,
+    use_batch_api: bool = False,
+    max_pack: Optional[int] = None,
+) -> List[object]:
+    """
+    Evaluate strategic fit for many (technology, organization context) pairs in few prompts.
+    
+    Pairs are packed into prompts sized to the model (see plan_fit_packs),
+    each answered with one JSON object keyed by pair, so T technologies
+    against O organizations take about T x O / pack size calls instead of
+    T x O. Each pair's result has the schema of evaluate_strategic_fit();
+    pairs missing or malformed in a packed response are re-run with their
+    own prompt.
+    
+    Args:
+        client: LLM client
+        model: LLM model name
+        pairs: (technology, organization context) pairs
+        max_workers: Packed prompts sent at once (interactive calls)
+        use_batch_api: Submit the packed prompts as one provider batch
+        max_pack: Pairs per prompt at most
+    
+    Returns:
+        Strategic fit per pair, in order; an Exception where it failed
+    """
+    packs = plan_fit_packs(pairs, model, max_pack)
+    requests = [
+        strategic_fit_request(*pairs[pack[0]]) if len(pack) == 1
+        else packed_strategic_fit_request([pairs[index] for index in pack])
+        for pack in packs
+    ]
+    print(f"  Scoring strategic fit for {len(pairs)} pairs in {len(packs)} prompts")
+    
+    if use_batch_api:
+        texts = get_responses_from_llm_batch(requests, client, model)
+    else:
+        texts = run_parallel(
+            [
+                lambda request=request: get_response_from_llm(client=client, model=model, msg_history=[], **request)[0]
+                for request in requests
+            ],
+            max_workers=max_workers,
+            return_exceptions=True,
+        )
+    
+    results: List[object] = [None] * len(pairs)
+    for pack, text in zip(packs, texts):
+        if text is None or isinstance(text, Exception):
+            print(f"  Warning: packed strategic fit prompt failed: {text or 'no response'}")
+            continue
+        if len(pack) == 1:
+            results[pack[0]] = extract_json_between_markers(text)
+        else:
+            for index, fit in zip(pack, parse_packed_strategic_fit(text, [pairs[index] for index in pack])):
+                results[index] = fit
+    
+    missing = [index for index, result in enumerate(results) if result is None]
+    if missing:
+        print(f"  Re-running {len(missing)} strategic fit assessments with their own prompt")
+        outcomes = assess_sections(
+            client,
+            model,
+            [("strategic_fit", *pairs[index]) for index in missing],
+            max_workers=max_workers,
+            use_batch_api=use_batch_api,
+        )
+        for index, outcome in zip(missing, outcomes):
+            results[index] = outcome
+    return results
+
+
 def analyze_competitive_landscape(
     client,
     model: str,
@@ -268,53 +749,105 @@ def analyze_competitive_landscape(
     Returns:
         Competitive landscape analysis dictionary
     """
-    if market_data is None:
-        market_data = {
-            "key_players": technology.get("key_players", []),
-            "patent_data": {},
-            "academic_leaders": [],
-            "funding_data": [],
-        }
-    
     text, _ = get_response_from_llm(
-        competitive_landscape_prompt.format(
-            technology=json.dumps(technology, indent=2),
-            key_players=json.dumps(market_data.get("key_players", [])),
-            patent_data=json.dumps(market_data.get("patent_data", {})),
-            academic_leaders=json.dumps(market_data.get("academic_leaders", [])),
-            funding_data=json.dumps(market_data.get("funding_data", [])),
-        ),
         client=client,
         model=model,
-        system_message="You are a competitive intelligence analyst specializing in emerging technologies.",
         msg_history=[],
+        **competitive_landscape_request(technology, market_data),
     )
     
     return extract_json_between_markers(text)
 
 
+def assess_all_sections(
+    client,
+    model: str,
+    technology: Dict,
+    organization_context: Dict,
+    evidence: Optional[Dict] = None,
+    market_data: Optional[Dict] = None,
+) -> Dict[str, Optional[Dict]]:
+    """
+    Assess maturity, strategic fit and competitive landscape in one LLM call.
+    
+    The technology and its context are sent once instead of three times.
+    Sections are validated individually (see validate_section); a section
+    that is missing or malformed comes back as None.
+    
+    Args:
+        client: LLM client
+        model: LLM model name
+        technology: Technology dictionary
+        organization_context: Dict with industry, capabilities, priorities, etc.
+        evidence: Optional evidence data (paper counts, patents, etc.)
+        market_data: Optional market intelligence data
+    
+    Returns:
+        Dict mapping each of EVALUATION_SECTIONS to its result or None
+    """
+    text, _ = get_response_from_llm(
+        client=client,
+        model=model,
+        msg_history=[],
+        **fused_evaluation_request(technology, organization_context, evidence, market_data),
+    )
+    
+    return parse_fused_evaluation(text)
+
+
+def parse_fused_evaluation(text: str) -> Dict[str, Optional[Dict]]:
+    """Split a fused evaluation response into validated sections (None where invalid)."""
+    result = extract_json_between_markers(text)
+    if not isinstance(result, dict):
+        result = {}
+    return {
+        section: result.get(section) if validate_section(section, result.get(section)) else None
+        for section in EVALUATION_SECTIONS
+    }
+
+
 def compare_technologies(
     client,
     model: str,
     technologies: List[Dict],
     evaluation_criteria: List[Dict],
+    evaluations: Optional[List[Dict]] = None,
+    group_size: int = COMPARISON_GROUP_SIZE,
 ) -> Dict:
     """
     Compare multiple technologies against evaluation criteria.
     
+    Up to ``group_size`` technologies are compared in one prompt. Larger
+    sets are compared tournament-style (see tournament_compare_technologies)
+    so the prompt size, latency and parse failures stay bounded.
+    
     Args:
         client: LLM client
         model: LLM model name
         technologies: List of technology dictionaries
         evaluation_criteria: List of criteria with names and weights
+        evaluations: Optional evaluations of the technologies (same order),
+            used to pick anchors spread across the score range
+        group_size: Technologies per comparison prompt (at least 2)
     
     Returns:
         Comparison and ranking dictionary
     """
+    # A group needs room for an anchor plus one other technology
+    group_size = max(2, group_size)
+    if len(technologies) > group_size:
+        return tournament_compare_technologies(
+            client, model, technologies, evaluation_criteria, evaluations, group_size=group_size
+        )
+    return _compare_group(client, model, technologies, evaluation_criteria)
+
+
+def _compare_group(client, model: str, technologies: List[Dict], evaluation_criteria: List[Dict]) -> Optional[Dict]:
+    """One technology_comparison_prompt call; returns the parsed RANKING JSON."""
     text, _ = get_response_from_llm(
         technology_comparison_prompt.format(
-            technologies=json.dumps(technologies, indent=2),
-            criteria=json.dumps(evaluation_criteria, indent=2),
+            technologies=compact_json(technologies),
+            criteria=compact_json(evaluation_criteria),
         ),
         client=client,
         model=model,
@@ -325,6 +858,213 @@ def compare_technologies(
     return extract_json_between_markers(text)
 
 
+def _compare_group_checked(
+    client, model: str, technologies: List[Dict], evaluation_criteria: List[Dict], attempts: int = 2
+) -> Dict:
+    """_compare_group(), retried while the response has no "rankings" list."""
+    for _ in range(attempts):
+        comparison = _compare_group(client, model, technologies, evaluation_criteria)
+        if isinstance(comparison, dict) and isinstance(comparison.get("rankings"), list):
+            return comparison
+    raise ValueError(f"No rankings in comparison response after {attempts} attempts")
+
+
+def _pick_anchors(technologies: List[Dict], evaluations: Optional[List[Dict]], count: int) -> List[int]:
+    """Indices of ``count`` anchors, evenly spread over the evaluation scores (or the input order)."""
+    order = list(range(len(technologies)))
+    if evaluations:
+        scores = [
+            ((evaluation or {}).get("overall_recommendation") or {}).get("overall_score") or 0
+            for evaluation in evaluations
+        ]
+        order.sort(key=lambda index: scores[index])
+    if count <= 1:
+        return [order[len(order) // 2]][:count]
+    return sorted({order[round(i * (len(order) - 1) / (count - 1))] for i in range(count)})
+
+
+def _anchor_fit(points: List[Tuple[float, float]]) -> Tuple[float, float]:
+    """
+    Least-squares (scale, offset) mapping a group's anchor scores onto the reference scores.
+    
+    Falls back to an offset alone with fewer than two distinct anchor
+    scores; the scale is kept within [0.5, 2] so one noisy anchor cannot
+    flip or flatten a group.
+    """
+    if not points:
+        return 1.0, 0.0
+    mean_x = sum(x for x, _ in points) / len(points)
+    mean_y = sum(y for _, y in points) / len(points)
+    variance = sum((x - mean_x) ** 2 for x, _ in points)
+    if variance == 0:
+        return 1.0, mean_y - mean_x
+    scale = sum((x - mean_x) * (y - mean_y) for x, y in points) / variance
+    scale = min(max(scale, 0.5), 2.0)
+    return scale, mean_y - scale * mean_x
+
+
+def _number(value) -> Optional[float]:
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def tournament_compare_technologies(
+    client,
+    model: str,
+    technologies: List[Dict],
+    evaluation_criteria: List[Dict],
+    evaluations: Optional[List[Dict]] = None,
+    group_size: int = COMPARISON_GROUP_SIZE,
+    anchors: int = COMPARISON_ANCHORS,
+) -> Dict:
+    """
+    Compare many technologies in parallel fixed-size groups.
+    
+    Every group holds the same ``anchors`` technologies plus its share of
+    the others, and all groups are scored at once with the usual comparison
+    prompt, so latency stays roughly flat as the number of technologies
+    grows. Each group's scores (overall and per criterion) are mapped onto a
+    common scale by a linear fit of its anchor scores to the anchors' mean
+    scores across groups. A final round compares the top ``group_size``
+    technologies of the merged ranking to write the portfolio, rationale
+    and resource allocation.
+    
+    Args:
+        client: LLM client
+        model: LLM model name
+        technologies: List of technology dictionaries
+        evaluation_criteria: List of criteria with names and weights
+        evaluations: Optional evaluations of the technologies (same order);
+            anchors are then spread across their overall scores
+        group_size: Technologies per group, anchors included (at least 2)
+        anchors: Anchor technologies shared by every group
+    
+    Returns:
+        Comparison in the schema of compare_technologies(), plus
+        "comparison_method" describing the groups and, only if some
+        technologies could not be ranked, their names under "unranked"
+    """
+    group_size = max(2, group_size)
+    anchors = max(1, min(anchors, group_size - 1, len(technologies)))
+    anchor_indices = _pick_anchors(technologies, evaluations, anchors)
+    members = [index for index in range(len(technologies)) if index not in anchor_indices]
+    group_count = max(1, -(-len(members) // (group_size - len(anchor_indices))))
+    groups = [anchor_indices + members[g::group_count] for g in range(group_count)]
+    print(f"  Comparing {len(technologies)} technologies in {group_count} groups of up to {group_size} "
+          f"({len(anchor_indices)} anchors)")
+    
+    outcomes = run_parallel(
+        [
+            lambda group=group: _compare_group_checked(
+                client, model, [technologies[index] for index in group], evaluation_criteria
+            )
+            for group in groups
+        ],
+        max_workers=group_count,
+        return_exceptions=True,
+    )
+    
+    # Map ranking entries back to technology indices by name or title
+    lookup = {}
+    for index, technology in enumerate(technologies):
+        for key in (technology.get("name"), technology.get("title")):
+            if key:
+                lookup.setdefault(str(key).strip().lower(), index)
+    group_entries: List[Dict[int, Dict]] = []
+    for group, outcome in zip(groups, outcomes):
+        entries = {}
+        if isinstance(outcome, Exception):
+            print(f"  Warning: comparison group failed: {outcome}")
+        else:
+            for entry in outcome["rankings"]:
+                index = lookup.get(str((entry or {}).get("name", "")).strip().lower()) if isinstance(entry, dict) else None
+                if index in group and _number(entry.get("overall_score")) is not None:
+                    entries[index] = entry
+        group_entries.append(entries)
+    
+    # Reference score of each anchor (overall and per criterion): its mean across groups
+    def score_of(entry: Dict, key: Optional[str]) -> Optional[float]:
+        if key is None:
+            return _number(entry.get("overall_score"))
+        return _number((entry.get("scores_by_criteria") or {}).get(key))
+    
+    keys: List[Optional[str]] = [None] + [criterion["name"] for criterion in evaluation_criteria]
+    reference = {}
+    for key in keys:
+        for anchor in anchor_indices:
+            values = [score_of(entries[anchor], key) for entries in group_entries if anchor in entries]
+            values = [value for value in values if value is not None]
+            if values:
+                reference[key, anchor] = sum(values) / len(values)
+    
+    # Normalize each group onto the reference scale and merge
+    merged: Dict[int, Dict] = {}
+    normalized_scores: Dict[int, List[float]] = {}
+    for entries in group_entries:
+        fits = {
+            key: _anchor_fit([
+                (score_of(entries[anchor], key), reference[key, anchor])
+                for anchor in anchor_indices
+                if anchor in entries and score_of(entries[anchor], key) is not None and (key, anchor) in reference
+            ])
+            for key in keys
+        }
+        for index, entry in entries.items():
+            scale, offset = fits[None]
+            normalized_scores.setdefault(index, []).append(scale * score_of(entry, None) + offset)
+            if index in merged:
+                continue
+            criteria_scores = dict(entry.get("scores_by_criteria") or {})
+            for key in keys[1:]:
+                value = score_of(entry, key)
+                if value is not None:
+                    scale, offset = fits[key]
+                    criteria_scores[key] = round(scale * value + offset, 2)
+            merged[index] = dict(entry, name=technologies[index].get("name", entry.get("name")),
+                                 scores_by_criteria=criteria_scores)
+    for index, scores in normalized_scores.items():
+        merged[index]["overall_score"] = round(min(100.0, max(1.0, sum(scores) / len(scores))), 1)
+    
+    ranked = sorted(merged, key=lambda index: merged[index]["overall_score"], reverse=True)
+    rankings = [merged[index] for index in ranked]
+    
+    # Final round: portfolio and rationale from the top of the merged ranking
+    finalists = ranked[:group_size]
+    try:
+        final = _compare_group_checked(client, model, [technologies[index] for index in finalists], evaluation_criteria)
+    except Exception as e:
+        print(f"  Warning: final comparison round failed: {e}")
+        final = {
+            "recommended_portfolio": [entry["name"] for entry in rankings[:3]],
+            "prioritization_rationale": "Ranked by anchor-normalized group comparison scores.",
+            "resource_allocation_suggestion": "",
+        }
+    
+    comparison = {
+        "rankings": rankings,
+        "recommended_portfolio": final.get("recommended_portfolio", []),
+        "prioritization_rationale": final.get("prioritization_rationale", ""),
+        "resource_allocation_suggestion": final.get("resource_allocation_suggestion", ""),
+        "comparison_method": {
+            "mode": "tournament",
+            "groups": group_count,
+            "group_size": group_size,
+            "anchors": [technologies[index].get("name") for index in anchor_indices],
+        },
+    }
+    unranked = [technologies[index].get("name") for index in range(len(technologies)) if index not in merged]
+    if unranked:
+        print(f"  Warning: {len(unranked)} technologies could not be ranked")
+        comparison["unranked"] = unranked
+    return comparison
+
+
 def evaluate_technology(
     base_dir: str,
     client,
@@ -332,10 +1072,25 @@ def evaluate_technology(
     technology: Dict,
     organization_context: Optional[Dict] = None,
     save_results: bool = True,
+    section_workers: int = 3,
+    mode: str = "split",
+    known_sections: Optional[Dict[str, Dict]] = None,
 ) -> Dict:
     """
     Comprehensive evaluation of a single technology.
     
+    In "split" mode the maturity, strategic fit and competitive landscape
+    assessments are separate prompts that run concurrently (each LLM call
+    still holds a slot of its provider's concurrency limit). In "fused"
+    mode one prompt asks for all three; only sections missing or malformed
+    in that response are re-run with their own prompt. A failed assessment
+    is recorded as None and its error listed under "evaluation_errors", a
+    key only present when something failed.
+    
+    Sections in ``known_sections`` (e.g. stored results, see
+    load_stored_sections) are used as they are; only the others are
+    assessed, with per-section prompts.
+    
     Args:
         base_dir: Directory to save results
         client: LLM client
@@ -343,46 +1098,105 @@ def evaluate_technology(
         technology: Technology dictionary to evaluate
         organization_context: Organization context for strategic fit
         save_results: Whether to save results to file
+        section_workers: Assessments run at once (1 runs them one after another)
+        mode: "split" or "fused"
+        known_sections: Section results that need no assessment
     
     Returns:
         Complete evaluation dictionary
     """
+    if mode not in EVALUATION_MODES:
+        raise ValueError(f"Unknown evaluation mode {mode!r}; expected one of {EVALUATION_MODES}")
+    
     print(f"Evaluating technology: {technology.get('name', 'Unknown')}")
     
-    # Default organization context
-    if organization_context is None:
-        org_context_file = osp.join(base_dir, "organization_context.json")
-        if osp.exists(org_context_file):
-            with open(org_context_file, "r") as f:
-                organization_context = json.load(f)
-        else:
-            organization_context = {
-                "industry": "Technology",
-                "current_capabilities": [],
-                "strategic_priorities": ["Innovation", "Growth", "Efficiency"],
-                "risk_tolerance": "moderate",
-                "investment_horizon": "3-5 years",
-            }
+    organization_context = _resolve_organization_context(base_dir, organization_context)
     
     # Collect evidence
-    evidence = {
-        "papers_count": len(technology.get("key_references", [])),
-        "patents_count": 0,
-        "news_count": 0,
-        "key_players": technology.get("key_players", []),
+    evidence = _default_evidence(technology)
+    
+    section_tasks = {
+        "maturity_assessment": lambda: assess_maturity(client, model, technology, evidence),
+        "strategic_fit": lambda: evaluate_strategic_fit(client, model, technology, organization_context),
+        "competitive_landscape": lambda: analyze_competitive_landscape(client, model, technology),
     }
+    results: Dict[str, object] = dict(known_sections or {})
+    if results:
+        print(f"  Already assessed: {', '.join(results)}")
+    
+    if mode == "fused" and not results:
+        print("  Assessing all sections in one prompt...")
+        try:
+            fused = assess_all_sections(client, model, technology, organization_context, evidence)
+        except Exception as e:
+            print(f"  Warning: fused evaluation failed: {e}")
+            fused = {}
+        results = {section: value for section, value in fused.items() if value is not None}
+        if len(results) < len(EVALUATION_SECTIONS):
+            missing = [section for section in EVALUATION_SECTIONS if section not in results]
+            print(f"  Re-running with per-section prompts: {', '.join(missing)}")
+    
+    # Run the remaining (in split mode: all) assessments
+    pending = [section for section in EVALUATION_SECTIONS if section not in results]
+    if pending and (mode == "split" or known_sections):
+        print(f"  Assessing {', '.join(section.replace('_', ' ') for section in pending)}...")
+    outcomes = run_parallel(
+        [section_tasks[section] for section in pending],
+        max_workers=section_workers,
+        return_exceptions=True,
+    )
+    results.update(zip(pending, outcomes))
+    
+    evaluation = compile_evaluation(technology, results)
+    
+    # Save if requested
+    if save_results:
+        save_evaluation(base_dir, evaluation)
     
-    # Run all evaluations
-    print("  Assessing maturity...")
-    maturity = assess_maturity(client, model, technology, evidence)
+    return evaluation
+
+
+def _resolve_organization_context(base_dir: str, organization_context: Optional[Dict]) -> Dict:
+    """Use the given context, else base_dir/organization_context.json, else a generic default."""
+    if organization_context is not None:
+        return organization_context
+    org_context_file = osp.join(base_dir, "organization_context.json")
+    if osp.exists(org_context_file):
+        with open(org_context_file, "r") as f:
+            return json.load(f)
+    return {
+        "industry": "Technology",
+        "current_capabilities": [],
+        "strategic_priorities": ["Innovation", "Growth", "Efficiency"],
+        "risk_tolerance": "moderate",
+        "investment_horizon": "3-5 years",
+    }
+
+
+def compile_evaluation(technology: Dict, results: Dict[str, object]) -> Dict:
+    """
+    Assemble the evaluation record of a technology.
     
-    print("  Evaluating strategic fit...")
-    strategic_fit = evaluate_strategic_fit(client, model, technology, organization_context)
+    Args:
+        technology: Technology dictionary
+        results: Result per section of EVALUATION_SECTIONS; an Exception (or
+            a missing section) is recorded as None with its error listed
+            under "evaluation_errors"
     
-    print("  Analyzing competitive landscape...")
-    competitive = analyze_competitive_landscape(client, model, technology)
+    Returns:
+        Evaluation dictionary
+    """
+    sections = {}
+    errors = {}
+    for section in EVALUATION_SECTIONS:
+        result = results.get(section)
+        if isinstance(result, Exception):
+            print(f"  Warning: {section} failed: {result}")
+            errors[section] = f"{type(result).__name__}: {result}"
+            result = None
+        sections[section] = result
+    maturity, strategic_fit, competitive = [sections[section] for section in EVALUATION_SECTIONS]
     
-    # Compile evaluation
     evaluation = {
         "technology": technology,
         "evaluation_date": datetime.now().isoformat(),
@@ -391,17 +1205,232 @@ def evaluate_technology(
         "competitive_landscape": competitive,
         "overall_recommendation": generate_recommendation(maturity, strategic_fit, competitive),
     }
+    if errors:
+        evaluation["evaluation_errors"] = errors
+    return evaluation
+
+
+def save_evaluation(base_dir: str, evaluation: Dict) -> str:
+    """Write an evaluation to base_dir/evaluation_<name>.json and return the path."""
+    os.makedirs(base_dir, exist_ok=True)
+    tech_name = evaluation["technology"].get("name", "unknown").replace(" ", "_")
+    eval_file = osp.join(base_dir, f"evaluation_{tech_name}.json")
+    with open(eval_file, "w") as f:
+        json.dump(evaluation, f, indent=2)
+    print(f"  Evaluation saved to: {eval_file}")
+    return eval_file
+
+
+def default_evaluation_store_dir(base_dir: str) -> str:
+    """Evaluation store location: TECHSCOUT_EVALUATION_STORE_DIR if set, else <base_dir>/evaluations."""
+    return os.getenv("TECHSCOUT_EVALUATION_STORE_DIR") or osp.join(base_dir, EVALUATION_STORE_DIR)
+
+
+def _digest(payload: Dict) -> str:
+    encoded = json.dumps(payload, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def _prompt_version(*prompts: str) -> str:
+    """EVALUATION_PROMPT_VERSION combined with a hash of the prompt texts."""
+    digest = hashlib.sha256("\0".join(prompts).encode("utf-8")).hexdigest()
+    return f"{EVALUATION_PROMPT_VERSION}:{digest[:16]}"
+
+
+def evaluation_fingerprint(technology: Dict, organization_context: Dict, model: str) -> str:
+    """
+    Content address of an evaluation.
     
-    # Save if requested
-    if save_results:
-        os.makedirs(base_dir, exist_ok=True)
-        tech_name = technology.get("name", "unknown").replace(" ", "_")
-        eval_file = osp.join(base_dir, f"evaluation_{tech_name}.json")
-        with open(eval_file, "w") as f:
-            json.dump(evaluation, f, indent=2)
-        print(f"  Evaluation saved to: {eval_file}")
+    Hashes the technology dict, the organization context, the model and the
+    prompt version (EVALUATION_PROMPT_VERSION and the text of the evaluation
+    prompts), so a stored evaluation is only reused while all four are
+    unchanged. Split and fused mode share fingerprints, as both produce the
+    same schema.
     
-    return evaluation
+    Args:
+        technology: Technology dictionary
+        organization_context: Resolved organization context
+        model: LLM model name
+    
+    Returns:
+        Hex SHA-256 digest
+    """
+    return _digest({
+        "technology": technology,
+        "organization_context": organization_context,
+        "model": model,
+        "prompt_version": _prompt_version(*SECTION_PROMPTS.values(), fused_evaluation_prompt),
+    })
+
+
+def section_fingerprint(section: str, technology: Dict, organization_context: Dict, model: str) -> str:
+    """
+    Content address of one evaluation section.
+    
+    Like evaluation_fingerprint(), but only the sections in
+    ORGANIZATION_SECTIONS include the organization context, so maturity and
+    competitive landscape results are shared by every organization context.
+    """
+    payload = {
+        "section": section,
+        "technology": technology,
+        "model": model,
+        "prompt_version": _prompt_version(SECTION_PROMPTS[section], fused_evaluation_prompt),
+    }
+    if section in ORGANIZATION_SECTIONS:
+        payload["organization_context"] = organization_context
+    return _digest(payload)
+
+
+def _load_json(path: str) -> Optional[Dict]:
+    if not osp.exists(path):
+        return None
+    try:
+        with open(path, "r") as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError) as e:
+        print(f"  Warning: ignoring unreadable stored result {path}: {e}")
+        return None
+
+
+def _dump_json(path: str, data: Dict) -> str:
+    os.makedirs(osp.dirname(path), exist_ok=True)
+    with open(path, "w") as f:
+        json.dump(data, f, indent=2)
+    return path
+
+
+def load_stored_evaluation(store_dir: str, fingerprint: str) -> Optional[Dict]:
+    """Return the evaluation stored under a fingerprint, or None if missing or unreadable."""
+    return _load_json(osp.join(store_dir, f"{fingerprint}.json"))
+
+
+def store_evaluation(store_dir: str, fingerprint: str, evaluation: Dict) -> str:
+    """Write an evaluation to <store_dir>/<fingerprint>.json and return the path."""
+    return _dump_json(osp.join(store_dir, f"{fingerprint}.json"), evaluation)
+
+
+def load_stored_sections(
+    store_dir: str, technology: Dict, organization_context: Dict, model: str
+) -> Dict[str, Dict]:
+    """Stored section results of a (technology, organization context) pair, by section."""
+    sections = {}
+    for section in EVALUATION_SECTIONS:
+        fingerprint = section_fingerprint(section, technology, organization_context, model)
+        result = _load_json(osp.join(store_dir, "sections", f"{fingerprint}.json"))
+        if result is not None:
+            sections[section] = result
+    return sections
+
+
+def store_section(
+    store_dir: str, section: str, technology: Dict, organization_context: Dict, model: str, result
+) -> bool:
+    """Store a section result if it passes validate_section; returns whether it was stored."""
+    if not validate_section(section, result):
+        return False
+    fingerprint = section_fingerprint(section, technology, organization_context, model)
+    _dump_json(osp.join(store_dir, "sections", f"{fingerprint}.json"), result)
+    return True
+
+
+def store_evaluation_results(store_dir: str, evaluation: Dict, organization_context: Dict, model: str):
+    """Store an evaluation's valid sections, and the evaluation itself if every section is valid."""
+    technology = evaluation["technology"]
+    stored = [
+        store_section(store_dir, section, technology, organization_context, model, evaluation.get(section))
+        for section in EVALUATION_SECTIONS
+    ]
+    if all(stored):
+        store_evaluation(store_dir, evaluation_fingerprint(technology, organization_context, model), evaluation)
+
+
+def evaluate_technologies_batch_api(
+    base_dir: str,
+    client,
+    model: str,
+    technologies: List[Dict],
+    organization_context: Optional[Dict] = None,
+    mode: str = "split",
+    save_individual: bool = True,
+    progress_callback: Optional[Callable[[int, int, Dict, Dict], None]] = None,
+    known_sections: Optional[List[Dict[str, Dict]]] = None,
+) -> List[Dict]:
+    """
+    Evaluate technologies through the provider's batch API.
+    
+    All prompts are collected and sent as one provider batch (see
+    llm.get_responses_from_llm_batch), which is cheaper than interactive
+    calls but may take hours. In fused mode, sections that fail validation
+    are sent in a second batch of per-section prompts; technologies with
+    known sections only get per-section prompts for the others. Results
+    are mapped back into the same evaluation schema as evaluate_technology().
+    
+    Args:
+        base_dir: Directory to save results
+        client: LLM client
+        model: LLM model name
+        technologies: List of technology dictionaries
+        organization_context: Organization context for all evaluations
+        mode: "split" or "fused"
+        save_individual: Write each evaluation to evaluation_<name>.json
+        progress_callback: Called with (completed, total, technology,
+            evaluation) as each evaluation is compiled
+        known_sections: Per technology, section results that need no
+            assessment
+    
+    Returns:
+        Evaluations in input order
+    """
+    if mode not in EVALUATION_MODES:
+        raise ValueError(f"Unknown evaluation mode {mode!r}; expected one of {EVALUATION_MODES}")
+    
+    organization_context = _resolve_organization_context(base_dir, organization_context)
+    evidence = [_default_evidence(tech) for tech in technologies]
+    results: List[Dict[str, object]] = [dict(known) for known in known_sections or [{} for _ in technologies]]
+    
+    fused = [index for index in range(len(technologies)) if not results[index]] if mode == "fused" else []
+    if fused:
+        texts = get_responses_from_llm_batch(
+            [fused_evaluation_request(technologies[index], organization_context, evidence[index]) for index in fused],
+            client,
+            model,
+        )
+        for index, text in zip(fused, texts):
+            if text is not None:
+                sections = parse_fused_evaluation(text)
+                results[index] = {section: value for section, value in sections.items() if value is not None}
+    
+    pending = [
+        (index, section)
+        for index in range(len(technologies))
+        for section in EVALUATION_SECTIONS
+        if section not in results[index]
+    ]
+    if pending:
+        texts = get_responses_from_llm_batch(
+            [
+                section_request(section, technologies[index], organization_context, evidence[index])
+                for index, section in pending
+            ],
+            client,
+            model,
+        )
+        for (index, section), text in zip(pending, texts):
+            if text is None:
+                results[index][section] = RuntimeError("batch request failed")
+            else:
+                results[index][section] = extract_json_between_markers(text)
+    
+    evaluations = []
+    for index, tech in enumerate(technologies):
+        evaluation = compile_evaluation(tech, results[index])
+        if save_individual:
+            save_evaluation(base_dir, evaluation)
+        evaluations.append(evaluation)
+        if progress_callback is not None:
+            progress_callback(index + 1, len(technologies), tech, evaluation)
+    return evaluations
 
 
 def generate_recommendation(
@@ -449,10 +1478,33 @@ def batch_evaluate_technologies(
     technologies: List[Dict],
     organization_context: Optional[Dict] = None,
     evaluation_criteria: Optional[List[Dict]] = None,
+    max_workers: int = 4,
+    progress_callback: Optional[Callable[[int, int, Dict, Dict], None]] = None,
+    save_individual: bool = True,
+    mode: str = "split",
+    use_batch_api: bool = False,
+    reuse_evaluations: bool = True,
+    store_dir: Optional[str] = None,
+    pack_strategic_fit: bool = False,
 ) -> Dict:
     """
     Evaluate and compare multiple technologies.
     
+    Technologies are evaluated concurrently on up to ``max_workers`` threads
+    (LLM calls stay within the per-provider limits). Each evaluation is
+    written to its own file as soon as it finishes, so an interrupted batch
+    keeps the finished work, and "individual_evaluations" follows the input
+    order whatever the completion order.
+    
+    Successful evaluations are also stored under their fingerprint (see
+    evaluation_fingerprint), and a technology whose fingerprint matches a
+    stored evaluation is not sent to the LLM again, so re-running on a
+    refreshed scouting run only evaluates new or changed technologies.
+    Sections are stored too, maturity and competitive landscape
+    independently of the organization context (see section_fingerprint),
+    so evaluating the same technologies for another organization only
+    re-runs strategic fit.
+    
     Args:
         base_dir: Directory to save results
         client: LLM client
@@ -460,52 +1512,361 @@ def batch_evaluate_technologies(
         technologies: List of technology dictionaries
         organization_context: Organization context for all evaluations
         evaluation_criteria: Criteria for comparison
+        max_workers: Technologies evaluated at once (1 = sequential)
+        progress_callback: Called in the calling thread as each technology
+            finishes, with (completed, total, technology, evaluation)
+        save_individual: Write each evaluation to evaluation_<name>.json
+        mode: "split" (one prompt per section) or "fused" (one prompt per
+            technology); see evaluate_technology()
+        use_batch_api: Submit all evaluation prompts through the provider's
+            batch API (see evaluate_technologies_batch_api) instead of
+            interactive calls; max_workers is then unused
+        reuse_evaluations: Reuse stored evaluations and sections with a
+            matching fingerprint; if False, every technology is evaluated again
+        store_dir: Evaluation store (default: default_evaluation_store_dir)
+        pack_strategic_fit: Score strategic fit for several technologies per
+            prompt (see evaluate_strategic_fit_packed) before the other
+            sections; fused mode then uses per-section prompts for the rest
     
     Returns:
-        Batch evaluation with comparisons
+        Batch evaluation with comparisons; "evaluation_reuse" counts the
+        evaluations reused, the ones evaluated in this run and the stored
+        sections they reused
     """
     print(f"Batch evaluating {len(technologies)} technologies...")
     
-    # Default criteria
     if evaluation_criteria is None:
-        evaluation_criteria = [
-            {"name": "strategic_fit", "weight": 0.3, "description": "Alignment with strategic priorities"},
-            {"name": "maturity", "weight": 0.2, "description": "Technology readiness level"},
-            {"name": "market_potential", "weight": 0.2, "description": "Market size and growth potential"},
-            {"name": "competitive_position", "weight": 0.15, "description": "Ability to achieve competitive advantage"},
-            {"name": "implementation_feasibility", "weight": 0.15, "description": "Ease of implementation"},
+        evaluation_criteria = DEFAULT_EVALUATION_CRITERIA
+    
+    # Reuse stored evaluations of unchanged technologies
+    organization_context = _resolve_organization_context(base_dir, organization_context)
+    store_dir = store_dir or default_evaluation_store_dir(base_dir)
+    evaluations: List[Optional[Dict]] = [None] * len(technologies)
+    if reuse_evaluations:
+        evaluations = [
+            load_stored_evaluation(store_dir, evaluation_fingerprint(tech, organization_context, model))
+            for tech in technologies
         ]
+    pending = [index for index, evaluation in enumerate(evaluations) if evaluation is None]
     
-    # Evaluate each technology
-    evaluations = []
-    for tech in technologies:
-        eval_result = evaluate_technology(
-            base_dir, client, model, tech, organization_context, save_results=False
+    # Of the rest, reuse stored sections (maturity and competitive landscape
+    # are shared across organization contexts)
+    known_sections = {
+        index: load_stored_sections(store_dir, technologies[index], organization_context, model)
+        if reuse_evaluations else {}
+        for index in pending
+    }
+    reuse = {
+        "reused": len(technologies) - len(pending),
+        "evaluated": len(pending),
+        "reused_sections": sum(len(known) for known in known_sections.values()),
+    }
+    print(f"Reusing {reuse['reused']} stored evaluations and {reuse['reused_sections']} stored sections; "
+          f"evaluating {reuse['evaluated']} new or changed technologies")
+    
+    # Score the missing strategic fits several technologies to a prompt
+    fit_pending = [index for index in pending if "strategic_fit" not in known_sections[index]]
+    if pack_strategic_fit and len(fit_pending) > 1:
+        fits = evaluate_strategic_fit_packed(
+            client,
+            model,
+            [(technologies[index], organization_context) for index in fit_pending],
+            max_workers=max_workers,
+            use_batch_api=use_batch_api,
+        )
+        for index, fit in zip(fit_pending, fits):
+            if validate_section("strategic_fit", fit):
+                known_sections[index]["strategic_fit"] = fit
+    
+    completed = 0
+    
+    def finish(index: int, evaluation: Dict, is_new: bool):
+        nonlocal completed
+        evaluations[index] = evaluation
+        if is_new:
+            store_evaluation_results(store_dir, evaluation, organization_context, model)
+        completed += 1
+        if progress_callback is not None:
+            progress_callback(completed, len(technologies), technologies[index], evaluation)
+    
+    for index, evaluation in enumerate(evaluations):
+        if evaluation is not None:
+            # Keep the per-technology files current alongside the batch results
+            if save_individual:
+                save_evaluation(base_dir, evaluation)
+            finish(index, evaluation, is_new=False)
+    
+    # Evaluate the rest
+    if use_batch_api and pending:
+        new_evaluations = evaluate_technologies_batch_api(
+            base_dir,
+            client,
+            model,
+            [technologies[index] for index in pending],
+            organization_context,
+            mode=mode,
+            save_individual=save_individual,
+            known_sections=[known_sections[index] for index in pending],
         )
-        evaluations.append(eval_result)
+        for index, evaluation in zip(pending, new_evaluations):
+            finish(index, evaluation, is_new=True)
+    elif pending:
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(pending)))) as executor:
+            futures = {
+                executor.submit(
+                    evaluate_technology,
+                    base_dir,
+                    client,
+                    model,
+                    technologies[index],
+                    organization_context,
+                    save_results=save_individual,
+                    mode=mode,
+                    known_sections=known_sections[index],
+                ): index
+                for index in pending
+            }
+            for future in as_completed(futures):
+                finish(futures[future], future.result(), is_new=True)
     
     # Compare technologies
     print("\nComparing technologies...")
-    comparison = compare_technologies(client, model, technologies, evaluation_criteria)
+    comparison = compare_technologies(client, model, technologies, evaluation_criteria, evaluations)
     
-    # Compile batch results
     batch_results = {
         "evaluation_date": datetime.now().isoformat(),
         "technologies_evaluated": len(technologies),
+        "evaluation_reuse": reuse,
         "evaluation_criteria": evaluation_criteria,
         "individual_evaluations": evaluations,
         "comparison": comparison,
     }
+    results_file = save_batch_results(base_dir, batch_results)
     
-    # Save results
+    print(f"\nBatch evaluation complete. Results saved to: {results_file}")
+    
+    return batch_results
+
+
+def save_batch_results(base_dir: str, batch_results: Dict) -> str:
+    """Write batch results to base_dir/batch_evaluation_results.json and return the path."""
     os.makedirs(base_dir, exist_ok=True)
     results_file = osp.join(base_dir, "batch_evaluation_results.json")
     with open(results_file, "w") as f:
         json.dump(batch_results, f, indent=2)
+    return results_file
+
+
+def assess_sections(
+    client,
+    model: str,
+    jobs: List[Tuple[str, Dict, Dict]],
+    max_workers: int = 4,
+    use_batch_api: bool = False,
+    pack_strategic_fit: bool = False,
+) -> List[object]:
+    """
+    Run many independent section assessments.
     
-    print(f"\nBatch evaluation complete. Results saved to: {results_file}")
+    Args:
+        client: LLM client
+        model: LLM model name
+        jobs: (section, technology, organization_context) tuples
+        max_workers: Assessments run at once (interactive calls)
+        use_batch_api: Submit all prompts as one provider batch instead
+        pack_strategic_fit: Score the strategic fit jobs several to a
+            prompt (see evaluate_strategic_fit_packed)
     
-    return batch_results
+    Returns:
+        Result per job, in order; an Exception where an assessment failed
+    """
+    fit_jobs = [index for index, job in enumerate(jobs) if job[0] == "strategic_fit"]
+    if pack_strategic_fit and len(fit_jobs) > 1:
+        fit_set = set(fit_jobs)
+        other_jobs = [index for index in range(len(jobs)) if index not in fit_set]
+        fits, others = run_parallel(
+            [
+                lambda: evaluate_strategic_fit_packed(
+                    client, model, [jobs[index][1:] for index in fit_jobs], max_workers, use_batch_api
+                ),
+                lambda: assess_sections(
+                    client, model, [jobs[index] for index in other_jobs], max_workers, use_batch_api
+                ),
+            ],
+            max_workers=2,
+        )
+        results: List[object] = [None] * len(jobs)
+        for index, result in zip(fit_jobs + other_jobs, list(fits) + list(others)):
+            results[index] = result
+        return results
+    
+    if not jobs:
+        return []
+    if use_batch_api:
+        texts = get_responses_from_llm_batch(
+            [
+                section_request(section, technology, organization_context, _default_evidence(technology))
+                for section, technology, organization_context in jobs
+            ],
+            client,
+            model,
+        )
+        return [
+            RuntimeError("batch request failed") if text is None else extract_json_between_markers(text)
+            for text in texts
+        ]
+    
+    section_functions = {
+        "maturity_assessment": lambda tech, _: assess_maturity(client, model, tech, _default_evidence(tech)),
+        "strategic_fit": lambda tech, org: evaluate_strategic_fit(client, model, tech, org),
+        "competitive_landscape": lambda tech, _: analyze_competitive_landscape(client, model, tech),
+    }
+    return run_parallel(
+        [
+            lambda job=job: section_functions[job[0]](job[1], job[2])
+            for job in jobs
+        ],
+        max_workers=max_workers,
+        return_exceptions=True,
+    )
+
+
+def evaluate_for_organizations(
+    base_dir: str,
+    client,
+    model: str,
+    technologies: List[Dict],
+    organization_contexts: Dict[str, Dict],
+    evaluation_criteria: Optional[List[Dict]] = None,
+    max_workers: int = 4,
+    use_batch_api: bool = False,
+    reuse_evaluations: bool = True,
+    save_individual: bool = True,
+    pack_strategic_fit: bool = True,
+) -> Dict[str, Dict]:
+    """
+    Evaluate one set of technologies against several organization contexts.
+    
+    Maturity and competitive landscape do not depend on the organization,
+    so they are assessed once per technology (or taken from the store) and
+    shared; only strategic fit is assessed per (technology, organization)
+    pair, several pairs to a prompt unless ``pack_strategic_fit`` is False.
+    All assessments of the run go out together, so they run concurrently.
+    The comparison does not depend on the organization either and is made
+    once.
+    
+    Args:
+        base_dir: Directory for the shared evaluation store; each
+            organization's results go to base_dir/<organization name>
+        client: LLM client
+        model: LLM model name
+        technologies: List of technology dictionaries
+        organization_contexts: Organization context by organization name
+            (e.g. business unit)
+        evaluation_criteria: Criteria for comparison
+        max_workers: Assessments run at once
+        use_batch_api: Submit all assessments as one provider batch
+        reuse_evaluations: Reuse stored evaluations and sections
+        save_individual: Write each evaluation to
+            base_dir/<organization name>/evaluation_<name>.json
+        pack_strategic_fit: Score several pairs per strategic fit prompt
+            (see evaluate_strategic_fit_packed)
+    
+    Returns:
+        Batch evaluation (as returned by batch_evaluate_technologies) by
+        organization name
+    """
+    print(f"Evaluating {len(technologies)} technologies for {len(organization_contexts)} organizations...")
+    
+    if evaluation_criteria is None:
+        evaluation_criteria = DEFAULT_EVALUATION_CRITERIA
+    store_dir = default_evaluation_store_dir(base_dir)
+    pairs = [(name, index) for name in organization_contexts for index in range(len(technologies))]
+    
+    # Reuse stored evaluations and sections
+    evaluations: Dict[Tuple[str, int], Optional[Dict]] = {}
+    sections: Dict[Tuple, object] = {}
+    for name, index in pairs:
+        technology, organization_context = technologies[index], organization_contexts[name]
+        evaluations[name, index] = None
+        if reuse_evaluations:
+            evaluations[name, index] = load_stored_evaluation(
+                store_dir, evaluation_fingerprint(technology, organization_context, model)
+            )
+        if evaluations[name, index] is None and reuse_evaluations:
+            for section, result in load_stored_sections(store_dir, technology, organization_context, model).items():
+                sections[_section_key(section, name, index)] = result
+    pending = [pair for pair in pairs if evaluations[pair] is None]
+    
+    # Assess what is missing: organization-independent sections once per
+    # technology, strategic fit once per pair
+    jobs: Dict[Tuple, Tuple[str, Dict, Dict]] = {}
+    for name, index in pending:
+        for section in EVALUATION_SECTIONS:
+            key = _section_key(section, name, index)
+            if key not in sections:
+                jobs[key] = (section, technologies[index], organization_contexts[name])
+    reused_sections = len(sections)
+    print(f"Reusing {len(pairs) - len(pending)} stored evaluations and {reused_sections} stored sections; "
+          f"running {len(jobs)} assessments")
+    
+    outcomes = assess_sections(client, model, list(jobs.values()), max_workers, use_batch_api, pack_strategic_fit)
+    for key, (section, technology, organization_context), outcome in zip(jobs, jobs.values(), outcomes):
+        sections[key] = outcome
+        store_section(store_dir, section, technology, organization_context, model, outcome)
+    
+    # Compile the evaluations of every pair
+    for name, index in pending:
+        evaluation = compile_evaluation(
+            technologies[index],
+            {section: sections[_section_key(section, name, index)] for section in EVALUATION_SECTIONS},
+        )
+        if all(validate_section(section, evaluation[section]) for section in EVALUATION_SECTIONS):
+            store_evaluation(
+                store_dir, evaluation_fingerprint(technologies[index], organization_contexts[name], model), evaluation
+            )
+        evaluations[name, index] = evaluation
+    
+    # Write reused evaluations too, so the per-technology files stay current
+    if save_individual:
+        for name, index in pairs:
+            save_evaluation(osp.join(base_dir, name), evaluations[name, index])
+    
+    # Anchors are spread over one organization's scores; the maturity and
+    # competitive sections behind them are shared by every organization
+    print("\nComparing technologies...")
+    first = next(iter(organization_contexts), None)
+    comparison = compare_technologies(
+        client,
+        model,
+        technologies,
+        evaluation_criteria,
+        [evaluations[first, index] for index in range(len(technologies))] if first is not None else None,
+    )
+    
+    results = {}
+    for name in organization_contexts:
+        org_pending = sum(1 for pair in pending if pair[0] == name)
+        results[name] = {
+            "evaluation_date": datetime.now().isoformat(),
+            "organization": name,
+            "technologies_evaluated": len(technologies),
+            "evaluation_reuse": {"reused": len(technologies) - org_pending, "evaluated": org_pending},
+            "evaluation_criteria": evaluation_criteria,
+            "individual_evaluations": [evaluations[name, index] for index in range(len(technologies))],
+            "comparison": comparison,
+        }
+        results_file = save_batch_results(osp.join(base_dir, name), results[name])
+        print(f"  {name}: results saved to {results_file}")
+    
+    return results
+
+
+def _section_key(section: str, organization: str, index: int) -> Tuple:
+    """Identity of a section result within a run: organization-independent sections are shared."""
+    if section in ORGANIZATION_SECTIONS:
+        return (section, organization, index)
+    return (section, None, index)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,237 @@
+"""
+Evidence Packing Module
+
+This module encodes papers, patents and news for LLM prompts. Instead of
+pretty-printed JSON, each record becomes one line of projected fields
+(``P1 | title | year | venue | ...``) with long text truncated, and records
+are added in ranked order until a per-model token budget is spent, so the
+number of records sent follows the model's context window rather than
+fixed slice counts.
+
+Token counts are estimated locally (about four characters per token for
+Latin text and one per character elsewhere), so packing needs no tokenizer
+or API call.
+"""
+
+import json
+import math
+import os
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from tech_scout.llm import MAX_NUM_TOKENS, get_context_window
+
+# Fields projected into each record line, in order
+FIELDS = {
+    "papers": ("title", "year", "venue", "citations", "authors", "abstract"),
+    "patents": ("title", "patent_number", "date", "assignees", "abstract"),
+    "news": ("title", "source", "published_at", "description"),
+}
+
+# Line ID prefix per kind ("P12"), so responses can cite individual records
+ID_PREFIXES = {"papers": "P", "patents": "T", "news": "N"}
+
+# Long text fields are cut to this many words
+TEXT_WORDS = 60
+TEXT_FIELDS = ("abstract", "description")
+
+# Names listed per record before "et al."
+MAX_NAMES = 3
+
+# Upper bound on evidence tokens per prompt, whatever the context window
+MAX_EVIDENCE_TOKENS = int(os.getenv("TECHSCOUT_EVIDENCE_TOKENS", "24000"))
+
+# Share of the model's input window that evidence may fill
+EVIDENCE_CONTEXT_SHARE = 0.5
+
+# Initial split of the budget between kinds; budget a kind does not use is
+# handed to the others
+DEFAULT_SHARES = {"papers": 0.45, "patents": 0.3, "news": 0.25}
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimate the token count of text: ~4 ASCII characters per token, 1 per other character."""
+    ascii_chars = len(text.encode("ascii", "ignore"))
+    return math.ceil(ascii_chars / 4) + (len(text) - ascii_chars)
+
+
+def evidence_token_budget(model: str, reserved_tokens: int = 0) -> int:
+    """
+    Token budget for evidence in a prompt to ``model``.
+
+    Args:
+        model: Model or client model name
+        reserved_tokens: Tokens already used by the rest of the prompt
+
+    Returns:
+        EVIDENCE_CONTEXT_SHARE of the input window (after the response
+        allowance), capped at MAX_EVIDENCE_TOKENS, minus reserved_tokens
+    """
+    window = get_context_window(model) - MAX_NUM_TOKENS
+    return max(0, min(MAX_EVIDENCE_TOKENS, int(window * EVIDENCE_CONTEXT_SHARE)) - reserved_tokens)
+
+
+def compact_json(data) -> str:
+    """JSON without indentation or spaces after separators, keeping non-ASCII text as is."""
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":"), default=str)
+
+
+def _names(value) -> str:
+    items = value if isinstance(value, list) else [value]
+    names = []
+    for item in items:
+        if isinstance(item, dict):
+            item = item.get("name") or item.get("extracted_name") or ""
+            if isinstance(item, dict):
+                item = item.get("value", "")
+        if item:
+            names.append(str(item))
+    if len(names) > MAX_NAMES:
+        return ", ".join(names[:MAX_NAMES]) + " et al."
+    return ", ".join(names)
+
+
+def _short_date(value: str) -> str:
+    # "Mon, 01 Jan 2024 10:00:00 GMT" -> "Mon, 01 Jan 2024"; ISO -> "2024-01-01"
+    parts = value.split()
+    return " ".join(parts[:4]) if len(parts) > 1 else value[:10]
+
+
+def _field(record: Dict, field: str) -> str:
+    value = record.get(field)
+    if value is None or value == "" or value == []:
+        return ""
+    if field in ("authors", "assignees"):
+        text = _names(value)
+    elif field in ("date", "published_at"):
+        text = _short_date(str(value))
+    else:
+        text = str(value)
+    if field in TEXT_FIELDS:
+        words = text.split()
+        if len(words) > TEXT_WORDS:
+            text = " ".join(words[:TEXT_WORDS]) + "…"
+    # Keep one record per line and the column separator unambiguous
+    return " ".join(text.replace("|", "/").split())
+
+
+def format_record(record: Dict, kind: str, index: int) -> str:
+    """Encode one record as a compact line, e.g. "P3 | Title | 2024 | Venue | 12 | A, B | Abstract…"."""
+    values = [_field(record, field) for field in FIELDS[kind]]
+    return " | ".join([f"{ID_PREFIXES[kind]}{index}"] + values)
+
+
+def section_header(kind: str) -> str:
+    """Column legend line for a kind's records."""
+    return "# " + " | ".join(("id",) + FIELDS[kind])
+
+
+def _pack(
+    records: Sequence[Dict], kind: str, start: int, allowance: int, lines: List[str]
+) -> Tuple[int, int]:
+    """Append record lines from ``start`` while they fit; returns (next position, tokens used)."""
+    used = 0
+    position = start
+    while position < len(records):
+        line = format_record(records[position], kind, position + 1)
+        cost = estimate_tokens(line) + 1
+        if used + cost > allowance:
+            break
+        lines.append(line)
+        used += cost
+        position += 1
+    return position, used
+
+
+def pack_evidence(
+    sections: Dict[str, Sequence[Dict]],
+    budget: int,
+    shares: Optional[Dict[str, float]] = None,
+) -> Dict:
+    """
+    Pack ranked records of several kinds into compact text within a token budget.
+
+    Each kind first fills its share of the budget in ranked order; budget
+    left over (e.g. because a kind had few records) then goes to the kinds
+    that still have records, in the order given.
+
+    Args:
+        sections: Records per kind ("papers", "patents", "news"), best first
+        budget: Token budget for all sections together
+        shares: Initial budget share per kind (defaults to DEFAULT_SHARES)
+
+    Returns:
+        Dict with "text" (packed block per kind, headed by its column
+        legend, or "(none)"), "counts" (records packed per kind),
+        "available" (records offered per kind), "tokens" (estimated tokens
+        used) and "budget"
+    """
+    shares = {kind: (shares or DEFAULT_SHARES).get(kind, 0.0) for kind in sections}
+    total_share = sum(shares.values()) or 1.0
+
+    lines = {kind: [section_header(kind)] for kind in sections}
+    positions = {kind: 0 for kind in sections}
+    used = sum(estimate_tokens(lines[kind][0]) + 1 for kind in sections)
+    records_budget = max(0, budget - used)
+
+    for kind, records in sections.items():
+        allowance = int(records_budget * shares[kind] / total_share)
+        positions[kind], spent = _pack(records, kind, 0, allowance, lines[kind])
+        used += spent
+    for kind, records in sections.items():
+        positions[kind], spent = _pack(
+            records, kind, positions[kind], max(0, budget - used), lines[kind]
+        )
+        used += spent
+
+    return {
+        "text": {
+            kind: "\n".join(lines[kind]) if positions[kind] else "(none)"
+            for kind in sections
+        },
+        "counts": dict(positions),
+        "available": {kind: len(records) for kind, records in sections.items()},
+        "tokens": used,
+        "budget": budget,
+    }
+
+
+def build_evidence_shards(
+    sections: Dict[str, Sequence[Dict]],
+    budget: int,
+    max_shards: Optional[int] = None,
+    shares: Optional[Dict[str, float]] = None,
+) -> List[Dict]:
+    """
+    Split ranked records into consecutive prompt-sized shards.
+
+    Each shard is a pack_evidence() result over the records not yet packed,
+    so shards follow the ranking: the first holds the best records of every
+    kind. Stops once every record is packed, after ``max_shards`` shards, or
+    when the budget cannot fit a single further record.
+
+    Args:
+        sections: Records per kind, best first
+        budget: Token budget per shard
+        max_shards: Maximum number of shards (None = no limit)
+        shares: Initial budget share per kind (defaults to DEFAULT_SHARES)
+
+    Returns:
+        List of pack_evidence() results
+    """
+    remaining = {kind: list(records) for kind, records in sections.items()}
+    shards = []
+    while any(remaining.values()) and (max_shards is None or len(shards) < max_shards):
+        packed = pack_evidence(remaining, budget, shares)
+        if not any(packed["counts"].values()):
+            break
+        shards.append(packed)
+        remaining = {kind: records[packed["counts"][kind]:] for kind, records in remaining.items()}
+    return shards
+
+
+def describe_packing(packed: Dict) -> str:
+    """One-line summary, e.g. "118/200 papers, 40/40 patents, 35/120 news (~23,950/24,000 tokens)"."""
+    counts = ", ".join(
+        f"{packed['counts'][kind]}/{packed['available'][kind]} {kind}" for kind in packed["counts"]
+    )
+    return f"{counts} (~{packed['tokens']:,}/{packed['budget']:,} tokens)"
@@ -11,7 +11,25 @@ import os.path as osp
 from typing import List, Dict, Optional
 from datetime import datetime
 
-from tech_scout.llm import get_response_from_llm, extract_json_between_markers
+from tech_scout.corpus_store import CorpusStore, corpus_record_key
+from tech_scout.evidence import (
+    compact_json,
+    describe_packing,
+    estimate_tokens,
+    evidence_token_budget,
+    pack_evidence,
+)
+from tech_scout.llm import (
+    get_response_from_llm,
+    get_responses_from_llm_batch,
+    extract_json_between_markers,
+)
+from tech_scout.parallel import run_parallel
+from tech_scout.ranking import rank_records
+from tech_scout.scout_technologies import PROMPT_LIMITS, SEARCH_SOURCES
+
+# Corpus records per kind matched for each technology in the detailed report
+REPORT_EVIDENCE_LIMITS = {"papers": 10, "patents": 10, "news": 10}
 
 # =============================================================================
 # REPORT GENERATION PROMPTS
@@ -65,6 +83,21 @@ detailed_report_prompt = """You are a technology analyst preparing a detailed sc
 {scouting_data}
 </scouting_data>
 
+Supporting sources (one record per line; the "#" line names the fields, and long
+abstracts are truncated with "…"):
+
+<academic_papers>
+{papers}
+</academic_papers>
+
+<patents>
+{patents}
+</patents>
+
+<news_articles>
+{news}
+</news_articles>
+
 <evaluations>
 {evaluations}
 </evaluations>
@@ -171,8 +204,8 @@ def generate_executive_summary(
             focus_areas=", ".join(scouting_results.get("focus_areas", [])),
             tech_count=len(technologies),
             date=scouting_results.get("scouting_date", datetime.now().isoformat()),
-            top_technologies=json.dumps(top_techs, indent=2),
-            trends=json.dumps(trends, indent=2),
+            top_technologies=compact_json(top_techs),
+            trends=compact_json(trends),
         ),
         client=client,
         model=model,
@@ -215,19 +248,74 @@ def generate_technology_brief(
         Markdown formatted technology brief
     """
     text, _ = get_response_from_llm(
-        technology_brief_prompt.format(
-            technology=json.dumps(technology, indent=2),
-            evaluation=json.dumps(evaluation, indent=2) if evaluation else "No evaluation available",
-        ),
         client=client,
         model=model,
-        system_message="You are a technology analyst creating accessible briefing documents.",
         msg_history=[],
+        **technology_brief_request(technology, evaluation),
     )
     
     return text
 
 
+def technology_brief_request(technology: Dict, evaluation: Optional[Dict] = None) -> Dict:
+    """Prompt ("msg") and "system_message" of generate_technology_brief()."""
+    return {
+        "msg": technology_brief_prompt.format(
+            technology=compact_json(technology),
+            evaluation=compact_json(evaluation) if evaluation else "No evaluation available",
+        ),
+        "system_message": "You are a technology analyst creating accessible briefing documents.",
+    }
+
+
+def generate_technology_briefs(
+    client,
+    model: str,
+    technologies: List[Dict],
+    evaluations: Optional[List[Optional[Dict]]] = None,
+    use_batch_api: bool = False,
+    max_workers: int = 4,
+) -> List[Optional[str]]:
+    """
+    Generate one-page briefs for many technologies.
+    
+    Args:
+        client: LLM client
+        model: LLM model name
+        technologies: Technology dictionaries
+        evaluations: Optional evaluation per technology (same order)
+        use_batch_api: Send all prompts as one provider batch (cheaper,
+            slower; see llm.get_responses_from_llm_batch)
+        max_workers: Concurrent interactive calls when not batching
+    
+    Returns:
+        Markdown brief per technology, in input order (None where its
+        request failed)
+    """
+    evaluations = evaluations or [None] * len(technologies)
+    if use_batch_api:
+        return get_responses_from_llm_batch(
+            [technology_brief_request(tech, evaluation) for tech, evaluation in zip(technologies, evaluations)],
+            client,
+            model,
+        )
+    outcomes = run_parallel(
+        [
+            lambda tech=tech, evaluation=evaluation: generate_technology_brief(client, model, tech, evaluation)
+            for tech, evaluation in zip(technologies, evaluations)
+        ],
+        max_workers=max_workers,
+        return_exceptions=True,
+    )
+    briefs = []
+    for tech, outcome in zip(technologies, outcomes):
+        if isinstance(outcome, Exception):
+            print(f"  Warning: brief for {tech.get('name', 'technology')} failed: {outcome}")
+            outcome = None
+        briefs.append(outcome)
+    return briefs
+
+
 def generate_comparison_table(
     client,
     model: str,
@@ -248,8 +336,8 @@ def generate_comparison_table(
     """
     text, _ = get_response_from_llm(
         comparison_table_prompt.format(
-            technologies=json.dumps(technologies, indent=2),
-            criteria=json.dumps(criteria, indent=2),
+            technologies=compact_json(technologies),
+            criteria=compact_json(criteria),
         ),
         client=client,
         model=model,
@@ -260,6 +348,46 @@ def generate_comparison_table(
     return text
 
 
+def report_evidence(scouting_results: Dict, corpus: Optional[CorpusStore] = None) -> Dict[str, List[Dict]]:
+    """
+    Evidence records per kind for the detailed report, best first.
+    
+    Without a corpus, the run's raw data is ranked against the domain and
+    focus areas. With one, each technology's best full-text matches are
+    taken round-robin, so every technology has evidence before any gets
+    a second record.
+    """
+    if corpus is None:
+        raw_data = scouting_results.get("raw_data") or {}
+        return {
+            kind: rank_records(
+                raw_data.get(kind) or [],
+                scouting_results.get("domain", ""),
+                scouting_results.get("focus_areas") or [],
+                PROMPT_LIMITS[kind],
+            )
+            for kind in SEARCH_SOURCES
+        }
+    
+    matches = [
+        corpus.evidence_for(tech, limits=REPORT_EVIDENCE_LIMITS, domain=scouting_results.get("domain"))
+        for tech in scouting_results.get("technologies") or []
+    ]
+    evidence = {}
+    for kind in SEARCH_SOURCES:
+        records, seen = [], set()
+        for rank in range(REPORT_EVIDENCE_LIMITS[kind]):
+            for tech_matches in matches:
+                if rank < len(tech_matches[kind]):
+                    record = tech_matches[kind][rank]
+                    key = corpus_record_key(record, kind)
+                    if key not in seen:
+                        seen.add(key)
+                        records.append(record)
+        evidence[kind] = records
+    return evidence
+
+
 def generate_scouting_report(
     base_dir: str,
     client,
@@ -267,6 +395,7 @@ def generate_scouting_report(
     scouting_results: Dict,
     evaluations: Optional[List[Dict]] = None,
     output_format: str = "markdown",
+    corpus: Optional[CorpusStore] = None,
 ) -> str:
     """
     Generate a comprehensive technology scouting report.
@@ -278,6 +407,9 @@ def generate_scouting_report(
         scouting_results: Results from scout_technologies
         evaluations: Optional list of evaluation results
         output_format: Output format ("markdown", "html", "json")
+        corpus: Optional corpus store; when given, the detailed analysis gets
+            the best-matching records for each technology instead of the
+            run's top-ranked raw data
     
     Returns:
         Path to the generated report
@@ -288,12 +420,24 @@ def generate_scouting_report(
     print("  Generating executive summary...")
     exec_summary = generate_executive_summary(client, model, scouting_results, evaluations)
     
-    # Generate the detailed report
+    # Generate the detailed report; evidence fills the model's token budget
+    # after the scouting data and evaluations
     print("  Generating detailed analysis...")
+    scouting_data = compact_json({k: v for k, v in scouting_results.items() if k != "raw_data"})
+    evaluations_str = compact_json(evaluations) if evaluations else "No evaluations available"
+    budget = evidence_token_budget(
+        model,
+        reserved_tokens=estimate_tokens(detailed_report_prompt + scouting_data + evaluations_str),
+    )
+    packed = pack_evidence(report_evidence(scouting_results, corpus), budget)
+    print(f"  Evidence for the LLM: {describe_packing(packed)}")
     text, _ = get_response_from_llm(
         detailed_report_prompt.format(
-            scouting_data=json.dumps(scouting_results, indent=2),
-            evaluations=json.dumps(evaluations, indent=2) if evaluations else "No evaluations available",
+            scouting_data=scouting_data,
+            papers=packed["text"]["papers"],
+            patents=packed["text"]["patents"],
+            news=packed["text"]["news"],
+            evaluations=evaluations_str,
         ),
         client=client,
         model=model,
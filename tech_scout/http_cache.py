@@ -0,0 +1,372 @@
+"""
+HTTP Response Cache Module
+
+This module provides a persistent, SQLite-backed cache for search responses
+so re-running a template does not refetch the same OpenAlex, J-STAGE, RSS or
+Lens results. Entries are keyed on the normalized endpoint and parameters,
+expire after a per-source TTL, and the cache is trimmed to a maximum size by
+evicting the least recently used entries.
+
+Client errors (e.g. 404) and searches that returned no results are stored
+as short-lived negative entries so a broken query is not retried on every
+run. Transient failures (408, 429, 5xx) are not stored, so retries refetch.
+"""
+
+import hashlib
+import json
+import os
+import os.path as osp
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterator, Optional, Tuple
+from urllib.parse import parse_qsl, urlparse
+
+import requests
+
+# Time-to-live per source type, in seconds
+SOURCE_TTLS = {
+    "papers": 7 * 24 * 3600,
+    "patents": 3 * 24 * 3600,
+    "news": 3600,
+}
+
+# Source type of each search host (hosts not listed are cached as "default")
+HOST_SOURCES = {
+    "api.openalex.org": "papers",
+    "api.semanticscholar.org": "papers",
+    "api.jstage.jst.go.jp": "papers",
+    "api.lens.org": "patents",
+    "ops.epo.org": "patents",
+    "serpapi.com": "patents",
+    "news.google.com": "news",
+    "newsapi.org": "news",
+}
+
+DEFAULT_TTL = 24 * 3600
+
+# Lifetime of negative entries (client error statuses and empty result sets)
+NEGATIVE_TTL = 15 * 60
+
+DEFAULT_MAX_BYTES = int(os.getenv("TECHSCOUT_CACHE_MAX_MB", "256")) * 1024 * 1024
+
+# Parameters that carry credentials or contact details, not search semantics
+IGNORED_PARAMS = {"api_key", "apikey", "mailto", "affiliate"}
+
+
+def make_cache_key(
+    method: str,
+    url: str,
+    params: Optional[Dict] = None,
+    json_body: Optional[Dict] = None,
+    extra: Optional[Dict] = None,
+) -> str:
+    """
+    Build a cache key from the normalized endpoint and parameters.
+
+    The scheme and host are lowercased, query-string and ``params`` values
+    are merged and sorted, credential parameters are dropped, and JSON bodies
+    are serialized with sorted keys, so equivalent requests share one key.
+
+    Args:
+        method: HTTP method
+        url: Request URL (may include a query string)
+        params: Query parameters
+        json_body: JSON request body
+        extra: Additional values that change the cached content (e.g. a
+            client-side result limit)
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    parsed = urlparse(url)
+    query = parse_qsl(parsed.query, keep_blank_values=True)
+    query.extend((k, str(v)) for k, v in (params or {}).items() if v is not None)
+    query = sorted((k, v) for k, v in query if k.lower() not in IGNORED_PARAMS)
+
+    normalized = {
+        "method": method.upper(),
+        "endpoint": f"{parsed.scheme.lower()}://{(parsed.hostname or '').lower()}"
+                    f"{parsed.path.rstrip('/') or '/'}",
+        "query": query,
+        "json": json_body,
+        "extra": extra,
+    }
+    encoded = json.dumps(normalized, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+class CachedResponse:
+    """Minimal stand-in for ``requests.Response`` served from the cache."""
+
+    from_cache = True
+
+    def __init__(self, url: str, status_code: int, headers: Dict, content: bytes, cache_key: str):
+        self.url = url
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+        self.cache_key = cache_key
+
+    @property
+    def text(self) -> str:
+        return self.content.decode("utf-8", errors="replace")
+
+    def json(self):
+        return json.loads(self.content)
+
+    def iter_content(self, chunk_size: int = 65536) -> Iterator[bytes]:
+        for start in range(0, len(self.content), chunk_size):
+            yield self.content[start:start + chunk_size]
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.exceptions.HTTPError(
+                f"{self.status_code} Error (cached) for url: {self.url}", response=self
+            )
+
+    def close(self):
+        pass
+
+
+class ResponseCache:
+    """
+    Persistent response cache with TTLs and size-based LRU eviction.
+
+    Safe to share across threads; SQLite's WAL mode lets several processes
+    use the same cache directory.
+    """
+
+    def __init__(self, cache_dir: str, max_bytes: int = DEFAULT_MAX_BYTES):
+        os.makedirs(cache_dir, exist_ok=True)
+        self.cache_dir = cache_dir
+        self.path = osp.join(cache_dir, "responses.sqlite")
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                url TEXT,
+                source TEXT,
+                status INTEGER,
+                headers TEXT,
+                body BLOB,
+                size INTEGER,
+                created REAL,
+                expires REAL,
+                last_access REAL
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_responses_last_access ON responses (last_access)"
+        )
+        self._conn.commit()
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        """Return the cached response for a key, or None if missing or expired."""
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT url, status, headers, body, expires FROM responses WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None or row[4] < now:
+                self.misses += 1
+                return None
+            self._conn.execute(
+                "UPDATE responses SET last_access = ? WHERE key = ?", (now, key)
+            )
+            self._conn.commit()
+            self.hits += 1
+        url, status, headers, body, _ = row
+        return CachedResponse(url, status, json.loads(headers), body, key)
+
+    def put(
+        self,
+        key: str,
+        url: str,
+        status: int,
+        headers: Dict,
+        body: bytes,
+        ttl: Optional[float] = None,
+    ):
+        """
+        Store a response. Error statuses are stored with NEGATIVE_TTL.
+
+        Args:
+            key: Cache key from make_cache_key()
+            url: Request URL (for inspection only)
+            status: HTTP status code
+            headers: Response headers to keep
+            body: Raw response body
+            ttl: Override for the source TTL
+        """
+        host = (urlparse(url).hostname or "").lower()
+        source = HOST_SOURCES.get(host, "default")
+        if status >= 400:
+            ttl = NEGATIVE_TTL
+        elif ttl is None:
+            ttl = SOURCE_TTLS.get(source, DEFAULT_TTL)
+
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses "
+                "(key, url, source, status, headers, body, size, created, expires, last_access) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (key, url, source, status, json.dumps(headers), body, len(body),
+                 now, now + ttl, now),
+            )
+            self._conn.commit()
+            self._evict()
+
+    def mark_negative(self, key: str):
+        """Shorten an entry's lifetime to NEGATIVE_TTL (e.g. for empty results)."""
+        with self._lock:
+            self._conn.execute(
+                "UPDATE responses SET expires = MIN(expires, created + ?) WHERE key = ?",
+                (NEGATIVE_TTL, key),
+            )
+            self._conn.commit()
+
+    def _evict(self):
+        """Drop expired entries, then least recently used ones until under max_bytes."""
+        self._conn.execute("DELETE FROM responses WHERE expires < ?", (time.time(),))
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        while total > self.max_bytes:
+            rows = self._conn.execute(
+                "SELECT key, size FROM responses ORDER BY last_access LIMIT 64"
+            ).fetchall()
+            if not rows:
+                break
+            self._conn.executemany("DELETE FROM responses WHERE key = ?", [(k,) for k, _ in rows])
+            total -= sum(size for _, size in rows)
+        self._conn.commit()
+
+    def clear(self):
+        """Remove every entry."""
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+            self._conn.commit()
+
+    def get_stats(self) -> Dict:
+        """Return hit/miss counters and the current entry count and size."""
+        with self._lock:
+            count, size = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()
+        return {"hits": self.hits, "misses": self.misses, "entries": count, "bytes": size}
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+# Open caches, one per directory, shared by every run that uses it
+_caches: Dict[str, ResponseCache] = {}
+_config_lock = threading.Lock()
+
+# Process-wide default used outside a run (None = caching disabled)
+_default: Tuple[Optional[ResponseCache], bool] = (None, False)
+
+# (cache, refresh) of the run in the current context; overrides _default.
+# Context-local so concurrent runs (e.g. several ascout_technologies
+# coroutines) each keep their own cache directory and refresh policy.
+_active: ContextVar[Optional[Tuple[Optional[ResponseCache], bool]]] = ContextVar(
+    "techscout_response_cache", default=None
+)
+
+
+def open_response_cache(cache_dir: str, max_bytes: int = DEFAULT_MAX_BYTES) -> ResponseCache:
+    """Return the shared cache for a directory, opening it on first use."""
+    key = osp.abspath(cache_dir)
+    with _config_lock:
+        cache = _caches.get(key)
+        if cache is None:
+            cache = _caches[key] = ResponseCache(cache_dir, max_bytes=max_bytes)
+        return cache
+
+
+def configure_response_cache(
+    cache_dir: Optional[str],
+    enabled: bool = True,
+    refresh: bool = False,
+    max_bytes: int = DEFAULT_MAX_BYTES,
+) -> Optional[ResponseCache]:
+    """
+    Enable, disable or relocate the process-wide default response cache.
+
+    The default applies to search calls made outside a
+    ``response_cache_scope()`` (e.g. calling ``search_papers`` directly).
+
+    Args:
+        cache_dir: Directory for the cache database
+        enabled: If False, responses are neither read from nor written to the cache
+        refresh: If True, skip cache reads but still store fresh responses
+        max_bytes: Size limit enforced by LRU eviction
+
+    Returns:
+        The default cache, or None if disabled
+    """
+    global _default
+    cache = open_response_cache(cache_dir, max_bytes) if enabled and cache_dir else None
+    _default = (cache, refresh)
+    return cache
+
+
+@contextmanager
+def response_cache_scope(
+    cache_dir: Optional[str],
+    enabled: bool = True,
+    refresh: bool = False,
+    max_bytes: int = DEFAULT_MAX_BYTES,
+) -> Iterator[Optional[ResponseCache]]:
+    """
+    Use a response cache for the requests made within this block.
+
+    The setting is held in a context variable, so it follows the current
+    coroutine and the tasks and worker threads it starts
+    (``asyncio.to_thread``, ``parallel.run_parallel``) without affecting
+    other runs in the same process. Arguments are as for
+    configure_response_cache().
+
+    Yields:
+        The cache in use, or None if disabled
+    """
+    cache = open_response_cache(cache_dir, max_bytes) if enabled and cache_dir else None
+    token = _active.set((cache, refresh))
+    try:
+        yield cache
+    finally:
+        _active.reset(token)
+
+
+def get_response_cache() -> Optional[ResponseCache]:
+    """Return the response cache in effect, or None if caching is disabled."""
+    return (_active.get() or _default)[0]
+
+
+def is_refreshing() -> bool:
+    """Whether cache reads are currently bypassed."""
+    return (_active.get() or _default)[1]
+
+
+def mark_negative(response) -> None:
+    """
+    Demote a response's cache entry to a short-lived negative entry.
+
+    Search functions call this when a successful response yields no results.
+    Responses that did not come through the cache are ignored.
+    """
+    key = getattr(response, "cache_key", None)
+    cache = get_response_cache()
+    if key and cache is not None:
+        cache.mark_negative(key)
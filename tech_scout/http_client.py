@@ -0,0 +1,233 @@
+"""
+HTTP Client Module
+
+This module provides the shared HTTP layer used by every search function.
+Requests go through one pooled ``requests.Session`` per host so connections
+(and TLS sessions) are kept alive across queries, with uniform default
+headers, timeouts, per-host rate limiting and the on-disk response cache.
+"""
+
+import os
+import threading
+from typing import Dict, List, Optional
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from tech_scout.http_cache import get_response_cache, is_refreshing, make_cache_key
+from tech_scout.rate_limit import rate_limiter
+
+USER_AGENT = "AI-TechScout/1.0 (Technology Scouting Tool)"
+
+# (connect, read) timeout applied to every search request
+DEFAULT_TIMEOUT = (10, 30)
+
+# Statuses worth retrying: never cached (nor are 5xx and transport errors)
+TRANSIENT_STATUSES = {408, 429}
+
+# Maximum keep-alive connections held per host
+POOL_MAXSIZE = int(os.getenv("TECHSCOUT_HTTP_POOL_SIZE", "16"))
+
+# OpenAlex routes requests that carry a contact email to its faster "polite pool"
+OPENALEX_MAILTO = os.getenv("OPENALEX_MAILTO", "")
+
+
+class SessionFactory:
+    """
+    Thread-safe registry of pooled sessions, one per host.
+
+    Each session mounts an ``HTTPAdapter`` sized for concurrent searches so
+    worker threads share warm connections instead of opening new ones.
+    """
+
+    def __init__(self, pool_maxsize: int = POOL_MAXSIZE, user_agent: str = USER_AGENT):
+        self.pool_maxsize = pool_maxsize
+        self.user_agent = user_agent
+        self._sessions: Dict[str, requests.Session] = {}
+        self._lock = threading.Lock()
+
+    def get(self, host: str) -> requests.Session:
+        """Return the pooled session for a host, creating it on first use."""
+        with self._lock:
+            session = self._sessions.get(host)
+            if session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.pool_maxsize)
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                session.headers.update({"User-Agent": self.user_agent})
+                self._sessions[host] = session
+            return session
+
+    def close(self):
+        """Close all pooled sessions."""
+        with self._lock:
+            for session in self._sessions.values():
+                session.close()
+            self._sessions.clear()
+
+
+# Shared factory used by every search function
+session_factory = SessionFactory()
+
+
+class StreamingResponse:
+    """
+    Wrapper around a streamed ``requests.Response`` that keeps a copy of the
+    chunks read through ``iter_content()`` and hands the complete body to
+    ``on_complete`` (e.g. a cache write) once the stream is exhausted.
+
+    With ``keep_partial``, a caller that deliberately stops reading early
+    (see ``stop_early()``) and then calls ``close()`` also gets the prefix it
+    consumed stored. A stream abandoned because of a transport or parse
+    error is never stored. Other attributes are delegated to the wrapped
+    response.
+    """
+
+    from_cache = False
+
+    def __init__(self, response: requests.Response, on_complete, keep_partial: bool = False):
+        self._response = response
+        self._on_complete = on_complete
+        self._keep_partial = keep_partial
+        self._chunks: List[bytes] = []
+        self._done = False
+        self._stopped_early = False
+
+    def iter_content(self, chunk_size: int = 65536):
+        for chunk in self._response.iter_content(chunk_size):
+            self._chunks.append(chunk)
+            yield chunk
+        self._finish()
+
+    def _finish(self):
+        if not self._done:
+            self._done = True
+            self._on_complete(b"".join(self._chunks))
+
+    def stop_early(self):
+        """Mark that the caller has read all it needs and will not read further."""
+        self._stopped_early = True
+
+    def close(self):
+        """Close the connection; after stop_early() with keep_partial, store what was read."""
+        if self._keep_partial and self._stopped_early and self._chunks:
+            self._finish()
+        self._response.close()
+
+    def __getattr__(self, name):
+        return getattr(self._response, name)
+
+
+def http_request(
+    method: str,
+    url: str,
+    params: Optional[Dict] = None,
+    headers: Optional[Dict] = None,
+    json: Optional[Dict] = None,
+    timeout=None,
+    stream: bool = False,
+    cache: bool = True,
+    cache_extra: Optional[Dict] = None,
+) -> requests.Response:
+    """
+    Send a request through the shared pooled session for the URL's host.
+
+    Serves the response from the on-disk cache when possible. Otherwise holds
+    one of the host's concurrency slots for the duration of the call,
+    acquires its rate-limit budget, and applies the default User-Agent,
+    timeout and OpenAlex mailto parameter.
+
+    Args:
+        method: HTTP method ("GET", "POST", ...)
+        url: Request URL
+        params: Query string parameters
+        headers: Extra headers (merged over the session defaults)
+        json: JSON request body
+        timeout: Override for DEFAULT_TIMEOUT
+        stream: If True, do not read the body up front; with caching active
+            the body is stored once ``iter_content()`` has been consumed
+        cache: If False, bypass the response cache for this request
+        cache_extra: Client-side values that change what is read from the
+            body (e.g. a result limit). They become part of the cache key,
+            and a streamed body the caller stops reading early (marked with
+            ``stop_early()``) is cached on ``close()``, since the same request
+            with the same values stops at the same point.
+
+    Returns:
+        The ``requests.Response`` (or a ``CachedResponse``); either carries a
+        ``cache_key`` attribute when caching is active
+    """
+    host = (urlparse(url).hostname or "").lower()
+
+    if host == "api.openalex.org" and OPENALEX_MAILTO:
+        params = dict(params or {})
+        params.setdefault("mailto", OPENALEX_MAILTO)
+
+    response_cache = get_response_cache() if cache else None
+    cache_key = None
+    if response_cache is not None:
+        cache_key = make_cache_key(method, url, params, json, cache_extra)
+        if not is_refreshing():
+            cached = response_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+    session = session_factory.get(host)
+    with rate_limiter.limit(host):
+        rate_limiter.acquire(host)
+        response = session.request(
+            method,
+            url,
+            params=params,
+            headers=headers,
+            json=json,
+            timeout=timeout or DEFAULT_TIMEOUT,
+            stream=stream,
+        )
+
+    # Transient failures are never cached, so retries refetch; other client
+    # errors (e.g. 404) become negative entries
+    if (response_cache is None or response.status_code >= 500
+            or response.status_code in TRANSIENT_STATUSES):
+        return response
+
+    def store(body: bytes):
+        response_cache.put(
+            cache_key,
+            url,
+            response.status_code,
+            {"Content-Type": response.headers.get("Content-Type", "")},
+            body,
+        )
+
+    if stream and response.status_code < 400:
+        # Stored once the caller has read the whole body
+        response = StreamingResponse(response, store, keep_partial=cache_extra is not None)
+    else:
+        store(response.content)
+    response.cache_key = cache_key
+    return response
+
+
+def stop_early(response) -> None:
+    """
+    Mark a streamed response as deliberately read only in part.
+
+    Search functions call this when they break out of ``iter_content()``
+    after collecting enough results, so that ``close()`` caches the prefix
+    they read. Responses that are not cache-backed streams are ignored.
+    """
+    if isinstance(response, StreamingResponse):
+        response.stop_early()
+
+
+def http_get(url: str, **kwargs) -> requests.Response:
+    """GET through the shared session layer. See http_request()."""
+    return http_request("GET", url, **kwargs)
+
+
+def http_post(url: str, **kwargs) -> requests.Response:
+    """POST through the shared session layer. See http_request()."""
+    return http_request("POST", url, **kwargs)
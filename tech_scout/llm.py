@@ -5,17 +5,65 @@ This module provides utilities for interacting with various Large Language Model
 including Anthropic Claude, OpenAI GPT, DeepSeek, and Google Gemini.
 """
 
+import asyncio
+import hashlib
 import json
 import os
 import re
+import sys
+import threading
+import time
+import weakref
 from typing import List, Dict, Optional, Tuple, Any
 
 import anthropic
 import backoff
 import openai
 
+from tech_scout.llm_cache import get_llm_cache, make_llm_cache_key
+from tech_scout.parallel import ProviderLimit, run_parallel
+
 MAX_NUM_TOKENS = 4096
 
+# Context window (input + output tokens) by model-name substring; the first
+# match wins, so more specific names come first
+MODEL_CONTEXT_WINDOWS = [
+    ("claude", 200_000),
+    ("gpt-4.1", 1_047_576),
+    ("gpt-5", 400_000),
+    ("gpt-4o", 128_000),
+    ("o1-mini", 128_000),
+    ("o1-preview", 128_000),
+    ("o1", 200_000),
+    ("o3", 200_000),
+    ("deepseek", 64_000),
+    ("llama", 128_000),
+    ("gemini-1.5-pro", 2_000_000),
+    ("gemini", 1_048_576),
+]
+DEFAULT_CONTEXT_WINDOW = 128_000
+
+# Maximum in-flight requests per LLM provider, shared by the sync and async APIs
+PROVIDER_CONCURRENCY = {
+    "anthropic": 8,
+    "openai": 16,
+    "deepseek": 8,
+    "openrouter": 8,
+    "gemini": 8,
+}
+
+# Connection pool and timeouts of the shared SDK clients (see LLMClientRegistry)
+LLM_MAX_CONNECTIONS = int(os.getenv("TECHSCOUT_LLM_MAX_CONNECTIONS", "64"))
+LLM_MAX_KEEPALIVE = int(os.getenv("TECHSCOUT_LLM_MAX_KEEPALIVE", "32"))
+LLM_TIMEOUT = float(os.getenv("TECHSCOUT_LLM_TIMEOUT", "600"))
+LLM_CONNECT_TIMEOUT = float(os.getenv("TECHSCOUT_LLM_CONNECT_TIMEOUT", "10"))
+
+# Provider batch APIs: requests per submitted batch, seconds between status
+# checks, and how long to wait for a batch before cancelling it
+BATCH_MAX_REQUESTS = 10_000
+BATCH_POLL_INTERVAL = float(os.getenv("TECHSCOUT_BATCH_POLL_INTERVAL", "30"))
+BATCH_TIMEOUT = float(os.getenv("TECHSCOUT_BATCH_TIMEOUT", str(24 * 3600)))
+
 AVAILABLE_LLMS = [
     # Anthropic models
     "claude-3-5-sonnet-20240620",
@@ -81,9 +129,115 @@ AVAILABLE_LLMS = [
 ]
 
 
+def _fingerprint(api_key: Optional[str]) -> str:
+    """Short digest identifying an API key without keeping the key itself as a registry key."""
+    if not api_key:
+        return ""
+    return hashlib.sha256(api_key.encode("utf-8")).hexdigest()[:16]
+
+
+class LLMClientRegistry:
+    """
+    Thread-safe registry of shared SDK clients.
+    
+    One client is kept per (provider, base URL, API key fingerprint), each
+    with its own pooled HTTP connections, so repeated create_client() calls
+    (e.g. one per Streamlit action) and concurrent threads reuse warm
+    connections instead of paying connection and TLS setup again. The SDK
+    clients are safe to share across threads.
+    """
+
+    def __init__(
+        self,
+        max_connections: int = LLM_MAX_CONNECTIONS,
+        max_keepalive: int = LLM_MAX_KEEPALIVE,
+        timeout: float = LLM_TIMEOUT,
+        connect_timeout: float = LLM_CONNECT_TIMEOUT,
+    ):
+        self.max_connections = max_connections
+        self.max_keepalive = max_keepalive
+        self.timeout = timeout
+        self.connect_timeout = connect_timeout
+        self._clients: Dict[Tuple[str, str, str], Any] = {}
+        self._lock = threading.Lock()
+
+    def get(self, provider: str, base_url: Optional[str] = None, api_key: Optional[str] = None) -> Any:
+        """
+        Return the shared client for an endpoint, creating it on first use.
+        
+        Args:
+            provider: "anthropic", "bedrock", "vertex" or "openai" (any
+                OpenAI-compatible endpoint)
+            base_url: API base URL (None = SDK default)
+            api_key: API key (None = SDK default from the environment)
+            
+        Returns:
+            Sync SDK client
+        """
+        key = (provider, base_url or "", _fingerprint(api_key))
+        with self._lock:
+            client = self._clients.get(key)
+            if client is None:
+                client = self._create(provider, base_url, api_key)
+                self._clients[key] = client
+            return client
+
+    def _create(self, provider: str, base_url: Optional[str], api_key: Optional[str]) -> Any:
+        if provider == "anthropic":
+            return anthropic.Anthropic(api_key=api_key, base_url=base_url, **self.options(anthropic))
+        if provider == "bedrock":
+            return anthropic.AnthropicBedrock(**self.options(anthropic))
+        if provider == "vertex":
+            return anthropic.AnthropicVertex(**self.options(anthropic))
+        if provider == "openai":
+            return openai.OpenAI(api_key=api_key, base_url=base_url, **self.options(openai))
+        raise ValueError(f"Unknown LLM client provider {provider!r}.")
+
+    def options(self, sdk: Any, asynchronous: bool = False) -> Dict:
+        """
+        Timeout and a new pooled HTTP client for a client of ``sdk``.
+        
+        The HTTP client is the SDK's own default client class, so it keeps
+        the SDK's defaults and matches the httpx package the SDK is built
+        on (httpx, or httpx2 in newer releases).
+        
+        Args:
+            sdk: The anthropic or openai module
+            asynchronous: Build an async HTTP client (one per event loop)
+            
+        Returns:
+            Keyword arguments for the SDK client constructor
+        """
+        client_class = sdk.DefaultAsyncHttpxClient if asynchronous else sdk.DefaultHttpxClient
+        httpx_module = next(
+            sys.modules[cls.__module__.partition(".")[0]]
+            for cls in client_class.__mro__
+            if cls.__module__.startswith("httpx")
+        )
+        timeout = sdk.Timeout(self.timeout, connect=self.connect_timeout)
+        limits = httpx_module.Limits(
+            max_connections=self.max_connections, max_keepalive_connections=self.max_keepalive
+        )
+        return {"timeout": timeout, "http_client": client_class(limits=limits, timeout=timeout)}
+
+    def close(self):
+        """Close all shared clients and their connection pools."""
+        with self._lock:
+            for client in self._clients.values():
+                client.close()
+            self._clients.clear()
+
+
+# Shared registry used by create_client
+client_registry = LLMClientRegistry()
+
+
 def create_client(model: str) -> Tuple[Any, str]:
     """
-    Create an LLM client for the specified model.
+    Get an LLM client for the specified model.
+    
+    Clients come from the process-wide client_registry, so calls for the
+    same endpoint and API key return the same client and connection pool.
     
     Args:
         model: The model identifier string
@@ -93,41 +247,114 @@ def create_client(model: str) -> Tuple[Any, str]:
     """
     if model.startswith("claude-"):
         print(f"Using Anthropic API with model {model}.")
-        return anthropic.Anthropic(), model
+        return client_registry.get(
+            "anthropic",
+            base_url=os.environ.get("ANTHROPIC_BASE_URL"),
+            api_key=os.environ.get("ANTHROPIC_API_KEY"),
+        ), model
     elif model.startswith("bedrock") and "claude" in model:
         client_model = model.split("/")[-1]
         print(f"Using Amazon Bedrock with model {client_model}.")
-        return anthropic.AnthropicBedrock(), client_model
+        return client_registry.get("bedrock"), client_model
     elif model.startswith("vertex_ai") and "claude" in model:
         client_model = model.split("/")[-1]
         print(f"Using Vertex AI with model {client_model}.")
-        return anthropic.AnthropicVertex(), client_model
+        return client_registry.get("vertex"), client_model
     elif 'gpt' in model or "o1" in model or "o3" in model:
         print(f"Using OpenAI API with model {model}.")
-        return openai.OpenAI(), model
+        return client_registry.get(
+            "openai",
+            base_url=os.environ.get("OPENAI_BASE_URL"),
+            api_key=os.environ.get("OPENAI_API_KEY"),
+        ), model
     elif model in ["deepseek-chat", "deepseek-reasoner", "deepseek-coder"]:
         print(f"Using DeepSeek API with {model}.")
-        return openai.OpenAI(
+        return client_registry.get(
+            "openai",
+            base_url="https://api.deepseek.com",
             api_key=os.environ.get("DEEPSEEK_API_KEY"),
-            base_url="https://api.deepseek.com"
         ), model
     elif model == "llama3.1-405b":
         print(f"Using OpenRouter API with {model}.")
-        return openai.OpenAI(
+        return client_registry.get(
+            "openai",
+            base_url="https://openrouter.ai/api/v1",
             api_key=os.environ.get("OPENROUTER_API_KEY"),
-            base_url="https://openrouter.ai/api/v1"
         ), "meta-llama/llama-3.1-405b-instruct"
     elif "gemini" in model:
         print(f"Using Gemini API with {model}.")
-        return openai.OpenAI(
+        return client_registry.get(
+            "openai",
+            base_url="https://generativelanguage.googleapis.com/v1beta/openai/",
             api_key=os.environ.get("GEMINI_API_KEY"),
-            base_url="https://generativelanguage.googleapis.com/v1beta/openai/"
         ), model
     else:
         raise ValueError(f"Model {model} not supported.")
 
 
-@backoff.on_exception(backoff.expo, (openai.RateLimitError, openai.APITimeoutError))
+def get_context_window(model: str) -> int:
+    """Context window in tokens for a model (or client model) name."""
+    for name, window in MODEL_CONTEXT_WINDOWS:
+        if name in model:
+            return window
+    return DEFAULT_CONTEXT_WINDOW
+
+
+_provider_limits: Dict[str, ProviderLimit] = {}
+_provider_limits_lock = threading.Lock()
+
+
+def get_provider(model: str) -> str:
+    """
+    Map a client model name (as returned by create_client) to its provider.
+    
+    Bedrock and Vertex AI Claude models count against the "anthropic" limit.
+    """
+    if "claude" in model:
+        return "anthropic"
+    if model.startswith("deepseek"):
+        return "deepseek"
+    if "llama" in model:
+        return "openrouter"
+    if "gemini" in model:
+        return "gemini"
+    return "openai"
+
+
+def get_provider_limit(model: str) -> ProviderLimit:
+    """
+    Return the concurrency limit for the model's provider.
+    
+    Limits default to PROVIDER_CONCURRENCY and can be overridden with
+    TECHSCOUT_LLM_CONCURRENCY, e.g. "anthropic=4,openai=32".
+    """
+    provider = get_provider(model)
+    with _provider_limits_lock:
+        limit = _provider_limits.get(provider)
+        if limit is None:
+            overrides = {}
+            for entry in os.getenv("TECHSCOUT_LLM_CONCURRENCY", "").split(","):
+                name, _, value = entry.partition("=")
+                if value.strip().isdigit():
+                    overrides[name.strip()] = int(value)
+            limit = ProviderLimit(overrides.get(provider, PROVIDER_CONCURRENCY.get(provider, 8)))
+            _provider_limits[provider] = limit
+        return limit
+
+
+# Transient provider errors retried with exponential backoff by every call
+# path (sync, async and batch)
+RETRY_EXCEPTIONS = (
+    openai.RateLimitError,
+    openai.APITimeoutError,
+    anthropic.RateLimitError,
+    anthropic.APITimeoutError,
+)
+
+retry_llm = backoff.on_exception(backoff.expo, RETRY_EXCEPTIONS)
+
+
+@retry_llm
 def get_response_from_llm(
     msg: str,
     client: Any,
@@ -136,10 +363,15 @@ def get_response_from_llm(
     print_debug: bool = False,
     msg_history: Optional[List[Dict]] = None,
     temperature: float = 0.75,
+    use_cache: bool = True,
 ) -> Tuple[str, List[Dict]]:
     """
     Get a response from an LLM.
     
+    Identical requests are served from the LLM response cache when one is
+    configured (see llm_cache.configure_llm_cache) and its policy accepts
+    the temperature.
+    
     Args:
         msg: The user message to send
         client: The LLM client
@@ -148,6 +380,63 @@ def get_response_from_llm(
         print_debug: Whether to print debug information
         msg_history: Previous message history
         temperature: Sampling temperature
+        use_cache: If False, bypass the LLM response cache for this call
+        
+    Returns:
+        Tuple of (response_content, updated_msg_history)
+    """
+    if msg_history is None:
+        msg_history = []
+
+    cache, cache_key, cached = _lookup_cache(
+        model, system_message, msg_history, msg, temperature, use_cache
+    )
+    if cached is not None:
+        return cached, _extend_history(model, msg_history, msg, cached)
+
+    with get_provider_limit(model):
+        content, new_msg_history = _call_llm(
+            msg, client, model, system_message, msg_history, temperature
+        )
+
+    if cache_key is not None and content:
+        cache.put(cache_key, model, content)
+
+    if print_debug:
+        _print_exchange(new_msg_history, content)
+
+    return content, new_msg_history
+
+
+@retry_llm
+async def aget_response_from_llm(
+    msg: str,
+    client: Any,
+    model: str,
+    system_message: str,
+    print_debug: bool = False,
+    msg_history: Optional[List[Dict]] = None,
+    temperature: float = 0.75,
+    use_cache: bool = True,
+) -> Tuple[str, List[Dict]]:
+    """
+    Async variant of get_response_from_llm().
+    
+    Sends the request with the provider's native async client, so many
+    calls can be in flight from one event loop without a thread each. Calls
+    share the per-provider concurrency limit, retry policy, request format
+    and response cache with the sync API.
+    
+    Args:
+        msg: The user message to send
+        client: A client from create_client() (its async counterpart with
+            the same credentials and endpoint is used) or an async client
+        model: The model name
+        system_message: System message for context
+        print_debug: Whether to print debug information
+        msg_history: Previous message history
+        temperature: Sampling temperature
+        use_cache: If False, bypass the LLM response cache for this call
         
     Returns:
         Tuple of (response_content, updated_msg_history)
@@ -155,6 +444,90 @@ def get_response_from_llm(
     if msg_history is None:
         msg_history = []
 
+    cache, cache_key, cached = _lookup_cache(
+        model, system_message, msg_history, msg, temperature, use_cache
+    )
+    if cached is not None:
+        return cached, _extend_history(model, msg_history, msg, cached)
+
+    async with get_provider_limit(model):
+        content, new_msg_history = await _acall_llm(
+            msg, get_async_client(client), model, system_message, msg_history, temperature
+        )
+
+    if cache_key is not None and content:
+        cache.put(cache_key, model, content)
+
+    if print_debug:
+        _print_exchange(new_msg_history, content)
+
+    return content, new_msg_history
+
+
+def _lookup_cache(
+    model: str,
+    system_message: str,
+    msg_history: List[Dict],
+    msg: str,
+    temperature: float,
+    use_cache: bool,
+) -> Tuple[Any, Optional[str], Optional[str]]:
+    """Return (cache, cache_key, cached_content); the key is None when the request is not cacheable."""
+    cache = get_llm_cache() if use_cache else None
+    if cache is None or not cache.accepts(temperature):
+        return None, None, None
+    cache_key = make_llm_cache_key(
+        model, system_message, msg_history, msg, temperature, MAX_NUM_TOKENS
+    )
+    return cache, cache_key, cache.get(cache_key)
+
+
+def _print_exchange(msg_history: List[Dict], content: Any):
+    print()
+    print("*" * 20 + " LLM START " + "*" * 20)
+    for j, m in enumerate(msg_history):
+        print(f'{j}, {m["role"]}: {m["content"]}')
+    print(content)
+    print("*" * 21 + " LLM END " + "*" * 21)
+    print()
+
+
+def _extend_history(model: str, msg_history: List[Dict], msg: str, content: str) -> List[Dict]:
+    """Append a user message and assistant reply in the provider's message format."""
+    if "claude" in model:
+        return msg_history + [
+            {"role": "user", "content": [{"type": "text", "text": msg}]},
+            {"role": "assistant", "content": [{"type": "text", "text": content}]},
+        ]
+    return msg_history + [
+        {"role": "user", "content": msg},
+        {"role": "assistant", "content": content},
+    ]
+
+
+def _build_request(
+    msg: str,
+    model: str,
+    system_message: str,
+    msg_history: List[Dict],
+    temperature: float,
+    n_responses: int = 1,
+) -> Tuple[str, Dict, List[Dict]]:
+    """
+    Build the provider request for one chat turn.
+    
+    Args:
+        msg: The user message to send
+        model: The client model name
+        system_message: System message for context
+        msg_history: Previous message history
+        temperature: Sampling temperature
+        n_responses: Number of choices to request (OpenAI-compatible APIs)
+        
+    Returns:
+        Tuple of (api, request kwargs, msg_history with the user message),
+        where api is "messages" (Anthropic) or "chat" (OpenAI-compatible)
+    """
     if "claude" in model:
         new_msg_history = msg_history + [
             {
@@ -162,124 +535,224 @@ def get_response_from_llm(
                 "content": [{"type": "text", "text": msg}],
             }
         ]
-        response = client.messages.create(
-            model=model,
-            max_tokens=MAX_NUM_TOKENS,
-            temperature=temperature,
-            system=system_message,
-            messages=new_msg_history,
-        )
+        return "messages", {
+            "model": model,
+            "max_tokens": MAX_NUM_TOKENS,
+            "temperature": temperature,
+            "system": system_message,
+            "messages": new_msg_history,
+        }, new_msg_history
+
+    new_msg_history = msg_history + [{"role": "user", "content": msg}]
+    messages = [{"role": "system", "content": system_message}, *new_msg_history]
+    if 'gpt' in model:
+        request = {
+            "model": model,
+            "messages": messages,
+            "temperature": temperature,
+            "max_tokens": MAX_NUM_TOKENS,
+            "n": n_responses,
+            "stop": None,
+            "seed": 0,
+        }
+    elif "o1" in model or "o3" in model:
+        request = {
+            "model": model,
+            "messages": [{"role": "user", "content": system_message}, *new_msg_history],
+            "temperature": 1,
+            "max_completion_tokens": MAX_NUM_TOKENS,
+            "n": n_responses,
+            "seed": 0,
+        }
+    elif model in ["meta-llama/llama-3.1-405b-instruct", "llama-3-1-405b-instruct"]:
+        request = {
+            "model": "meta-llama/llama-3.1-405b-instruct",
+            "messages": messages,
+            "temperature": temperature,
+            "max_tokens": MAX_NUM_TOKENS,
+            "n": n_responses,
+            "stop": None,
+        }
+    elif model in ["deepseek-chat", "deepseek-coder"]:
+        request = {
+            "model": model,
+            "messages": messages,
+            "temperature": temperature,
+            "max_tokens": MAX_NUM_TOKENS,
+            "n": n_responses,
+            "stop": None,
+        }
+    elif model in ["deepseek-reasoner"]:
+        request = {
+            "model": model,
+            "messages": messages,
+            "n": n_responses,
+            "stop": None,
+        }
+    elif "gemini" in model:
+        request = {
+            "model": model,
+            "messages": messages,
+            "temperature": temperature,
+            "max_tokens": MAX_NUM_TOKENS,
+            "n": n_responses,
+        }
+    else:
+        raise ValueError(f"Model {model} not supported.")
+    return "chat", request, new_msg_history
+
+
+def _parse_response(api: str, response: Any, new_msg_history: List[Dict]) -> Tuple[str, List[Dict]]:
+    """Extract the reply text and append it to the history in the provider's format."""
+    if api == "messages":
         content = response.content[0].text
-        new_msg_history = new_msg_history + [
+        return content, new_msg_history + [
             {
                 "role": "assistant",
                 "content": [{"type": "text", "text": content}],
             }
         ]
-    elif 'gpt' in model:
-        new_msg_history = msg_history + [{"role": "user", "content": msg}]
-        response = client.chat.completions.create(
-            model=model,
-            messages=[
-                {"role": "system", "content": system_message},
-                *new_msg_history,
-            ],
-            temperature=temperature,
-            max_tokens=MAX_NUM_TOKENS,
-            n=1,
-            stop=None,
-            seed=0,
-        )
-        content = response.choices[0].message.content
-        new_msg_history = new_msg_history + [{"role": "assistant", "content": content}]
-    elif "o1" in model or "o3" in model:
-        new_msg_history = msg_history + [{"role": "user", "content": msg}]
-        response = client.chat.completions.create(
-            model=model,
-            messages=[
-                {"role": "user", "content": system_message},
-                *new_msg_history,
-            ],
-            temperature=1,
-            max_completion_tokens=MAX_NUM_TOKENS,
-            n=1,
-            seed=0,
-        )
-        content = response.choices[0].message.content
-        new_msg_history = new_msg_history + [{"role": "assistant", "content": content}]
-    elif model in ["meta-llama/llama-3.1-405b-instruct", "llama-3-1-405b-instruct"]:
-        new_msg_history = msg_history + [{"role": "user", "content": msg}]
-        response = client.chat.completions.create(
-            model="meta-llama/llama-3.1-405b-instruct",
-            messages=[
-                {"role": "system", "content": system_message},
-                *new_msg_history,
-            ],
-            temperature=temperature,
-            max_tokens=MAX_NUM_TOKENS,
-            n=1,
-            stop=None,
+    content = response.choices[0].message.content
+    return content, new_msg_history + [{"role": "assistant", "content": content}]
+
+
+def _call_llm(
+    msg: str,
+    client: Any,
+    model: str,
+    system_message: str,
+    msg_history: List[Dict],
+    temperature: float,
+) -> Tuple[str, List[Dict]]:
+    """Send a single chat request to the provider behind ``client``."""
+    api, request, new_msg_history = _build_request(
+        msg, model, system_message, msg_history, temperature
+    )
+    if api == "messages":
+        response = client.messages.create(**request)
+    else:
+        response = client.chat.completions.create(**request)
+    return _parse_response(api, response, new_msg_history)
+
+
+async def _acall_llm(
+    msg: str,
+    client: Any,
+    model: str,
+    system_message: str,
+    msg_history: List[Dict],
+    temperature: float,
+) -> Tuple[str, List[Dict]]:
+    """Send a single chat request through an async client."""
+    api, request, new_msg_history = _build_request(
+        msg, model, system_message, msg_history, temperature
+    )
+    if api == "messages":
+        response = await client.messages.create(**request)
+    else:
+        response = await client.chat.completions.create(**request)
+    return _parse_response(api, response, new_msg_history)
+
+
+ASYNC_CLIENT_TYPES = (
+    anthropic.AsyncAnthropic,
+    anthropic.AsyncAnthropicBedrock,
+    anthropic.AsyncAnthropicVertex,
+    openai.AsyncOpenAI,
+)
+
+# Async clients per event loop: their connection pools are bound to the loop
+# that opened them, so each loop gets its own, keyed by the sync client.
+# Values are (clients by id of the sync client, shutdown hook generator).
+_async_clients: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+_async_clients_lock = threading.Lock()
+
+
+async def _close_on_loop_shutdown(clients: Dict):
+    """
+    Close a loop's async clients when the loop shuts down.
+    
+    The event loop tracks this generator once it has started, and
+    ``loop.shutdown_asyncgens()`` (run by ``asyncio.run`` and therefore
+    ``run_sync``) closes it, which runs the ``finally`` block on the loop
+    before it closes.
+    """
+    try:
+        yield
+    finally:
+        for _, async_client in list(clients.values()):
+            try:
+                await async_client.close()
+            except Exception:
+                pass
+        clients.clear()
+
+
+def _make_async_client(client: Any) -> Any:
+    sdk = openai if isinstance(client, openai.OpenAI) else anthropic
+    options = client_registry.options(sdk, asynchronous=True)
+    if isinstance(client, anthropic.AnthropicBedrock):
+        return anthropic.AsyncAnthropicBedrock(
+            aws_region=getattr(client, "aws_region", None), **options
         )
-        content = response.choices[0].message.content
-        new_msg_history = new_msg_history + [{"role": "assistant", "content": content}]
-    elif model in ["deepseek-chat", "deepseek-coder"]:
-        new_msg_history = msg_history + [{"role": "user", "content": msg}]
-        response = client.chat.completions.create(
-            model=model,
-            messages=[
-                {"role": "system", "content": system_message},
-                *new_msg_history,
-            ],
-            temperature=temperature,
-            max_tokens=MAX_NUM_TOKENS,
-            n=1,
-            stop=None,
+    if isinstance(client, anthropic.AnthropicVertex):
+        return anthropic.AsyncAnthropicVertex(
+            region=getattr(client, "region", None),
+            project_id=getattr(client, "project_id", None),
+            **options,
         )
-        content = response.choices[0].message.content
-        new_msg_history = new_msg_history + [{"role": "assistant", "content": content}]
-    elif model in ["deepseek-reasoner"]:
-        new_msg_history = msg_history + [{"role": "user", "content": msg}]
-        response = client.chat.completions.create(
-            model=model,
-            messages=[
-                {"role": "system", "content": system_message},
-                *new_msg_history,
-            ],
-            n=1,
-            stop=None,
+    if isinstance(client, anthropic.Anthropic):
+        return anthropic.AsyncAnthropic(
+            api_key=client.api_key,
+            base_url=client.base_url,
+            max_retries=client.max_retries,
+            **options,
         )
-        content = response.choices[0].message.content
-        new_msg_history = new_msg_history + [{"role": "assistant", "content": content}]
-    elif "gemini" in model:
-        new_msg_history = msg_history + [{"role": "user", "content": msg}]
-        response = client.chat.completions.create(
-            model=model,
-            messages=[
-                {"role": "system", "content": system_message},
-                *new_msg_history,
-            ],
-            temperature=temperature,
-            max_tokens=MAX_NUM_TOKENS,
-            n=1,
+    if isinstance(client, openai.OpenAI):
+        return openai.AsyncOpenAI(
+            api_key=client.api_key,
+            organization=client.organization,
+            base_url=client.base_url,
+            max_retries=client.max_retries,
+            **options,
         )
-        content = response.choices[0].message.content
-        new_msg_history = new_msg_history + [{"role": "assistant", "content": content}]
-    else:
-        raise ValueError(f"Model {model} not supported.")
+    raise ValueError(f"No async counterpart for client type {type(client).__name__}.")
 
-    if print_debug:
-        print()
-        print("*" * 20 + " LLM START " + "*" * 20)
-        for j, m in enumerate(new_msg_history):
-            print(f'{j}, {m["role"]}: {m["content"]}')
-        print(content)
-        print("*" * 21 + " LLM END " + "*" * 21)
-        print()
 
-    return content, new_msg_history
+def get_async_client(client: Any) -> Any:
+    """
+    Return the async counterpart of a client from create_client().
+    
+    The async client uses the same credentials and endpoint (including the
+    DeepSeek, OpenRouter and Gemini OpenAI-compatible base URLs) and is
+    created once per sync client and running event loop, and closed when
+    that loop shuts down. Async clients are returned unchanged.
+    
+    Args:
+        client: Sync or async Anthropic/OpenAI client
+        
+    Returns:
+        Async client for the running event loop
+    """
+    if isinstance(client, ASYNC_CLIENT_TYPES):
+        return client
+    loop = asyncio.get_running_loop()
+    with _async_clients_lock:
+        if loop not in _async_clients:
+            clients: Dict = {}
+            hook = _close_on_loop_shutdown(clients)
+            # Run to the first yield so the loop registers the generator
+            asyncio.ensure_future(hook.__anext__())
+            _async_clients[loop] = (clients, hook)
+        clients = _async_clients[loop][0]
+        entry = clients.get(id(client))
+        if entry is None or entry[0] is not client:
+            entry = (client, _make_async_client(client))
+            clients[id(client)] = entry
+        return entry[1]
 
 
-@backoff.on_exception(backoff.expo, (openai.RateLimitError, openai.APITimeoutError))
+@retry_llm
 def get_batch_responses_from_llm(
     msg: str,
     client: Any,
@@ -309,37 +782,12 @@ def get_batch_responses_from_llm(
     if msg_history is None:
         msg_history = []
 
-    if 'gpt' in model:
-        new_msg_history = msg_history + [{"role": "user", "content": msg}]
-        response = client.chat.completions.create(
-            model=model,
-            messages=[
-                {"role": "system", "content": system_message},
-                *new_msg_history,
-            ],
-            temperature=temperature,
-            max_tokens=MAX_NUM_TOKENS,
-            n=n_responses,
-            stop=None,
-            seed=0,
-        )
-        content = [r.message.content for r in response.choices]
-        new_msg_history = [
-            new_msg_history + [{"role": "assistant", "content": c}] for c in content
-        ]
-    elif model == "llama-3-1-405b-instruct":
-        new_msg_history = msg_history + [{"role": "user", "content": msg}]
-        response = client.chat.completions.create(
-            model="meta-llama/llama-3.1-405b-instruct",
-            messages=[
-                {"role": "system", "content": system_message},
-                *new_msg_history,
-            ],
-            temperature=temperature,
-            max_tokens=MAX_NUM_TOKENS,
-            n=n_responses,
-            stop=None,
+    if 'gpt' in model or model == "llama-3-1-405b-instruct":
+        _, request, new_msg_history = _build_request(
+            msg, model, system_message, msg_history, temperature, n_responses=n_responses
         )
+        with get_provider_limit(model):
+            response = client.chat.completions.create(**request)
         content = [r.message.content for r in response.choices]
         new_msg_history = [
             new_msg_history + [{"role": "assistant", "content": c}] for c in content
@@ -348,6 +796,7 @@ def get_batch_responses_from_llm(
         # For models that don't support n > 1, make multiple calls
         content, new_msg_history = [], []
         for _ in range(n_responses):
+            # Ensemble members must be independent samples, not cache hits
             c, hist = get_response_from_llm(
                 msg,
                 client,
@@ -356,22 +805,239 @@ def get_batch_responses_from_llm(
                 print_debug=False,
                 msg_history=None,
                 temperature=temperature,
+                use_cache=False,
             )
             content.append(c)
             new_msg_history.append(hist)
 
     if print_debug:
-        print()
-        print("*" * 20 + " LLM START " + "*" * 20)
-        for j, m in enumerate(new_msg_history[0]):
-            print(f'{j}, {m["role"]}: {m["content"]}')
-        print(content)
-        print("*" * 21 + " LLM END " + "*" * 21)
-        print()
+        _print_exchange(new_msg_history[0], content)
 
     return content, new_msg_history
 
 
+def supports_batch_api(client: Any, model: str) -> bool:
+    """
+    Whether requests for ``model`` can go through a provider batch API.
+    
+    The direct Anthropic API offers message batches (``messages.batches``,
+    which older anthropic releases lack or only expose under ``beta``) and
+    the OpenAI API offers file-based chat completion batches. Bedrock,
+    Vertex AI and the other OpenAI-compatible endpoints (DeepSeek,
+    OpenRouter, Gemini) do not through these clients.
+    """
+    if isinstance(client, anthropic.Anthropic):
+        return hasattr(client.messages, "batches")
+    return isinstance(client, openai.OpenAI) and get_provider(model) == "openai"
+
+
+def get_responses_from_llm_batch(
+    requests: List[Dict],
+    client: Any,
+    model: str,
+    temperature: float = 0.75,
+    poll_interval: float = BATCH_POLL_INTERVAL,
+    timeout: float = BATCH_TIMEOUT,
+    use_cache: bool = True,
+) -> List[Optional[str]]:
+    """
+    Send many independent single-turn requests through the provider's batch API.
+    
+    Batch APIs trade latency (results within hours) for throughput and
+    cost, which suits overnight runs. Requests are built exactly as in
+    get_response_from_llm(), submitted in chunks of at most
+    BATCH_MAX_REQUESTS, polled every ``poll_interval`` seconds and mapped
+    back by position. Cached responses are reused and new ones stored.
+    Models without a batch API (see supports_batch_api) fall back to
+    concurrent interactive calls.
+    
+    Args:
+        requests: Dicts with "msg", "system_message" and optional "msg_history"
+        client: The LLM client
+        model: The model name
+        temperature: Sampling temperature
+        poll_interval: Seconds between batch status checks
+        timeout: Seconds to wait for a batch before cancelling it
+        use_cache: If False, bypass the LLM response cache
+        
+    Returns:
+        Response text per request, in input order (None where a request failed)
+    """
+    responses: List[Optional[str]] = [None] * len(requests)
+    pending: Dict[str, Tuple[Dict, Any, Optional[str]]] = {}
+    for index, request in enumerate(requests):
+        history = request.get("msg_history") or []
+        cache, cache_key, cached = _lookup_cache(
+            model, request["system_message"], history, request["msg"], temperature, use_cache
+        )
+        if cached is not None:
+            responses[index] = cached
+        else:
+            pending[str(index)] = (request, cache, cache_key)
+    
+    if not pending:
+        return responses
+    print(f"Batch of {len(requests)} LLM requests: {len(requests) - len(pending)} cached, {len(pending)} to submit")
+    
+    if not supports_batch_api(client, model):
+        print(f"No batch API for {model}; sending requests interactively")
+        outcomes = run_parallel(
+            [
+                lambda request=request: get_response_from_llm(
+                    request["msg"],
+                    client,
+                    model,
+                    request["system_message"],
+                    msg_history=request.get("msg_history"),
+                    temperature=temperature,
+                    use_cache=use_cache,
+                )[0]
+                for request, _, _ in pending.values()
+            ],
+            max_workers=get_provider_limit(model).limit,
+            return_exceptions=True,
+        )
+        for custom_id, outcome in zip(pending, outcomes):
+            if isinstance(outcome, Exception):
+                print(f"  Warning: request {custom_id} failed: {outcome}")
+            else:
+                responses[int(custom_id)] = outcome
+        return responses
+    
+    built = {
+        custom_id: _build_request(
+            request["msg"], model, request["system_message"], request.get("msg_history") or [], temperature
+        )[1]
+        for custom_id, (request, _, _) in pending.items()
+    }
+    run_batch = _run_anthropic_batch if isinstance(client, anthropic.Anthropic) else _run_openai_batch
+    
+    chunks = [
+        dict(list(built.items())[start:start + BATCH_MAX_REQUESTS])
+        for start in range(0, len(built), BATCH_MAX_REQUESTS)
+    ]
+    results: Dict[str, str] = {}
+    outcomes = run_parallel(
+        [lambda chunk=chunk: run_batch(client, chunk, poll_interval, timeout) for chunk in chunks],
+        max_workers=len(chunks),
+        return_exceptions=True,
+    )
+    for chunk, outcome in zip(chunks, outcomes):
+        if isinstance(outcome, Exception):
+            # The chunk's requests stay None; other chunks keep their results
+            print(f"  Warning: batch of {len(chunk)} requests failed: {outcome}")
+        else:
+            results.update(outcome)
+    
+    for custom_id, (_, cache, cache_key) in pending.items():
+        content = results.get(custom_id)
+        responses[int(custom_id)] = content
+        if content and cache_key is not None:
+            cache.put(cache_key, model, content)
+    
+    failed = len(pending) - sum(1 for custom_id in pending if results.get(custom_id))
+    if failed:
+        print(f"  Warning: {failed} of {len(pending)} batch requests failed")
+    return responses
+
+
+def _wait_for_batch(retrieve, is_done, describe, poll_interval: float, timeout: float, cancel):
+    """Poll a submitted batch until ``is_done``; cancel it and raise TimeoutError after ``timeout``."""
+    deadline = time.monotonic() + timeout
+    last_status = None
+    while True:
+        batch = retrieve()
+        status = describe(batch)
+        if status != last_status:
+            print(f"  {status}")
+            last_status = status
+        if is_done(batch):
+            return batch
+        if time.monotonic() >= deadline:
+            cancel()
+            raise TimeoutError(f"Batch not finished after {timeout:.0f}s; cancelled ({status})")
+        time.sleep(poll_interval)
+
+
+def _run_anthropic_batch(
+    client: Any, requests: Dict[str, Dict], poll_interval: float, timeout: float
+) -> Dict[str, str]:
+    """Submit requests as an Anthropic message batch; returns custom_id -> response text."""
+    batch = client.messages.batches.create(
+        requests=[{"custom_id": custom_id, "params": params} for custom_id, params in requests.items()]
+    )
+    print(f"Submitted Anthropic message batch {batch.id} ({len(requests)} requests)")
+    
+    def describe(b):
+        counts = b.request_counts
+        return (f"Batch {b.id}: {b.processing_status} "
+                f"({counts.succeeded} succeeded, {counts.errored} errored, {counts.processing} processing)")
+    
+    _wait_for_batch(
+        lambda: client.messages.batches.retrieve(batch.id),
+        lambda b: b.processing_status == "ended",
+        describe,
+        poll_interval,
+        timeout,
+        lambda: client.messages.batches.cancel(batch.id),
+    )
+    
+    results = {}
+    for entry in client.messages.batches.results(batch.id):
+        if entry.result.type == "succeeded":
+            results[entry.custom_id] = entry.result.message.content[0].text
+        else:
+            print(f"  Warning: batch request {entry.custom_id} {entry.result.type}")
+    return results
+
+
+def _run_openai_batch(
+    client: Any, requests: Dict[str, Dict], poll_interval: float, timeout: float
+) -> Dict[str, str]:
+    """Submit requests as an OpenAI chat completions batch; returns custom_id -> response text."""
+    lines = [
+        json.dumps({"custom_id": custom_id, "method": "POST", "url": "/v1/chat/completions", "body": body})
+        for custom_id, body in requests.items()
+    ]
+    input_file = client.files.create(
+        file=("techscout_batch.jsonl", "\n".join(lines).encode("utf-8")), purpose="batch"
+    )
+    batch = client.batches.create(
+        input_file_id=input_file.id, endpoint="/v1/chat/completions", completion_window="24h"
+    )
+    print(f"Submitted OpenAI batch {batch.id} ({len(requests)} requests)")
+    
+    def describe(b):
+        counts = b.request_counts
+        progress = f" ({counts.completed}/{counts.total} completed, {counts.failed} failed)" if counts else ""
+        return f"Batch {b.id}: {b.status}{progress}"
+    
+    batch = _wait_for_batch(
+        lambda: client.batches.retrieve(batch.id),
+        lambda b: b.status in ("completed", "failed", "expired", "cancelled"),
+        describe,
+        poll_interval,
+        timeout,
+        lambda: client.batches.cancel(batch.id),
+    )
+    
+    results = {}
+    if batch.output_file_id:
+        for line in client.files.content(batch.output_file_id).text.splitlines():
+            if not line.strip():
+                continue
+            entry = json.loads(line)
+            response = entry.get("response") or {}
+            if response.get("status_code") == 200:
+                results[entry["custom_id"]] = response["body"]["choices"][0]["message"]["content"]
+            else:
+                print(f"  Warning: batch request {entry.get('custom_id')} failed: {entry.get('error') or response.get('status_code')}")
+    if batch.error_file_id:
+        errors = client.files.content(batch.error_file_id).text.splitlines()
+        print(f"  Warning: {len([e for e in errors if e.strip()])} batch requests were rejected")
+    return results
+
+
 def extract_json_between_markers(llm_output: str) -> Optional[Any]:
     """
     Extract JSON content from LLM output.
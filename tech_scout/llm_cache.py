@@ -0,0 +1,238 @@
+"""
+LLM Response Cache Module
+
+This module provides an opt-in, SQLite-backed cache for LLM responses so
+re-running a report, re-opening a template or retrying after a late-phase
+failure does not pay again for identical prompts. Entries are content
+addressed: the key is a hash of the model, system message, full message
+history, temperature and max tokens, so any change to the prompt is a miss.
+
+A policy decides what is cached: "always", "deterministic" (only
+temperature-0 requests, whose responses are meant to be reproducible) or
+"off". Entries older than a maximum age are dropped and the cache is
+trimmed to a maximum size by evicting the least recently used entries.
+"""
+
+import hashlib
+import json
+import os
+import os.path as osp
+import sqlite3
+import threading
+import time
+from typing import Dict, List, Optional
+
+LLM_CACHE_POLICIES = ("always", "deterministic", "off")
+
+DEFAULT_POLICY = os.getenv("TECHSCOUT_LLM_CACHE", "off")
+
+DEFAULT_MAX_BYTES = int(os.getenv("TECHSCOUT_LLM_CACHE_MAX_MB", "256")) * 1024 * 1024
+
+# Entries older than this are evicted, in seconds
+DEFAULT_MAX_AGE = int(os.getenv("TECHSCOUT_LLM_CACHE_MAX_DAYS", "30")) * 24 * 3600
+
+
+def default_llm_cache_dir(base_dir: str) -> str:
+    """Cache location: TECHSCOUT_LLM_CACHE_DIR if set, else <base_dir>/llm_cache."""
+    return os.getenv("TECHSCOUT_LLM_CACHE_DIR") or osp.join(base_dir, "llm_cache")
+
+
+def make_llm_cache_key(
+    model: str,
+    system_message: str,
+    msg_history: List[Dict],
+    msg: str,
+    temperature: float,
+    max_tokens: int,
+) -> str:
+    """
+    Build the content address of an LLM request.
+
+    Args:
+        model: Client model name
+        system_message: System message
+        msg_history: Previous messages (provider format)
+        msg: New user message
+        temperature: Sampling temperature
+        max_tokens: Response token limit
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    request = {
+        "model": model,
+        "system": system_message,
+        "history": msg_history,
+        "msg": msg,
+        "temperature": temperature,
+        "max_tokens": max_tokens,
+    }
+    encoded = json.dumps(request, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+class LLMResponseCache:
+    """
+    Persistent LLM response cache with age and size-based LRU eviction.
+
+    Safe to share across threads; SQLite's WAL mode lets several processes
+    (e.g. a CLI run and the Streamlit app) use the same cache directory.
+    """
+
+    def __init__(
+        self,
+        cache_dir: str,
+        policy: str = "always",
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        max_age: float = DEFAULT_MAX_AGE,
+    ):
+        if policy not in LLM_CACHE_POLICIES:
+            raise ValueError(f"Unknown LLM cache policy {policy!r}; expected one of {LLM_CACHE_POLICIES}")
+        os.makedirs(cache_dir, exist_ok=True)
+        self.cache_dir = cache_dir
+        self.path = osp.join(cache_dir, "llm_responses.sqlite")
+        self.policy = policy
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS llm_responses (
+                key TEXT PRIMARY KEY,
+                model TEXT,
+                content TEXT,
+                size INTEGER,
+                created REAL,
+                last_access REAL
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_llm_responses_last_access ON llm_responses (last_access)"
+        )
+        self._conn.commit()
+
+    def accepts(self, temperature: float) -> bool:
+        """Whether the policy caches requests made at this temperature."""
+        if self.policy == "always":
+            return True
+        return self.policy == "deterministic" and temperature == 0
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached response text for a key, or None if missing or too old."""
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT content, created FROM llm_responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None or row[1] < now - self.max_age:
+                self.misses += 1
+                return None
+            self._conn.execute(
+                "UPDATE llm_responses SET last_access = ? WHERE key = ?", (now, key)
+            )
+            self._conn.commit()
+            self.hits += 1
+        return row[0]
+
+    def put(self, key: str, model: str, content: str):
+        """Store a response text."""
+        now = time.time()
+        size = len(content.encode("utf-8"))
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO llm_responses "
+                "(key, model, content, size, created, last_access) VALUES (?, ?, ?, ?, ?, ?)",
+                (key, model, content, size, now, now),
+            )
+            self._conn.commit()
+            self._evict()
+
+    def _evict(self):
+        """Drop entries older than max_age, then least recently used ones until under max_bytes."""
+        self._conn.execute(
+            "DELETE FROM llm_responses WHERE created < ?", (time.time() - self.max_age,)
+        )
+        total = self._conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM llm_responses"
+        ).fetchone()[0]
+        while total > self.max_bytes:
+            rows = self._conn.execute(
+                "SELECT key, size FROM llm_responses ORDER BY last_access LIMIT 64"
+            ).fetchall()
+            if not rows:
+                break
+            self._conn.executemany("DELETE FROM llm_responses WHERE key = ?", [(k,) for k, _ in rows])
+            total -= sum(size for _, size in rows)
+        self._conn.commit()
+
+    def clear(self):
+        """Remove every entry."""
+        with self._lock:
+            self._conn.execute("DELETE FROM llm_responses")
+            self._conn.commit()
+
+    def get_stats(self) -> Dict:
+        """Return hit/miss counters and the current entry count and size."""
+        with self._lock:
+            count, size = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM llm_responses"
+            ).fetchone()
+        return {
+            "policy": self.policy,
+            "hits": self.hits,
+            "misses": self.misses,
+            "entries": count,
+            "bytes": size,
+        }
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+# Process-wide cache used by get_response_from_llm (None = caching disabled)
+_llm_cache: Optional[LLMResponseCache] = None
+_config_lock = threading.Lock()
+
+
+def configure_llm_cache(
+    cache_dir: Optional[str],
+    policy: str = DEFAULT_POLICY,
+    max_bytes: int = DEFAULT_MAX_BYTES,
+    max_age: float = DEFAULT_MAX_AGE,
+) -> Optional[LLMResponseCache]:
+    """
+    Enable, disable or relocate the shared LLM response cache.
+
+    Args:
+        cache_dir: Directory for the cache database (see default_llm_cache_dir)
+        policy: "always", "deterministic" (temperature 0 only) or "off"
+        max_bytes: Size limit enforced by LRU eviction
+        max_age: Maximum entry age in seconds
+
+    Returns:
+        The active cache, or None if disabled
+    """
+    global _llm_cache
+    if policy not in LLM_CACHE_POLICIES:
+        raise ValueError(f"Unknown LLM cache policy {policy!r}; expected one of {LLM_CACHE_POLICIES}")
+    with _config_lock:
+        if policy == "off" or not cache_dir:
+            _llm_cache = None
+        elif _llm_cache is None or _llm_cache.cache_dir != cache_dir:
+            _llm_cache = LLMResponseCache(cache_dir, policy, max_bytes=max_bytes, max_age=max_age)
+        else:
+            _llm_cache.policy = policy
+            _llm_cache.max_bytes = max_bytes
+            _llm_cache.max_age = max_age
+        return _llm_cache
+
+
+def get_llm_cache() -> Optional[LLMResponseCache]:
+    """Return the active LLM response cache, or None if caching is disabled."""
+    return _llm_cache
@@ -0,0 +1,108 @@
+"""
+Parallel Execution Helpers
+
+This module provides small helpers for running independent blocking calls
+(search requests, LLM calls) on a bounded thread pool while keeping results
+in a deterministic, submission-ordered layout, plus the primitives shared by
+the sync and async APIs.
+"""
+
+import asyncio
+import contextvars
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, List, Sequence
+
+
+def run_parallel(
+    tasks: Sequence[Callable[[], Any]],
+    max_workers: int = 4,
+    return_exceptions: bool = False,
+) -> List[Any]:
+    """
+    Run zero-argument callables on a bounded thread pool.
+
+    Results are returned in the same order as ``tasks`` regardless of the
+    order in which they complete, mirroring ``asyncio.gather``. Each task
+    runs in a copy of the caller's context, like ``asyncio.to_thread``, so
+    context variables (e.g. the run's response cache) carry over.
+
+    Args:
+        tasks: Callables to execute
+        max_workers: Maximum number of concurrent threads (<= 1 runs inline)
+        return_exceptions: If True, exceptions are returned in place of results
+            instead of being raised
+
+    Returns:
+        List of results (or exceptions) in submission order
+    """
+    if max_workers <= 1 or len(tasks) <= 1:
+        results = []
+        for task in tasks:
+            try:
+                results.append(task())
+            except Exception as e:
+                if not return_exceptions:
+                    raise
+                results.append(e)
+        return results
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(tasks))) as executor:
+        futures = [executor.submit(contextvars.copy_context().run, task) for task in tasks]
+        results = []
+        for future in futures:
+            try:
+                results.append(future.result())
+            except Exception as e:
+                if not return_exceptions:
+                    raise
+                results.append(e)
+
+    return results
+
+
+def run_sync(coro: Awaitable) -> Any:
+    """
+    Run a coroutine to completion from synchronous code.
+
+    Uses asyncio.run() when no event loop is running in this thread; inside a
+    running loop (e.g. a notebook) the coroutine runs on a helper thread.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coro).result()
+
+
+class ProviderLimit:
+    """
+    Concurrency limit shared by threads and coroutines.
+
+    Wraps a ``threading.BoundedSemaphore`` so the sync API (``with limit:``)
+    and the async API (``async with limit:``) draw from the same slots.
+    Coroutines poll for a free slot instead of blocking the event loop.
+    """
+
+    def __init__(self, limit: int):
+        self.limit = max(1, int(limit))
+        self._semaphore = threading.BoundedSemaphore(self.limit)
+
+    def __enter__(self):
+        self._semaphore.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self._semaphore.release()
+
+    async def __aenter__(self):
+        delay = 0.005
+        while not self._semaphore.acquire(blocking=False):
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, 0.1)
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self._semaphore.release()
@@ -0,0 +1,368 @@
+"""
+Evidence Ranking Module
+
+This module ranks collected papers, patents and news before they are sent to
+the discovery prompt. Every record is scored against the domain and focus
+areas with BM25 over its title and abstract, boosted by citations and
+recency, and the final set is chosen with maximal marginal relevance (MMR)
+so that every focus area is represented instead of whichever query happened
+to run first.
+
+Scoring is vectorized: the whole corpus is tokenized in one byte-level pass,
+query terms are looked up per token at C speed, and all BM25 arithmetic runs
+on numpy arrays. MMR runs over a bounded candidate pool whose TF-IDF vectors
+are hashed into a fixed-width float32 feature space, so its cost does not
+grow with the corpus or its vocabulary (see benchmarks/bench_ranking.py).
+"""
+
+import re
+import zlib
+from collections import Counter
+from datetime import datetime
+from itertools import repeat
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+# BM25 parameters
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+# Multiplicative boosts applied on top of the normalized BM25 score
+CITATION_WEIGHT = 0.3
+RECENCY_WEIGHT = 0.3
+RECENCY_HALF_LIFE_YEARS = 2.0
+
+# MMR trade-off: 1.0 = pure relevance, 0.0 = pure diversity
+MMR_LAMBDA = 0.7
+
+# Weight of the focus-area coverage term in MMR
+COVERAGE_WEIGHT = 0.5
+
+# MMR runs over the top (limit * CANDIDATE_FACTOR) records by relevance plus
+# the top ``limit`` records of each focus area
+CANDIDATE_FACTOR = 4
+
+# Upper bound on the MMR candidate pool (raised to ``limit`` if smaller);
+# focus-area matches take at most half of it
+MAX_CANDIDATES = 1500
+
+# Width of the hashed TF-IDF feature space used for MMR similarity
+SIMILARITY_FEATURES = 1 << 12
+
+STOPWORDS = frozenset("""
+a an and are as at based be by for from in into is of on or the to using via with
+""".split())
+
+# Byte translation table for tokenizing UTF-8 text: ASCII letters are
+# lowercased, other ASCII punctuation becomes a space, and digits, non-ASCII
+# bytes and the NUL record separator are kept.
+_TOKEN_BYTES = bytes(
+    c + 32 if 65 <= c <= 90
+    else c if (48 <= c <= 57 or 97 <= c <= 122 or c >= 128 or c == 0)
+    else 32
+    for c in range(256)
+)
+_SEPARATOR = b"\x00"
+_CJK_RUN = re.compile(r"[\u3040-\u30ff\u3400-\u4dbf\u4e00-\u9fff\uac00-\ud7af]+")
+_YEAR = re.compile(r"(?<!\d)(?:19|20)\d{2}(?!\d)")
+
+
+def _stem(word: str) -> str:
+    # Light plural folding so "batteries"/"battery" and "sensors"/"sensor" match
+    if len(word) > 4 and word.endswith("ies"):
+        return word[:-3] + "y"
+    if len(word) > 3 and word.endswith("s") and not word.endswith("ss"):
+        return word[:-1]
+    return word
+
+
+def _tokenize(text: str) -> List[bytes]:
+    # Same tokenization as the corpus pass in score_records(); only ASCII is
+    # case-folded, which keeps the pass on bytes and avoids str.lower()
+    return text.encode("utf-8").translate(_TOKEN_BYTES).split()
+
+
+def _cjk_bigrams(text: str) -> List[str]:
+    bigrams = []
+    for run in _CJK_RUN.findall(text):
+        if len(run) == 1:
+            bigrams.append(run)
+        bigrams.extend(run[i:i + 2] for i in range(len(run) - 1))
+    return bigrams
+
+
+def query_terms(text: str) -> List[str]:
+    """
+    Extract the matchable terms of a query string.
+
+    Latin-script words are lowercased, stopword-filtered and plural-folded;
+    CJK runs are split into character bigrams.
+    """
+    terms = []
+    for token in _tokenize(text or ""):
+        word = token.decode("utf-8", errors="ignore")
+        if _CJK_RUN.search(word):
+            terms.extend(_cjk_bigrams(word))
+        elif word not in STOPWORDS and len(word) > 1:
+            terms.append(_stem(word))
+    return terms
+
+
+def record_text(record: Dict) -> str:
+    """Return the searchable text of a record (title, abstract, description)."""
+    return " ".join(
+        str(record.get(field) or "") for field in ("title", "abstract", "description")
+    )
+
+
+def record_year(record: Dict) -> Optional[int]:
+    """Best-effort publication year from "year", "publication_date", "date" or "published_at"."""
+    year = record.get("year")
+    if isinstance(year, int):
+        return year
+    for field in ("year", "publication_date", "date", "published_at"):
+        match = _YEAR.search(str(record.get(field) or ""))
+        if match:
+            return int(match.group())
+    return None
+
+
+def _surface_forms(term: str) -> List[str]:
+    # Inflected forms that _stem() folds back onto a query term
+    forms = [term, term + "s", term + "es"]
+    if term.endswith("y"):
+        forms.append(term[:-1] + "ies")
+    return forms
+
+
+def score_records(
+    records: Sequence[Dict],
+    domain: str,
+    focus_areas: Sequence[str],
+    citation_weight: float = CITATION_WEIGHT,
+    recency_weight: float = RECENCY_WEIGHT,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Score records against the domain and each focus area.
+
+    Args:
+        records: Papers, patents or news dicts
+        domain: Technology domain
+        focus_areas: Focus areas to cover
+        citation_weight: Boost for log-scaled citation counts
+        recency_weight: Boost for recent publications
+
+    Returns:
+        Tuple of (relevance, area_scores): relevance has shape (n,) and
+        area_scores has shape (n, len(focus_areas)), both scaled to [0, 1]
+    """
+    n = len(records)
+    queries = [query_terms(domain)] + [query_terms(area) for area in focus_areas]
+    vocabulary = sorted({term for terms in queries for term in terms})
+    if n == 0 or not vocabulary:
+        return np.zeros(n), np.zeros((n, len(focus_areas)))
+
+    term_ids = {term: i for i, term in enumerate(vocabulary)}
+    V = len(vocabulary)
+
+    # Whole-corpus pass: one byte-level split of all records joined by a
+    # separator token, then a C-level dict lookup per token. Non-matching
+    # tokens map to -1 and separators to -2.
+    token_ids = {_SEPARATOR: -2}
+    for term, i in term_ids.items():
+        if not _CJK_RUN.search(term):
+            for form in _surface_forms(term):
+                token_ids.setdefault(form.encode("utf-8"), i)
+    texts = [record_text(record) for record in records]
+    tokens = _tokenize(" \x00 ".join(texts))
+    ids = np.fromiter(
+        map(token_ids.get, tokens, repeat(-1)), dtype=np.int64, count=len(tokens)
+    )
+    doc_of = np.cumsum(ids == -2)
+    lengths = np.bincount(doc_of[ids != -2], minlength=n).astype(np.float64)
+    hit = ids >= 0
+    cells = [doc_of[hit] * V + ids[hit]]
+
+    # CJK terms are not space-delimited; match them as substrings
+    cjk_terms = sorted((t for t in vocabulary if _CJK_RUN.search(t)), key=len, reverse=True)
+    if cjk_terms:
+        matcher = re.compile("|".join(map(re.escape, cjk_terms)))
+        for d, text in enumerate(texts):
+            if not text.isascii():
+                matched = matcher.findall(text.lower())
+                lengths[d] += len(matched)
+                cells.append(np.array([d * V + term_ids[t] for t in matched], dtype=np.int64))
+
+    tf = np.bincount(np.concatenate(cells), minlength=n * V).reshape(n, V).astype(np.float64)
+
+    df = (tf > 0).sum(axis=0)
+    idf = np.log1p((n - df + 0.5) / (df + 0.5))
+    norm = BM25_K1 * (1 - BM25_B + BM25_B * lengths / max(lengths.mean(), 1.0))
+    saturated = tf * (BM25_K1 + 1) / (tf + norm[:, None])
+
+    # Query weight matrix: column 0 is domain + all focus areas, then one per area
+    weights = np.zeros((V, len(queries)))
+    for q, terms in enumerate(queries):
+        for term, count in Counter(terms).items():
+            weights[term_ids[term], q] = count
+    weights[:, 0] = weights.sum(axis=1)
+    scores = saturated @ (weights * idf[:, None])
+
+    def scaled(matrix: np.ndarray) -> np.ndarray:
+        peak = matrix.max(axis=0)
+        return matrix / np.where(peak > 0, peak, 1.0)
+
+    bm25 = scaled(scores[:, 0])
+    area_scores = scaled(scores[:, 1:])
+
+    citations = np.array([float(r.get("citations") or 0) for r in records])
+    citation_boost = np.log1p(np.maximum(citations, 0))
+    if citation_boost.max() > 0:
+        citation_boost /= citation_boost.max()
+
+    current_year = datetime.now().year
+    years = np.array([record_year(r) or np.nan for r in records], dtype=np.float64)
+    ages = np.clip(current_year - years, 0, None)
+    recency = np.nan_to_num(0.5 ** (ages / RECENCY_HALF_LIFE_YEARS), nan=0.0)
+
+    relevance = bm25 * (1 + citation_weight * citation_boost + recency_weight * recency)
+    peak = relevance.max()
+    if peak > 0:
+        relevance /= peak
+    return relevance, area_scores
+
+
+def _feature_vectors(records: Sequence[Dict], width: int = SIMILARITY_FEATURES) -> np.ndarray:
+    """
+    L2-normalized TF-IDF title+abstract vectors, hashed into ``width`` float32 columns.
+
+    Returns:
+        Array of shape (len(records), width); the dot product of two rows is
+        their cosine similarity
+    """
+    n = len(records)
+    texts = [record_text(record) for record in records]
+    tokens = _tokenize(" \x00 ".join(texts))
+
+    # Stem and hash each distinct token once; CRC32 keeps columns stable
+    # across processes (unlike hash()), stopwords map to -1, separators to -2
+    columns = {_SEPARATOR: -2}
+    for token in set(tokens):
+        if token not in columns:
+            word = _stem(token.decode("utf-8", errors="ignore"))
+            columns[token] = -1 if word in STOPWORDS else zlib.crc32(word.encode("utf-8")) % width
+    ids = np.fromiter(map(columns.__getitem__, tokens), dtype=np.int64, count=len(tokens))
+    doc_of = np.cumsum(ids == -2)
+    hit = ids >= 0
+    cells = [doc_of[hit] * width + ids[hit]]
+    for d, text in enumerate(texts):
+        if not text.isascii():
+            cells.append(np.array(
+                [d * width + zlib.crc32(b.encode("utf-8")) % width for b in _cjk_bigrams(text)],
+                dtype=np.int64,
+            ))
+
+    cell_ids, counts = np.unique(np.concatenate(cells), return_counts=True)
+    matrix = np.zeros((n, width), dtype=np.float32)
+    matrix[cell_ids // width, cell_ids % width] = np.log1p(counts)
+    idf = np.log((1 + n) / (1 + np.bincount(cell_ids % width, minlength=width))) + 1
+    matrix *= idf.astype(np.float32)
+    norms = np.linalg.norm(matrix, axis=1)
+    matrix /= np.where(norms > 0, norms, 1.0)[:, None]
+    return matrix
+
+
+def rank_records(
+    records: Sequence[Dict],
+    domain: str,
+    focus_areas: Sequence[str],
+    limit: int,
+    mmr_lambda: float = MMR_LAMBDA,
+    coverage_weight: float = COVERAGE_WEIGHT,
+) -> List[Dict]:
+    """
+    Select the ``limit`` most relevant yet diverse records.
+
+    Candidates are the top records by boosted BM25 relevance plus the best
+    matches for each focus area, so a focus area with weaker overall scores
+    still has records to choose from, up to MAX_CANDIDATES. MMR then picks
+    records greedily, trading relevance against similarity to what has
+    already been selected, with a bonus for focus areas not yet covered.
+    Ties (e.g. when no record matches any query term) keep the input order.
+
+    Args:
+        records: Papers, patents or news dicts
+        domain: Technology domain
+        focus_areas: Focus areas the selection should cover
+        limit: Number of records to return
+        mmr_lambda: Relevance/diversity trade-off (1.0 = relevance only)
+        coverage_weight: Weight of the uncovered-focus-area bonus
+
+    Returns:
+        Selected records in selection order (most valuable first)
+    """
+    # Rank even when every record fits: prompt packing may cut the list short
+    limit = min(limit, len(records))
+    if limit <= 0:
+        return []
+
+    relevance, area_scores = score_records(records, domain, focus_areas)
+
+    # Stable sort keeps input order among equal scores
+    order = np.argsort(-relevance, kind="stable")
+    max_candidates = max(MAX_CANDIDATES, limit)
+    num_areas = area_scores.shape[1]
+    area_take = min(limit, max_candidates // (2 * num_areas)) if num_areas else 0
+    pool = [np.zeros(0, dtype=order.dtype)]
+    for area in range(num_areas):
+        top = np.argsort(-area_scores[:, area], kind="stable")[:area_take]
+        pool.append(top[area_scores[top, area] > 0])
+    area_pool = np.unique(np.concatenate(pool))
+    in_pool = np.zeros(len(records), dtype=bool)
+    in_pool[area_pool] = True
+    relevance_take = min(limit * CANDIDATE_FACTOR, max_candidates - len(area_pool))
+    candidates = np.sort(np.concatenate([area_pool, order[~in_pool[order]][:relevance_take]]))
+    candidates = candidates[np.argsort(-relevance[candidates], kind="stable")]
+    if relevance[candidates].max() <= 0:
+        return [records[i] for i in order[:limit]]
+
+    rel = relevance[candidates]
+    areas = area_scores[candidates]
+    features = _feature_vectors([records[i] for i in candidates])
+    # Feature-major copy: the columns of one pick's features are contiguous rows
+    by_feature = np.ascontiguousarray(features.T)
+
+    selected: List[int] = []
+    available = np.ones(len(candidates), dtype=bool)
+    max_similarity = np.zeros(len(candidates))
+    area_hits = np.zeros(areas.shape[1])
+
+    for _ in range(limit):
+        # Coverage gain: best match to a focus area, discounted by how much
+        # of that area the selection already covers
+        coverage = (areas / (1.0 + area_hits)).max(axis=1) if areas.shape[1] else 0.0
+        gain = mmr_lambda * rel - (1 - mmr_lambda) * max_similarity + coverage_weight * coverage
+        gain = np.where(available, gain, -np.inf)
+        best = int(np.argmax(gain))
+        selected.append(best)
+        available[best] = False
+        # Similarity to the new pick, over its non-zero features only
+        nonzero = np.flatnonzero(features[best])
+        max_similarity = np.maximum(max_similarity, features[best, nonzero] @ by_feature[nonzero])
+        area_hits += areas[best]
+
+    return [records[candidates[i]] for i in selected]
+
+
+def order_records(records: Sequence[Dict], domain: str, focus_areas: Sequence[str]) -> List[Dict]:
+    """
+    Sort every record by boosted BM25 relevance (best first, ties in input order).
+
+    A linear-cost alternative to rank_records() for when all records will be
+    used anyway (e.g. sharded discovery) and MMR would be wasted work.
+    """
+    if len(records) <= 1:
+        return list(records)
+    relevance, _ = score_records(records, domain, focus_areas)
+    return [records[i] for i in np.argsort(-relevance, kind="stable")]
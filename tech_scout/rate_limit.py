@@ -0,0 +1,224 @@
+"""
+Rate Limiting Module
+
+This module provides per-host token-bucket rate limiting for the search
+layer. Every outbound search request acquires a token for its host before
+it is sent, so concurrent searches stay within each provider's budget
+without sleeping when the host is idle.
+
+Each host also has a concurrency limit (in-flight requests) shared by the
+sync and async search APIs.
+
+Budgets can be overridden from a template's prompt.json ("rate_limits") or
+from the TECHSCOUT_RATE_LIMITS environment variable, e.g.:
+
+    TECHSCOUT_RATE_LIMITS="api.openalex.org=10:10,news.google.com=0.5:2"
+
+where each entry is host=rate[:burst] with rate in requests per second.
+"""
+
+import os
+import threading
+import time
+from typing import Dict, Optional, Union
+from urllib.parse import urlparse
+
+from tech_scout.parallel import ProviderLimit
+
+# Requests per second and burst size for each search provider
+DEFAULT_HOST_BUDGETS = {
+    "api.openalex.org": {"rate": 10.0, "burst": 10},  # Polite pool allows 10 req/s
+    "api.jstage.jst.go.jp": {"rate": 1.0, "burst": 2},
+    "news.google.com": {"rate": 1.0, "burst": 3},
+    "api.lens.org": {"rate": 0.5, "burst": 2},
+    "serpapi.com": {"rate": 1.0, "burst": 2},
+    "ops.epo.org": {"rate": 0.5, "burst": 1},
+    "api.semanticscholar.org": {"rate": 1.0, "burst": 1},  # 1 req/s with an API key
+}
+
+# Budget applied to hosts without an explicit entry
+DEFAULT_BUDGET = {"rate": 1.0, "burst": 2}
+
+# Maximum in-flight requests per host unless a budget sets "concurrency"
+DEFAULT_CONCURRENCY = 4
+
+# Waits at or above this many seconds are printed as they happen
+REPORT_WAIT_THRESHOLD = 1.0
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket.
+
+    Tokens refill continuously at ``rate`` per second up to ``burst``.
+    Callers reserve a token up front (the balance may go negative) and then
+    sleep outside the lock, so waiters are served in arrival order.
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        if rate <= 0:
+            raise ValueError(f"Rate must be positive, got {rate}")
+        self.rate = float(rate)
+        self.burst = max(1, int(burst))
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Reserve one token and return how long the caller must wait."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            return max(0.0, -self._tokens / self.rate)
+
+    def acquire(self) -> float:
+        """Block until a token is available and return the time waited."""
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+
+class RateLimiter:
+    """Registry of per-host token buckets with wait-time statistics."""
+
+    def __init__(self, budgets: Optional[Dict[str, Dict]] = None):
+        self._budgets = {host: dict(budget) for host, budget in DEFAULT_HOST_BUDGETS.items()}
+        if budgets:
+            self._budgets.update(budgets)
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._limits: Dict[str, ProviderLimit] = {}
+        self._stats: Dict[str, Dict] = {}
+        self._lock = threading.Lock()
+
+    def configure(self, budgets: Dict[str, Union[float, Dict]]):
+        """
+        Override budgets for one or more hosts.
+
+        Args:
+            budgets: Mapping of host to either a rate (requests per second)
+                or a dict with "rate" and optional "burst" and "concurrency"
+        """
+        with self._lock:
+            for host, budget in budgets.items():
+                if not isinstance(budget, dict):
+                    budget = {"rate": float(budget)}
+                merged = dict(self._budgets.get(host, DEFAULT_BUDGET))
+                merged.update(budget)
+                self._budgets[host] = merged
+                # Rebuild the bucket and concurrency limit on next use
+                self._buckets.pop(host, None)
+                self._limits.pop(host, None)
+
+    def get_budget(self, host: str) -> Dict:
+        """Return the effective budget for a host."""
+        return dict(self._budgets.get(host, DEFAULT_BUDGET))
+
+    def _bucket(self, host: str) -> TokenBucket:
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                budget = self._budgets.get(host, DEFAULT_BUDGET)
+                bucket = TokenBucket(budget["rate"], budget.get("burst", 1))
+                self._buckets[host] = bucket
+            return bucket
+
+    def limit(self, url_or_host: str) -> ProviderLimit:
+        """Return the host's concurrency limit (usable with ``with`` or ``async with``)."""
+        host = _host_of(url_or_host)
+        with self._lock:
+            limit = self._limits.get(host)
+            if limit is None:
+                budget = self._budgets.get(host, DEFAULT_BUDGET)
+                limit = ProviderLimit(budget.get("concurrency", DEFAULT_CONCURRENCY))
+                self._limits[host] = limit
+            return limit
+
+    def acquire(self, url_or_host: str) -> float:
+        """
+        Wait for the host's budget and record the wait.
+
+        Args:
+            url_or_host: Request URL or bare host name
+
+        Returns:
+            Seconds spent waiting for a token
+        """
+        host = _host_of(url_or_host)
+        waited = self._bucket(host).acquire()
+
+        with self._lock:
+            stats = self._stats.setdefault(
+                host, {"requests": 0, "total_wait": 0.0, "max_wait": 0.0}
+            )
+            stats["requests"] += 1
+            stats["total_wait"] += waited
+            stats["max_wait"] = max(stats["max_wait"], waited)
+
+        if waited >= REPORT_WAIT_THRESHOLD:
+            print(f"  Rate limit: waited {waited:.1f}s for {host}")
+        return waited
+
+    def get_stats(self) -> Dict[str, Dict]:
+        """Return a copy of per-host request counts and wait times."""
+        with self._lock:
+            return {host: dict(stats) for host, stats in self._stats.items()}
+
+    def reset_stats(self):
+        """Clear collected wait statistics."""
+        with self._lock:
+            self._stats.clear()
+
+
+def _host_of(url_or_host: str) -> str:
+    if "://" in url_or_host:
+        return (urlparse(url_or_host).hostname or url_or_host).lower()
+    return url_or_host.lower()
+
+
+def parse_rate_limits(spec: str) -> Dict[str, Dict]:
+    """
+    Parse a "host=rate[:burst],..." specification.
+
+    Args:
+        spec: Comma-separated budget specification
+
+    Returns:
+        Mapping of host to budget dict
+    """
+    budgets = {}
+    for entry in spec.split(","):
+        entry = entry.strip()
+        if not entry:
+            continue
+        try:
+            host, value = entry.split("=", 1)
+            rate, _, burst = value.partition(":")
+            budget = {"rate": float(rate)}
+            if burst:
+                budget["burst"] = int(burst)
+            budgets[host.strip().lower()] = budget
+        except ValueError:
+            print(f"Warning: Ignoring invalid rate limit entry: {entry}")
+    return budgets
+
+
+# Shared limiter used by every search function
+rate_limiter = RateLimiter()
+
+_env_limits = os.getenv("TECHSCOUT_RATE_LIMITS")
+if _env_limits:
+    rate_limiter.configure(parse_rate_limits(_env_limits))
+
+
+def configure_rate_limits(budgets: Optional[Dict[str, Union[float, Dict]]]):
+    """Override per-host budgets on the shared limiter (e.g. from a template)."""
+    if budgets:
+        rate_limiter.configure(budgets)
+
+
+def get_rate_limit_stats() -> Dict[str, Dict]:
+    """Return per-host request counts and wait times from the shared limiter."""
+    return rate_limiter.get_stats()
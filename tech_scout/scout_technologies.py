@@ -5,17 +5,44 @@ This module handles the discovery and collection of emerging technologies
 from various sources including academic papers, patents, and news.
 """
 
+import asyncio
 import json
 import os
 import os.path as osp
-import time
-from typing import List, Dict, Optional, Union
+import re
+import xml.etree.ElementTree as ET
+from typing import List, Dict, Iterator, Optional, Union
 from datetime import datetime, timedelta
 
 import backoff
 import requests
 
-from tech_scout.llm import get_response_from_llm, extract_json_between_markers
+from tech_scout.llm import (
+    get_response_from_llm,
+    aget_response_from_llm,
+    extract_json_between_markers,
+)
+from tech_scout.parallel import run_parallel, run_sync
+from tech_scout.corpus_store import default_corpus_path, open_corpus
+from tech_scout.dedup import RecordIndex
+from tech_scout.evidence import (
+    build_evidence_shards,
+    compact_json,
+    describe_packing,
+    estimate_tokens,
+    evidence_token_budget,
+    pack_evidence,
+)
+from tech_scout.http_cache import mark_negative, response_cache_scope
+from tech_scout.http_client import http_get, http_post, stop_early
+from tech_scout.ranking import order_records, rank_records
+from tech_scout.streaming import (
+    CHUNK_SIZE,
+    abstract_from_inverted_index,
+    iter_json_array,
+    iter_xml_elements,
+)
+from tech_scout.rate_limit import rate_limiter, configure_rate_limits, get_rate_limit_stats
 
 # API Keys from environment
 S2_API_KEY = os.getenv("S2_API_KEY")
@@ -23,6 +50,33 @@ SERPAPI_KEY = os.getenv("SERPAPI_KEY")
 GOOGLE_NEWS_API_KEY = os.getenv("GOOGLE_NEWS_API_KEY")
 JSTAGE_AFFILIATE_ID = os.getenv("JSTAGE_AFFILIATE_ID", "")  # Optional for J-STAGE
 
+# Sources searched for every query, in the order results are merged
+SEARCH_SOURCES = ("papers", "patents", "news")
+
+# Records of each kind ranked for the discovery prompt; how many of them are
+# sent is decided by the model's evidence token budget
+PROMPT_LIMITS = {"papers": 200, "patents": 120, "news": 120}
+
+# Upper bound on map-reduce discovery shards (bounds latency and cost for
+# very large corpora; records beyond the last shard are not sent)
+MAX_DISCOVERY_SHARDS = 16
+
+# Technology fields merged as ordered unions when several lists report the
+# same technology
+TECHNOLOGY_LIST_FIELDS = ("key_capabilities", "source_types", "key_players", "key_references")
+
+# Root-level OpenAlex work fields read by _format_openalex_work()
+OPENALEX_SELECT = (
+    "id,doi,title,publication_year,cited_by_count,"
+    "abstract_inverted_index,primary_location,authorships"
+)
+
+# OpenAlex maximum page size
+OPENALEX_PAGE_SIZE = 200
+
+# Fields requested from the Semantic Scholar bulk search endpoint
+S2_BULK_FIELDS = "title,abstract,authors,year,citationCount,venue,fieldsOfStudy,publicationDate,externalIds"
+
 # =============================================================================
 # PROMPTS FOR TECHNOLOGY SCOUTING
 # =============================================================================
@@ -32,7 +86,8 @@ technology_discovery_prompt = """You are an expert technology scout analyzing em
 Your focus areas are:
 {focus_areas}
 
-Based on the following information sources:
+Based on the following information sources (one record per line; the "#" line
+names the fields, and long abstracts are truncated with "…"):
 
 <academic_papers>
 {papers}
@@ -145,14 +200,24 @@ def search_papers(
     year_end: Optional[int] = None,
     limit: int = 50,
     fields_of_study: Optional[List[str]] = None,
+    slice_years: bool = False,
+    max_workers: int = 1,
+    from_date: Optional[str] = None,
 ) -> List[Dict]:
     """
     Search for academic papers. Uses OpenAlex (free) as primary,
     falls back to Semantic Scholar if S2_API_KEY is set.
+    
+    Set slice_years (with max_workers > 1) to split large requests into
+    one sub-query per publication year. from_date ("YYYY-MM-DD") restricts
+    results to papers published on or after that day.
     """
     # Try OpenAlex first (free, no API key needed)
     try:
-        papers = search_papers_openalex(query, year_start, year_end, limit)
+        papers = search_papers_openalex(
+            query, year_start, year_end, limit,
+            slice_years=slice_years, max_workers=max_workers, from_date=from_date,
+        )
         if papers:
             return papers
     except Exception as e:
@@ -161,60 +226,187 @@ def search_papers(
     # Fall back to Semantic Scholar if API key is set
     if S2_API_KEY:
         try:
-            return search_papers_semantic_scholar(query, year_start, year_end, limit, fields_of_study)
+            return search_papers_semantic_scholar(
+                query, year_start, year_end, limit, fields_of_study,
+                slice_years=slice_years, max_workers=max_workers, from_date=from_date,
+            )
         except Exception as e:
             print(f"  Semantic Scholar search failed: {e}")
     
     return []
 
 
+def _search_year_sliced(
+    search_fn,
+    query: str,
+    year_start: int,
+    year_end: int,
+    limit: int,
+    max_workers: int,
+    **kwargs,
+) -> List[Dict]:
+    """
+    Run one sub-query per publication year concurrently and merge the results.
+    
+    Each year asks for an equal share of ``limit``; the merged list is ordered
+    by citation count like the single-query results and trimmed to ``limit``.
+    """
+    years = list(range(year_start, year_end + 1))
+    per_year = -(-limit // len(years))  # ceil division
+    tasks = [
+        (lambda year=year: search_fn(query, year, year, per_year, **kwargs))
+        for year in years
+    ]
+    papers = []
+    for result in run_parallel(tasks, max_workers=max_workers):
+        papers.extend(result)
+    papers.sort(key=lambda p: p.get("citations") or 0, reverse=True)
+    return papers[:limit]
+
+
 def search_papers_semantic_scholar(
     query: str,
     year_start: Optional[int] = None,
     year_end: Optional[int] = None,
     limit: int = 50,
     fields_of_study: Optional[List[str]] = None,
+    slice_years: bool = False,
+    max_workers: int = 1,
+    from_date: Optional[str] = None,
 ) -> List[Dict]:
-    """Search using Semantic Scholar API (requires S2_API_KEY for reliable access)."""
+    """
+    Search using the Semantic Scholar bulk search API (requires S2_API_KEY for
+    reliable access).
+    
+    The bulk endpoint returns up to 1,000 papers per call and a continuation
+    token, so large limits need only a few requests.
+    """
     if year_start is None:
         year_start = datetime.now().year - 3
     if year_end is None:
         year_end = datetime.now().year
     
-    base_url = "https://api.semanticscholar.org/graph/v1/paper/search"
+    if slice_years and year_end > year_start:
+        return _search_year_sliced(
+            search_papers_semantic_scholar, query, year_start, year_end, limit,
+            max_workers, fields_of_study=fields_of_study, from_date=from_date,
+        )
+    
+    base_url = "https://api.semanticscholar.org/graph/v1/paper/search/bulk"
     
     params = {
         "query": query,
         "year": f"{year_start}-{year_end}",
-        "limit": min(limit, 100),
-        "fields": "title,abstract,authors,year,citationCount,venue,fieldsOfStudy,publicationDate",
+        "fields": S2_BULK_FIELDS,
+        "sort": "citationCount:desc",
     }
+    if from_date:
+        params["publicationDateOrYear"] = f"{from_date}:"
     
     if fields_of_study:
         params["fieldsOfStudy"] = ",".join(fields_of_study)
     
     headers = {"x-api-key": S2_API_KEY} if S2_API_KEY else {}
     
-    response = requests.get(base_url, params=params, headers=headers, timeout=30)
-    response.raise_for_status()
+    formatted_papers = []
+    first_response = None
+    while len(formatted_papers) < limit:
+        response = http_get(base_url, params=params, headers=headers)
+        response.raise_for_status()
+        first_response = first_response or response
+        
+        data = response.json()
+        for paper in data.get("data", []) or []:
+            external_ids = paper.get("externalIds") or {}
+            formatted_papers.append({
+                "title": paper.get("title", ""),
+                "abstract": paper.get("abstract", ""),
+                "authors": [a.get("name", "") for a in paper.get("authors", []) or []],
+                "year": paper.get("year"),
+                "citations": paper.get("citationCount", 0),
+                "venue": paper.get("venue", ""),
+                "fields": paper.get("fieldsOfStudy", []),
+                "publication_date": paper.get("publicationDate"),
+                "doi": external_ids.get("DOI"),
+            })
+        
+        # Continue with the token until the results run out
+        token = data.get("token")
+        if not token or not data.get("data"):
+            break
+        params = dict(params, token=token)
+    
+    if not formatted_papers:
+        mark_negative(first_response)
+    
+    return formatted_papers[:limit]
+
+
+def _format_openalex_work(paper: Dict) -> Dict:
+    """Normalize one OpenAlex work into the common paper format."""
+    # Convert inverted index abstract to text
+    abstract = ""
+    abstract_inv = paper.get("abstract_inverted_index")
+    if abstract_inv and isinstance(abstract_inv, dict):
+        abstract = abstract_from_inverted_index(abstract_inv)
+    
+    # Safely get venue with multiple null checks
+    venue = ""
+    primary_loc = paper.get("primary_location")
+    if primary_loc and isinstance(primary_loc, dict):
+        source = primary_loc.get("source")
+        if source and isinstance(source, dict):
+            venue = source.get("display_name", "") or ""
+    
+    # Safely get authors
+    authors = []
+    for authorship in paper.get("authorships", []) or []:
+        if authorship and isinstance(authorship, dict):
+            author = authorship.get("author")
+            if author and isinstance(author, dict):
+                name = author.get("display_name", "")
+                if name:
+                    authors.append(name)
+    
+    return {
+        "title": paper.get("title", "") or "",
+        "abstract": abstract,
+        "authors": authors,
+        "year": paper.get("publication_year"),
+        "citations": paper.get("cited_by_count", 0) or 0,
+        "venue": venue,
+        "doi": paper.get("doi"),
+        "source": "openalex",
+    }
+
+
+def iter_openalex_works(response, meta: Optional[Dict] = None) -> Iterator[Dict]:
+    """
+    Parse an OpenAlex /works page incrementally and yield normalized papers.
     
-    data = response.json()
-    papers = data.get("data", [])
+    The body is read in chunks and each work is normalized as soon as it has
+    been decoded, so a page never exists in memory as one parsed document.
     
-    formatted_papers = []
-    for paper in papers:
-        formatted_papers.append({
-            "title": paper.get("title", ""),
-            "abstract": paper.get("abstract", ""),
-            "authors": [a.get("name", "") for a in paper.get("authors", [])],
-            "year": paper.get("year"),
-            "citations": paper.get("citationCount", 0),
-            "venue": paper.get("venue", ""),
-            "fields": paper.get("fieldsOfStudy", []),
-            "publication_date": paper.get("publicationDate"),
-        })
+    Args:
+        response: Streamed response (``stream=True``) or cached response
+        meta: Optional dict that receives the page's "meta" object
+            (including "next_cursor")
     
-    return formatted_papers
+    Yields:
+        Normalized paper dicts, in page order
+    """
+    header = {}
+    for work in iter_json_array(response.iter_content(CHUNK_SIZE), "results", header):
+        # "meta" precedes "results", so it is available before the first work
+        if meta is not None and not meta:
+            meta.update(header.get("meta") or {})
+        try:
+            yield _format_openalex_work(work)
+        except Exception:
+            # Skip papers with malformed data
+            continue
+    if meta is not None and not meta:
+        meta.update(header.get("meta") or {})
 
 
 @backoff.on_exception(
@@ -225,88 +417,172 @@ def search_papers_openalex(
     year_start: Optional[int] = None,
     year_end: Optional[int] = None,
     limit: int = 50,
+    slice_years: bool = False,
+    max_workers: int = 1,
+    from_date: Optional[str] = None,
 ) -> List[Dict]:
     """
     Search for academic papers using OpenAlex API (free, no key required).
     https://docs.openalex.org/
+    
+    Pages through results with cursor paging and downloads only the fields
+    that are normalized (``select=``), so limits beyond one page are cheap.
+    
+    Args:
+        query: Search query
+        year_start: Filter from year
+        year_end: Filter to year
+        limit: Maximum number of papers
+        slice_years: If True, run one sub-query per year and merge them
+        max_workers: Concurrent sub-queries when slice_years is set
+        from_date: Only papers published on or after this day ("YYYY-MM-DD")
+    
+    Returns:
+        List of normalized papers, most cited first
     """
     if year_start is None:
         year_start = datetime.now().year - 3
     if year_end is None:
         year_end = datetime.now().year
     
+    if slice_years and year_end > year_start:
+        return _search_year_sliced(
+            search_papers_openalex, query, year_start, year_end, limit, max_workers,
+            from_date=from_date,
+        )
+    
     base_url = "https://api.openalex.org/works"
     
-    # OpenAlex recommends adding email for polite pool (faster rate limits)
-    headers = {"User-Agent": "AI-TechScout/1.0 (Technology Scouting Tool)"}
+    filters = f"publication_year:{year_start}-{year_end}"
+    if from_date:
+        filters += f",from_publication_date:{from_date}"
     
     params = {
         "search": query,
-        "filter": f"publication_year:{year_start}-{year_end}",
-        "per_page": min(limit, 200),
+        "filter": filters,
+        "per_page": min(limit, OPENALEX_PAGE_SIZE),
         "sort": "cited_by_count:desc",
+        "select": OPENALEX_SELECT,
+        "cursor": "*",
     }
     
-    response = requests.get(base_url, params=params, headers=headers, timeout=30)
-    response.raise_for_status()
-    
-    data = response.json()
-    papers = data.get("results", [])
-    
     formatted_papers = []
-    for paper in papers:
-        try:
-            # Convert inverted index abstract to text
-            abstract = ""
-            abstract_inv = paper.get("abstract_inverted_index")
-            if abstract_inv and isinstance(abstract_inv, dict):
-                # Reconstruct abstract from inverted index
-                word_positions = []
-                for word, positions in abstract_inv.items():
-                    for pos in positions:
-                        word_positions.append((pos, word))
-                word_positions.sort()
-                abstract = " ".join(word for _, word in word_positions)
-            
-            # Safely get venue with multiple null checks
-            venue = ""
-            primary_loc = paper.get("primary_location")
-            if primary_loc and isinstance(primary_loc, dict):
-                source = primary_loc.get("source")
-                if source and isinstance(source, dict):
-                    venue = source.get("display_name", "") or ""
-            
-            # Safely get authors
-            authors = []
-            for authorship in paper.get("authorships", []) or []:
-                if authorship and isinstance(authorship, dict):
-                    author = authorship.get("author")
-                    if author and isinstance(author, dict):
-                        name = author.get("display_name", "")
-                        if name:
-                            authors.append(name)
-            
-            formatted_papers.append({
-                "title": paper.get("title", "") or "",
-                "abstract": abstract,
-                "authors": authors,
-                "year": paper.get("publication_year"),
-                "citations": paper.get("cited_by_count", 0) or 0,
-                "venue": venue,
-                "doi": paper.get("doi"),
-                "source": "openalex",
-            })
-        except Exception:
-            # Skip papers with malformed data
-            continue
+    first_response = None
+    while len(formatted_papers) < limit:
+        # User-Agent and the polite-pool mailto are added by the session layer
+        response = http_get(base_url, params=params, stream=True)
+        response.raise_for_status()
+        first_response = first_response or response
+        
+        meta = {}
+        count_before = len(formatted_papers)
+        formatted_papers.extend(iter_openalex_works(response, meta))
+        
+        next_cursor = meta.get("next_cursor")
+        if not next_cursor or len(formatted_papers) == count_before:
+            break
+        params = dict(params, cursor=next_cursor)
     
-    return formatted_papers
+    if not formatted_papers:
+        mark_negative(first_response)
+    
+    return formatted_papers[:limit]
 
 
 # =============================================================================
 # J-STAGE SEARCH (Japanese Academic Papers)
 # =============================================================================
 
+ATOM_NS = "{http://www.w3.org/2005/Atom}"
+PRISM_NS = "{http://prismstandard.org/namespaces/basic/2.0/}"
+
+# Entry elements in J-STAGE's OpenSearch (Atom) and RSS-style responses
+JSTAGE_ENTRY_TAGS = frozenset(["entry", ATOM_NS + "entry", "item"])
+
+# Child tag -> (field, priority); when several tags map to one field, the
+# lowest priority that has text wins. Built once so each entry is read in a
+# single pass over its children instead of probing every tag variant.
+JSTAGE_FIELD_TAGS = {
+    "title": ("title", 0),
+    ATOM_NS + "title": ("title", 1),
+    "abstract": ("abstract", 0),
+    "description": ("abstract", 1),
+    "summary": ("abstract", 2),
+    PRISM_NS + "abstract": ("abstract", 3),
+    ATOM_NS + "summary": ("abstract", 4),
+    "pubdate": ("date", 0),
+    PRISM_NS + "publicationDate": ("date", 1),
+    "published": ("date", 2),
+    ATOM_NS + "published": ("date", 3),
+    "doi": ("doi", 0),
+    "id": ("doi", 1),
+    PRISM_NS + "doi": ("doi", 2),
+    ATOM_NS + "id": ("doi", 3),
+    "cdjournal": ("journal", 0),
+    PRISM_NS + "publicationName": ("journal", 1),
+    "source": ("journal", 2),
+    "author": ("author", 0),
+    ATOM_NS + "author": ("author", 0),
+    "creator": ("author", 0),
+}
+
+JSTAGE_NAME_TAGS = frozenset(["name", ATOM_NS + "name"])
+
+
+def _format_jstage_entry(entry) -> Optional[Dict]:
+    """Normalize one J-STAGE entry element; returns None if it has no title."""
+    fields = {}
+    dois = []
+    authors = []
+    for child in entry:
+        field, priority = JSTAGE_FIELD_TAGS.get(child.tag, (None, 0))
+        if field == "author":
+            # Prefer a nested <name>; fall back to the element text
+            name = next(
+                (e.text.strip() for e in child.iter() if e.tag in JSTAGE_NAME_TAGS and e.text),
+                (child.text or "").strip(),
+            )
+            if name:
+                authors.append(name)
+        elif field == "doi":
+            if child.text and child.text.strip():
+                dois.append((priority, child.text.strip()))
+        elif field and child.text and child.text.strip():
+            if field not in fields or priority < fields[field][0]:
+                fields[field] = (priority, child.text.strip())
+    
+    title = fields.get("title", (0, ""))[1]
+    if not title:  # Only add if we at least have a title
+        return None
+    
+    year = None
+    if "date" in fields:
+        try:
+            year = int(fields["date"][1][:4])
+        except (ValueError, TypeError):
+            pass
+    
+    # Prefer an identifier that looks like a DOI
+    doi = ""
+    for _, value in sorted(dois):
+        doi = value
+        if "doi.org" in value or value.startswith("10."):
+            break
+    
+    abstract = fields.get("abstract", (0, ""))[1]
+    return {
+        "title": title,
+        "abstract": abstract[:1000] if abstract else "",
+        "authors": authors[:10],  # Limit authors
+        "year": year,
+        "citations": 0,  # J-STAGE doesn't provide citation counts
+        "venue": fields.get("journal", (0, ""))[1],
+        "doi": doi,
+        "source": "jstage",
+        "region": "Japan",
+    }
+
+
 @backoff.on_exception(
     backoff.expo, requests.exceptions.RequestException, max_tries=3
 )
@@ -350,106 +626,34 @@ def search_papers_jstage(
     if JSTAGE_AFFILIATE_ID:
         params["affiliate"] = JSTAGE_AFFILIATE_ID
     
-    headers = {
-        "User-Agent": "AI-TechScout/1.0",
-        "Accept": "application/xml",
-    }
-    
-    response = requests.get(base_url, params=params, headers=headers, timeout=30)
+    headers = {"Accept": "application/xml"}
+    response = http_get(
+        base_url, params=params, headers=headers, stream=True, cache_extra={"limit": limit}
+    )
     response.raise_for_status()
     
-    # Parse XML response
-    import xml.etree.ElementTree as ET
+    formatted_papers = []
     
+    # Parse entries as they arrive and stop reading once we have enough
     try:
-        root = ET.fromstring(response.content)
+        for entry in iter_xml_elements(response.iter_content(CHUNK_SIZE), JSTAGE_ENTRY_TAGS):
+            try:
+                paper = _format_jstage_entry(entry)
+            except Exception:
+                # Skip malformed entries
+                continue
+            if paper:
+                formatted_papers.append(paper)
+                if len(formatted_papers) >= limit:
+                    stop_early(response)
+                    break
     except ET.ParseError:
         print("  J-STAGE returned invalid XML")
-        return []
+    finally:
+        response.close()
     
-    # J-STAGE returns OpenSearch format
-    ns = {
-        'atom': 'http://www.w3.org/2005/Atom',
-        'prism': 'http://prismstandard.org/namespaces/basic/2.0/',
-    }
-    
-    formatted_papers = []
-    
-    for entry in root.findall('.//entry', ns) or root.findall('.//item'):
-        try:
-            # Try different XML structures
-            title = ""
-            abstract = ""
-            authors = []
-            year = None
-            doi = ""
-            journal = ""
-            
-            # Get title
-            title_elem = entry.find('title') or entry.find('.//{http://www.w3.org/2005/Atom}title')
-            if title_elem is not None and title_elem.text:
-                title = title_elem.text.strip()
-            
-            # Get abstract/description
-            for tag in ['abstract', 'description', 'summary', 
-                       '{http://prismstandard.org/namespaces/basic/2.0/}abstract',
-                       '{http://www.w3.org/2005/Atom}summary']:
-                elem = entry.find(tag)
-                if elem is not None and elem.text:
-                    abstract = elem.text.strip()
-                    break
-            
-            # Get authors
-            for author_tag in ['author', '{http://www.w3.org/2005/Atom}author', 'creator']:
-                for author in entry.findall(author_tag):
-                    name_elem = author.find('name') or author.find('{http://www.w3.org/2005/Atom}name')
-                    if name_elem is not None and name_elem.text:
-                        authors.append(name_elem.text.strip())
-                    elif author.text:
-                        authors.append(author.text.strip())
-            
-            # Get year
-            for date_tag in ['pubdate', '{http://prismstandard.org/namespaces/basic/2.0/}publicationDate',
-                            'published', '{http://www.w3.org/2005/Atom}published']:
-                date_elem = entry.find(date_tag)
-                if date_elem is not None and date_elem.text:
-                    try:
-                        year = int(date_elem.text[:4])
-                    except (ValueError, TypeError):
-                        pass
-                    break
-            
-            # Get DOI
-            for id_tag in ['doi', 'id', '{http://prismstandard.org/namespaces/basic/2.0/}doi']:
-                id_elem = entry.find(id_tag)
-                if id_elem is not None and id_elem.text:
-                    doi = id_elem.text.strip()
-                    if 'doi.org' in doi or doi.startswith('10.'):
-                        break
-            
-            # Get journal name
-            for journal_tag in ['cdjournal', '{http://prismstandard.org/namespaces/basic/2.0/}publicationName',
-                               'source']:
-                journal_elem = entry.find(journal_tag)
-                if journal_elem is not None and journal_elem.text:
-                    journal = journal_elem.text.strip()
-                    break
-            
-            if title:  # Only add if we at least have a title
-                formatted_papers.append({
-                    "title": title,
-                    "abstract": abstract[:1000] if abstract else "",
-                    "authors": authors[:10],  # Limit authors
-                    "year": year,
-                    "citations": 0,  # J-STAGE doesn't provide citation counts
-                    "venue": journal,
-                    "doi": doi,
-                    "source": "jstage",
-                    "region": "Japan",
-                })
-        except Exception:
-            # Skip malformed entries
-            continue
+    if not formatted_papers:
+        mark_negative(response)
     
     return formatted_papers
 
@@ -465,6 +669,8 @@ def search_papers_all(
     limit: int = 50,
     include_japan: bool = False,
     fields_of_study: Optional[List[str]] = None,
+    max_workers: int = 1,
+    from_date: Optional[str] = None,
 ) -> List[Dict]:
     """
     Search papers from multiple sources, optionally including Japanese sources.
@@ -476,25 +682,36 @@ def search_papers_all(
         limit: Max results per source
         include_japan: If True, also search J-STAGE for Japanese papers
         fields_of_study: Optional list of fields to filter by
+        max_workers: If > 1, query the global and Japanese sources concurrently
+        from_date: Only papers published on or after this day ("YYYY-MM-DD");
+            J-STAGE only filters by year
     
     Returns:
         Combined list of papers from all sources
     """
-    all_papers = []
+    def search_global():
+        return search_papers(
+            query, year_start, year_end, limit, fields_of_study, from_date=from_date
+        )
     
-    # Always search global sources
-    global_papers = search_papers(query, year_start, year_end, limit, fields_of_study)
-    all_papers.extend(global_papers)
-    
-    # Add Japanese sources if requested
-    if include_japan:
+    def search_japan():
         try:
             print(f"  Searching J-STAGE (Japan) for: {query[:50]}...")
             jstage_papers = search_papers_jstage(query, year_start, year_end, limit // 2)
-            all_papers.extend(jstage_papers)
             print(f"  Found {len(jstage_papers)} papers from J-STAGE")
+            return jstage_papers
         except Exception as e:
             print(f"  J-STAGE search failed: {e}")
+            return []
+    
+    # Always search global sources, add Japanese sources if requested
+    tasks = [search_global]
+    if include_japan:
+        tasks.append(search_japan)
+    
+    all_papers = []
+    for papers in run_parallel(tasks, max_workers=max_workers):
+        all_papers.extend(papers)
     
     return all_papers
 
@@ -511,9 +728,14 @@ def search_patents(
     year_start: Optional[int] = None,
     limit: int = 30,
     country: str = "US",
+    from_date: Optional[str] = None,
 ) -> List[Dict]:
     """
     Search for patents. Tries multiple sources.
+    
+    from_date ("YYYY-MM-DD") restricts results to patents published on or
+    after that day where the source supports it (SerpAPI, Lens.org); EPO OPS
+    only filters by year_start.
     """
     if year_start is None:
         year_start = datetime.now().year - 5
@@ -521,7 +743,7 @@ def search_patents(
     # Try SerpAPI if available and configured (most reliable for patents)
     if SERPAPI_KEY and SERPAPI_KEY not in ["", "your-serpapi-key-here"]:
         try:
-            results = search_patents_serpapi(query, year_start, limit, country)
+            results = search_patents_serpapi(query, year_start, limit, country, from_date)
             if results:
                 return results
         except Exception as e:
@@ -529,7 +751,7 @@ def search_patents(
     
     # Fallback: Try Google Patents via web scraping
     try:
-        return search_patents_google_fallback(query, year_start, limit)
+        return search_patents_google_fallback(query, year_start, limit, from_date)
     except Exception as e:
         print(f"  Google Patents fallback failed: {e}")
     
@@ -540,6 +762,7 @@ def search_patents_google_fallback(
     query: str,
     year_start: int,
     limit: int,
+    from_date: Optional[str] = None,
 ) -> List[Dict]:
     """Fallback patent search using Lens.org free API."""
     
@@ -556,7 +779,7 @@ def search_patents_google_fallback(
                     {"match": {"title": clean_query}}
                 ],
                 "filter": [
-                    {"range": {"date_published": {"gte": f"{year_start}-01-01"}}}
+                    {"range": {"date_published": {"gte": from_date or f"{year_start}-01-01"}}}
                 ]
             }
         },
@@ -564,14 +787,11 @@ def search_patents_google_fallback(
         "sort": [{"date_published": "desc"}]
     }
     
-    headers = {
-        "Content-Type": "application/json",
-        "User-Agent": "AI-TechScout/1.0"
-    }
+    headers = {"Content-Type": "application/json"}
     
     # Try Lens.org first
     try:
-        response = requests.post(base_url, json=payload, headers=headers, timeout=15)
+        response = http_post(base_url, json=payload, headers=headers)
         if response.status_code == 200:
             data = response.json()
             patents = data.get("data", [])
@@ -590,6 +810,7 @@ def search_patents_google_fallback(
             
             if formatted_patents:
                 return formatted_patents
+            mark_negative(response)
     except Exception:
         pass
     
@@ -617,12 +838,8 @@ def search_patents_epo_ops(
     # Use the published-data/search endpoint
     url = f"https://ops.epo.org/3.2/rest-services/published-data/search?q=ti%3D{encoded_query}&Range=1-{min(limit, 25)}"
     
-    headers = {
-        "Accept": "application/json",
-        "User-Agent": "AI-TechScout/1.0"
-    }
-    
-    response = requests.get(url, headers=headers, timeout=20)
+    headers = {"Accept": "application/json"}
+    response = http_get(url, headers=headers)
     
     if response.status_code == 403:
         # EPO requires OAuth for some endpoints, skip gracefully
@@ -657,6 +874,9 @@ def search_patents_epo_ops(
             "source": "epo_ops",
         })
     
+    if not formatted_patents:
+        mark_negative(response)
+    
     return formatted_patents
 
 
@@ -665,6 +885,7 @@ def search_patents_serpapi(
     year_start: int,
     limit: int,
     country: str,
+    from_date: Optional[str] = None,
 ) -> List[Dict]:
     """Search patents using SerpAPI Google Patents."""
     base_url = "https://serpapi.com/search"
@@ -675,8 +896,9 @@ def search_patents_serpapi(
         "api_key": SERPAPI_KEY,
         "num": limit,
     }
-    
-    response = requests.get(base_url, params=params, timeout=30)
+    if from_date:
+        params["after"] = f"publication:{from_date.replace('-', '')}"
+    response = http_get(base_url, params=params)
     response.raise_for_status()
     
     data = response.json()
@@ -694,6 +916,9 @@ def search_patents_serpapi(
             "source": "serpapi",
         })
     
+    if not formatted_patents:
+        mark_negative(response)
+    
     return formatted_patents
 
 # =============================================================================
@@ -707,10 +932,14 @@ def search_news(
     query: str,
     days_back: int = 90,
     limit: int = 30,
+    from_date: Optional[str] = None,
 ) -> List[Dict]:
     """
     Search for recent news articles about a technology topic.
     Uses free sources first, then NewsAPI if configured.
+    
+    from_date ("YYYY-MM-DD") asks Google News for articles published after
+    that day; NewsAPI is bounded by days_back.
     """
     # Calculate date range
     end_date = datetime.now()
@@ -718,7 +947,7 @@ def search_news(
     
     # Try Google News RSS (free, no API key)
     try:
-        articles = search_news_google_rss(query, limit)
+        articles = search_news_google_rss(query, limit, from_date)
         if articles:
             return articles
     except Exception as e:
@@ -735,44 +964,60 @@ def search_news(
     return []
 
 
+def _format_rss_item(item, default_source: str, region: Optional[str] = None) -> Dict:
+    """Normalize one Google News RSS <item> element."""
+    title = item.find("title")
+    link = item.find("link")
+    pub_date = item.find("pubDate")
+    source = item.find("source")
+    
+    article = {
+        "title": title.text if title is not None else "",
+        "description": "",  # RSS doesn't include description
+        "source": source.text if source is not None else default_source,
+        "author": "",
+        "published_at": pub_date.text if pub_date is not None else "",
+        "url": link.text if link is not None else "",
+    }
+    if region:
+        article["region"] = region
+    return article
+
+
 def search_news_google_rss(
     query: str,
     limit: int = 30,
+    from_date: Optional[str] = None,
 ) -> List[Dict]:
     """
     Search news using Google News RSS feed (free, no API key).
+    from_date ("YYYY-MM-DD") adds Google's after: search operator.
     """
     import urllib.parse
     
+    if from_date:
+        query = f"{query} after:{from_date}"
+    
     # Google News RSS endpoint
     encoded_query = urllib.parse.quote(query)
     url = f"https://news.google.com/rss/search?q={encoded_query}&hl=en-US&gl=US&ceid=US:en"
     
-    headers = {"User-Agent": "AI-TechScout/1.0"}
-    response = requests.get(url, headers=headers, timeout=30)
+    response = http_get(url, stream=True, cache_extra={"limit": limit})
     response.raise_for_status()
     
-    # Parse RSS XML
-    import xml.etree.ElementTree as ET
-    root = ET.fromstring(response.content)
-    
+    # Parse RSS items as they arrive and stop reading once we have enough
     formatted_articles = []
-    items = root.findall(".//item")[:limit]
+    try:
+        for item in iter_xml_elements(response.iter_content(CHUNK_SIZE), ("item",)):
+            formatted_articles.append(_format_rss_item(item, "Google News"))
+            if len(formatted_articles) >= limit:
+                stop_early(response)
+                break
+    finally:
+        response.close()
     
-    for item in items:
-        title = item.find("title")
-        link = item.find("link")
-        pub_date = item.find("pubDate")
-        source = item.find("source")
-        
-        formatted_articles.append({
-            "title": title.text if title is not None else "",
-            "description": "",  # RSS doesn't include description
-            "source": source.text if source is not None else "Google News",
-            "author": "",
-            "published_at": pub_date.text if pub_date is not None else "",
-            "url": link.text if link is not None else "",
-        })
+    if not formatted_articles:
+        mark_negative(response)
     
     return formatted_articles
 
@@ -794,8 +1039,7 @@ def search_news_newsapi(
         "pageSize": min(limit, 100),
         "apiKey": GOOGLE_NEWS_API_KEY,
     }
-    
-    response = requests.get(base_url, params=params, timeout=30)
+    response = http_get(base_url, params=params)
     response.raise_for_status()
     
     data = response.json()
@@ -812,6 +1056,9 @@ def search_news_newsapi(
             "url": article.get("url", ""),
         })
     
+    if not formatted_articles:
+        mark_negative(response)
+    
     return formatted_articles
 
 
@@ -823,27 +1070,35 @@ def search_news_japan(
     query: str,
     days_back: int = 90,
     limit: int = 30,
+    max_workers: int = 1,
+    from_date: Optional[str] = None,
 ) -> List[Dict]:
     """
     Search for news from Japan-focused sources.
     Uses Google News Japan + supplementary Japanese tech news sources.
+    Both feeds are fetched concurrently when max_workers > 1.
+    from_date ("YYYY-MM-DD") restricts both feeds to newer articles.
     """
-    all_articles = []
-    
     # 1. Google News Japan RSS (Japanese results)
-    try:
-        jp_articles = search_news_google_rss_japan(query, limit // 2)
-        all_articles.extend(jp_articles)
-    except Exception as e:
-        print(f"  Google News Japan failed: {e}")
+    def search_jp_locale():
+        try:
+            return search_news_google_rss_japan(query, limit // 2, from_date)
+        except Exception as e:
+            print(f"  Google News Japan failed: {e}")
+            return []
     
     # 2. Try general Google News with Japan context
-    try:
-        japan_query = f"{query} Japan Japanese"
-        global_jp_articles = search_news_google_rss(japan_query, limit // 2)
-        all_articles.extend(global_jp_articles)
-    except Exception as e:
-        print(f"  Google News global Japan failed: {e}")
+    def search_global_locale():
+        try:
+            japan_query = f"{query} Japan Japanese"
+            return search_news_google_rss(japan_query, limit // 2, from_date)
+        except Exception as e:
+            print(f"  Google News global Japan failed: {e}")
+            return []
+    
+    all_articles = []
+    for articles in run_parallel([search_jp_locale, search_global_locale], max_workers=max_workers):
+        all_articles.extend(articles)
     
     # Remove duplicates based on title
     seen_titles = set()
@@ -860,54 +1115,241 @@ def search_news_japan(
 def search_news_google_rss_japan(
     query: str,
     limit: int = 30,
+    from_date: Optional[str] = None,
 ) -> List[Dict]:
     """
     Search news using Google News RSS feed with Japan locale.
     Can search in English or Japanese.
+    from_date ("YYYY-MM-DD") adds Google's after: search operator.
     """
     import urllib.parse
     
+    if from_date:
+        query = f"{query} after:{from_date}"
+    
     # Google News RSS endpoint - Japan locale
     encoded_query = urllib.parse.quote(query)
     
     # Use Japan Google News (English interface but Japan news)
     url = f"https://news.google.com/rss/search?q={encoded_query}&hl=en&gl=JP&ceid=JP:en"
     
-    headers = {"User-Agent": "AI-TechScout/1.0"}
-    response = requests.get(url, headers=headers, timeout=30)
+    response = http_get(url, stream=True, cache_extra={"limit": limit})
     response.raise_for_status()
     
-    # Parse RSS XML
-    import xml.etree.ElementTree as ET
-    root = ET.fromstring(response.content)
-    
+    # Parse RSS items as they arrive and stop reading once we have enough
     formatted_articles = []
-    items = root.findall(".//item")[:limit]
+    try:
+        for item in iter_xml_elements(response.iter_content(CHUNK_SIZE), ("item",)):
+            formatted_articles.append(_format_rss_item(item, "Google News Japan", region="Japan"))
+            if len(formatted_articles) >= limit:
+                stop_early(response)
+                break
+    finally:
+        response.close()
     
-    for item in items:
-        title = item.find("title")
-        link = item.find("link")
-        pub_date = item.find("pubDate")
-        source = item.find("source")
-        
-        formatted_articles.append({
-            "title": title.text if title is not None else "",
-            "description": "",
-            "source": source.text if source is not None else "Google News Japan",
-            "author": "",
-            "published_at": pub_date.text if pub_date is not None else "",
-            "url": link.text if link is not None else "",
-            "region": "Japan",
-        })
+    if not formatted_articles:
+        mark_negative(response)
     
     return formatted_articles
 
 
+# =============================================================================
+# ASYNC SEARCH API
+# =============================================================================
+# The async variants run the blocking search functions on worker threads, so
+# they go through the same session layer and per-host rate and concurrency
+# limits as the sync API and both can be mixed in one process.
+
+async def asearch_papers(
+    query: str,
+    year_start: Optional[int] = None,
+    year_end: Optional[int] = None,
+    limit: int = 50,
+    fields_of_study: Optional[List[str]] = None,
+    slice_years: bool = False,
+    max_workers: int = 1,
+    from_date: Optional[str] = None,
+) -> List[Dict]:
+    """Async variant of search_papers()."""
+    return await asyncio.to_thread(
+        search_papers, query, year_start, year_end, limit, fields_of_study,
+        slice_years, max_workers, from_date,
+    )
+
+
+async def asearch_papers_all(
+    query: str,
+    year_start: Optional[int] = None,
+    year_end: Optional[int] = None,
+    limit: int = 50,
+    include_japan: bool = False,
+    fields_of_study: Optional[List[str]] = None,
+    max_workers: int = 2,
+    from_date: Optional[str] = None,
+) -> List[Dict]:
+    """Async variant of search_papers_all()."""
+    return await asyncio.to_thread(
+        search_papers_all, query, year_start, year_end, limit,
+        include_japan, fields_of_study, max_workers, from_date,
+    )
+
+
+async def asearch_patents(
+    query: str,
+    year_start: Optional[int] = None,
+    limit: int = 30,
+    country: str = "US",
+    from_date: Optional[str] = None,
+) -> List[Dict]:
+    """Async variant of search_patents()."""
+    return await asyncio.to_thread(search_patents, query, year_start, limit, country, from_date)
+
+
+async def asearch_news(
+    query: str,
+    days_back: int = 90,
+    limit: int = 30,
+    from_date: Optional[str] = None,
+) -> List[Dict]:
+    """Async variant of search_news()."""
+    return await asyncio.to_thread(search_news, query, days_back, limit, from_date)
+
+
+async def asearch_news_japan(
+    query: str,
+    days_back: int = 90,
+    limit: int = 30,
+    max_workers: int = 2,
+    from_date: Optional[str] = None,
+) -> List[Dict]:
+    """Async variant of search_news_japan()."""
+    return await asyncio.to_thread(
+        search_news_japan, query, days_back, limit, max_workers, from_date
+    )
+
+
 # =============================================================================
 # MAIN SCOUTING FUNCTION
 # =============================================================================
 
-def scout_technologies(
+def load_previous_results(results_file: str) -> Optional[Dict]:
+    """
+    Load a previous scouting run for incremental mode.
+    
+    Returns None if the file is missing, unreadable, or lacks the
+    "scouting_date" watermark or raw corpus needed to run incrementally.
+    """
+    if not osp.exists(results_file):
+        return None
+    try:
+        with open(results_file, "r") as f:
+            previous = json.load(f)
+        datetime.fromisoformat(previous["scouting_date"])
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+    if not isinstance(previous.get("raw_data"), dict):
+        return None
+    return previous
+
+
+def merge_technologies(previous: List[Dict], new: List[Dict]) -> List[Dict]:
+    """
+    Merge technology lists by name (case-insensitive).
+    
+    Entries in ``new`` replace previous entries of the same name; the
+    previous order is kept and newly discovered technologies are appended.
+    """
+    def key(tech: Dict) -> str:
+        return str(tech.get("name") or tech.get("title") or "").strip().lower()
+    
+    updates = {key(tech): tech for tech in new if isinstance(tech, dict)}
+    merged = []
+    for tech in previous:
+        if isinstance(tech, dict):
+            merged.append(updates.pop(key(tech), tech))
+    merged.extend(updates.values())
+    return merged
+
+
+def _singular(word: str) -> str:
+    if len(word) > 4 and word.endswith("ies"):
+        return word[:-3] + "y"
+    if len(word) > 3 and word.endswith("s") and not word.endswith("ss"):
+        return word[:-1]
+    return word
+
+
+def _technology_key(name: str) -> str:
+    # "Solid-State Batteries" -> "solid_state_battery"
+    return "_".join(_singular(w) for w in re.findall(r"[^\W_]+", str(name or "").lower()))
+
+
+def reduce_technologies(technology_lists: List[List[Dict]]) -> List[Dict]:
+    """
+    Merge per-shard technology lists into one deduplicated list.
+    
+    Technologies match on their normalized name or title (case, separators
+    and plurals ignored). The first occurrence, from the best-ranked shard,
+    keeps its scalar fields; list fields such as key_players are merged as
+    ordered unions. The result is ordered by how many lists reported each
+    technology, then by first appearance.
+    """
+    merged: List[Dict] = []
+    support: List[int] = []
+    index: Dict[str, int] = {}
+    for technologies in technology_lists:
+        reported = set()
+        for tech in technologies or []:
+            if not isinstance(tech, dict):
+                continue
+            keys = [k for k in (_technology_key(tech.get("name")), _technology_key(tech.get("title"))) if k]
+            position = next((index[k] for k in keys if k in index), None)
+            if position is None:
+                position = len(merged)
+                merged.append(dict(tech))
+                support.append(0)
+            else:
+                target = merged[position]
+                for field in TECHNOLOGY_LIST_FIELDS:
+                    values = target.get(field)
+                    if isinstance(values, list) and isinstance(tech.get(field), list):
+                        target[field] = values + [v for v in tech[field] if v not in values]
+            if position not in reported:
+                reported.add(position)
+                support[position] += 1
+            for k in keys:
+                index.setdefault(k, position)
+    order = sorted(range(len(merged)), key=lambda i: (-support[i], i))
+    return [merged[i] for i in order]
+
+
+def select_incremental_evidence(
+    new_records: List[Dict],
+    old_records: List[Dict],
+    domain: str,
+    focus_areas: List[str],
+    limit: int,
+) -> List[Dict]:
+    """
+    Pick prompt evidence for an incremental run: the top-ranked new records,
+    filled up with the top-ranked records from the previous corpus. A third
+    of the slots is kept for old records so discovery still sees context.
+    
+    Every third record is an old one while both lists last, so a token
+    budget that cuts the list short still keeps that mix.
+    """
+    reserve_old = min(len(old_records), limit // 3)
+    new = rank_records(new_records, domain, focus_areas, limit - reserve_old)
+    old = rank_records(old_records, domain, focus_areas, limit - len(new))
+    selected = []
+    while new or old:
+        selected.extend(new[:2])
+        selected.extend(old[:1])
+        new, old = new[2:], old[1:]
+    return selected
+
+
+async def ascout_technologies(
     base_dir: str,
     client,
     model: str,
@@ -918,9 +1360,22 @@ def scout_technologies(
     num_reflections: int = 3,
     year_lookback: int = 3,
     region_focus: Optional[str] = None,
+    max_workers: int = 1,
+    use_cache: bool = True,
+    refresh_cache: bool = False,
+    cache_dir: Optional[str] = None,
+    incremental: bool = False,
+    use_corpus: bool = True,
+    corpus_path: Optional[str] = None,
+    map_reduce: bool = False,
+    shard_concurrency: int = 4,
+    max_shards: int = MAX_DISCOVERY_SHARDS,
 ) -> Dict:
     """
-    Main function to scout for emerging technologies in a given domain.
+    Main coroutine to scout for emerging technologies in a given domain.
+    
+    Searches and LLM calls are awaited, so several domains can be scouted
+    concurrently on one event loop.
     
     Args:
         base_dir: Directory to store results
@@ -929,10 +1384,31 @@ def scout_technologies(
         domain: Technology domain to scout (e.g., "AI/ML", "Biotechnology")
         focus_areas: List of specific areas to focus on
         search_queries: List of search queries to use
-        skip_search: Skip searching and use cached results
+        skip_search: Skip searching and use cached results; without a
+            previous scouting_results.json, evidence is pulled from the local
+            corpus store by full-text match instead of the remote APIs
         num_reflections: Number of refinement iterations
         year_lookback: How many years back to search
         region_focus: Optional region focus (e.g., "japan", "eu", "us")
+        max_workers: Number of (query, source) searches to run concurrently;
+            1 searches sequentially
+        use_cache: Serve search responses from the on-disk response cache
+        refresh_cache: Ignore cached responses but store fresh ones
+        cache_dir: Cache location; defaults to TECHSCOUT_CACHE_DIR or
+            <base_dir>/http_cache
+        incremental: Only fetch records published since the previous run's
+            scouting_date, merge them into its corpus, and re-run discovery
+            over the new records plus the top-ranked old ones (falls back to
+            a full run if there is no previous scouting_results.json)
+        use_corpus: Write collected records to the local corpus store
+        corpus_path: Corpus store location; defaults to TECHSCOUT_CORPUS_PATH
+            or <base_dir>/corpus.sqlite
+        map_reduce: Split the whole relevance-ordered corpus into prompt-sized
+            shards, run discovery on each shard in parallel and merge the
+            per-shard technology lists before refinement, instead of a
+            single discovery call over the top-ranked records
+        shard_concurrency: Discovery calls in flight at once in map-reduce mode
+        max_shards: Maximum number of shards in map-reduce mode
     
     Returns:
         Dictionary with discovered technologies and analysis
@@ -945,68 +1421,186 @@ def scout_technologies(
         with open(results_file, "r") as f:
             return json.load(f)
     
-    # Check template for region focus
-    prompt_file = osp.join(base_dir, "prompt.json")
-    if osp.exists(prompt_file):
-        with open(prompt_file, "r") as f:
-            prompt_config = json.load(f)
-        # Override region_focus from template if not provided
-        if region_focus is None:
-            region_focus = prompt_config.get("region_focus")
-    
-    include_japan = region_focus and region_focus.lower() in ["japan", "jp", "asia"]
-    
-    print(f"Starting technology scouting for domain: {domain}")
-    print(f"Focus areas: {', '.join(focus_areas)}")
-    if region_focus:
-        print(f"Region focus: {region_focus}")
-    
-    # Collect data from all sources
-    all_papers = []
-    all_patents = []
-    all_news = []
-    
-    year_start = datetime.now().year - year_lookback
-    year_end = datetime.now().year
-    
-    for query in search_queries:
-        print(f"\nSearching for: {query}")
-        
-        # Search academic papers (global + region-specific)
-        try:
-            if include_japan:
-                papers = search_papers_all(
-                    query, year_start, year_end, limit=30, include_japan=True
-                )
-            else:
-                papers = search_papers(query, year_start, year_end, limit=30)
-            all_papers.extend(papers)
-            print(f"  Found {len(papers)} papers")
-            time.sleep(1)  # Rate limiting
-        except Exception as e:
-            print(f"  Paper search failed: {e}")
-        
-        # Search patents
-        try:
-            patent_country = "JP" if include_japan else "US"
-            patents = search_patents(query, year_start, limit=20, country=patent_country)
-            all_patents.extend(patents)
-            print(f"  Found {len(patents)} patents")
-            time.sleep(1)
-        except Exception as e:
-            print(f"  Patent search failed: {e}")
+    corpus = open_corpus(corpus_path or default_corpus_path(base_dir)) if use_corpus else None
+    try:
+        offline = skip_search and corpus is not None and corpus.count() > 0
+        if skip_search and not offline:
+            print("No cached results or local corpus; searching remote sources.")
+    
+        # Watermark for incremental mode
+        previous = load_previous_results(results_file) if incremental else None
+        since = datetime.fromisoformat(previous["scouting_date"]) if previous else None
+        if incremental and previous is None:
+            print("No usable previous scouting results; running a full scouting pass.")
+    
+        # Check template for region focus
+        prompt_file = osp.join(base_dir, "prompt.json")
+        if osp.exists(prompt_file):
+            with open(prompt_file, "r") as f:
+                prompt_config = json.load(f)
+            # Override region_focus from template if not provided
+            if region_focus is None:
+                region_focus = prompt_config.get("region_focus")
+            # Per-host search budgets from the template
+            configure_rate_limits(prompt_config.get("rate_limits"))
+    
+        include_japan = region_focus and region_focus.lower() in ["japan", "jp", "asia"]
+    
+        print(f"Starting technology scouting for domain: {domain}")
+        print(f"Focus areas: {', '.join(focus_areas)}")
+        if region_focus:
+            print(f"Region focus: {region_focus}")
+    
+        # Collect data from all sources into per-kind deduplication indexes
+        indexes = {source: RecordIndex(source) for source in SEARCH_SOURCES}
+    
+        year_start = datetime.now().year - year_lookback
+        year_end = datetime.now().year
+        news_days_back = 180
+        from_date = None
+        if since is not None:
+            # Date filters where the APIs support them; the seen-ID filter
+            # below removes anything from before the watermark that still matches
+            from_date = since.strftime("%Y-%m-%d")
+            year_start = max(year_start, since.year)
+            news_days_back = max(1, min(news_days_back, (datetime.now() - since).days + 1))
+            print(f"Incremental mode: fetching records published since {from_date}")
+    
+        patent_country = "JP" if include_japan else "US"
+    
+        semaphore = asyncio.Semaphore(max(1, max_workers))
+    
+        async def fetch_source(query: str, source: str) -> List[Dict]:
+            async with semaphore:
+                if offline:
+                    # Full-text match against previously collected records
+                    records = await asyncio.to_thread(
+                        corpus.search,
+                        query,
+                        kinds=[source],
+                        limit=PROMPT_LIMITS[source],
+                        min_year=year_start if source != "news" else None,
+                    )
+                    for record in records:
+                        del record["score"]
+                    return records
+                if source == "papers":
+                    # Search academic papers (global + region-specific)
+                    if include_japan:
+                        return await asearch_papers_all(
+                            query, year_start, year_end, limit=30, include_japan=True,
+                            max_workers=max_workers, from_date=from_date,
+                        )
+                    return await asearch_papers(
+                        query, year_start, year_end, limit=30, from_date=from_date
+                    )
+                elif source == "patents":
+                    return await asearch_patents(
+                        query, year_start, limit=20, country=patent_country, from_date=from_date
+                    )
+                else:
+                    if include_japan:
+                        return await asearch_news_japan(
+                            query, days_back=news_days_back, limit=20,
+                            max_workers=max_workers, from_date=from_date,
+                        )
+                    return await asearch_news(
+                        query, days_back=news_days_back, limit=20, from_date=from_date
+                    )
+    
+        async def search_source(query_index: int, query: str, source_index: int, source: str) -> List[Dict]:
+            results = await fetch_source(query, source)
+            # Deduplicate as results arrive; the order key keeps the merged
+            # corpus in (query, source, position) order regardless of timing.
+            indexes[source].extend(results, query=query, order=(query_index, source_index))
+            return results
+    
+        rate_limiter.reset_stats()
+    
+        # This run's cache applies to its own searches only, so concurrent runs
+        # with different output directories do not share settings
+        with response_cache_scope(
+            cache_dir or os.getenv("TECHSCOUT_CACHE_DIR") or osp.join(base_dir, "http_cache"),
+            enabled=use_cache,
+            refresh=refresh_cache,
+        ) as response_cache:
+            cache_stats_before = response_cache.get_stats() if response_cache else None
         
-        # Search news
-        try:
-            if include_japan:
-                news = search_news_japan(query, days_back=180, limit=20)
-            else:
-                news = search_news(query, days_back=180, limit=20)
-            all_news.extend(news)
-            print(f"  Found {len(news)} news articles")
-            time.sleep(1)
-        except Exception as e:
-            print(f"  News search failed: {e}")
+            # One task per (query, source) pair
+            pairs = [(query, source) for query in search_queries for source in SEARCH_SOURCES]
+            if max_workers > 1:
+                print(f"\nSearching {len(search_queries)} queries across "
+                      f"{len(SEARCH_SOURCES)} sources with {max_workers} workers...")
+            outcomes = await asyncio.gather(
+                *(
+                    search_source(qi, query, si, source)
+                    for qi, query in enumerate(search_queries)
+                    for si, source in enumerate(SEARCH_SOURCES)
+                ),
+                return_exceptions=True,
+            )
+    
+        labels = {"papers": ("Paper", "papers"), "patents": ("Patent", "patents"), "news": ("News", "news articles")}
+        for (query, source), outcome in zip(pairs, outcomes):
+            if source == SEARCH_SOURCES[0]:
+                print(f"\nSearching for: {query}")
+            failure_label, found_label = labels[source]
+            if isinstance(outcome, Exception):
+                print(f"  {failure_label} search failed: {outcome}")
+                continue
+            print(f"  Found {len(outcome)} {found_label}")
+    
+        all_papers = indexes["papers"].records()
+        all_patents = indexes["patents"].records()
+        all_news = indexes["news"].records()
+        print("\nAfter deduplication: " + ", ".join(
+            f"{len(indexes[source])}/{indexes[source].total_hits} {source}" for source in SEARCH_SOURCES
+        ))
+    
+        # Persist this run's records so later runs, deep dives and reports can
+        # query them locally
+        if corpus is not None and not offline:
+            # Batched SQLite writes block, so they run off the event loop
+            added = {
+                source: await asyncio.to_thread(corpus.add_records, records, source, domain=domain)
+                for source, records in zip(SEARCH_SOURCES, (all_papers, all_patents, all_news))
+            }
+            total = await asyncio.to_thread(corpus.count)
+            print("Corpus store: " + ", ".join(f"{added[source]} new {source}" for source in SEARCH_SOURCES)
+                  + f" ({total} records total)")
+    finally:
+        if corpus is not None:
+            corpus.close()
+    
+    # Incremental mode: keep only records not seen in the previous corpus,
+    # then merge them into it
+    new_records = None
+    if previous is not None:
+        prior = previous["raw_data"]
+        new_records = {}
+        merged = {}
+        for source, records in zip(SEARCH_SOURCES, (all_papers, all_patents, all_news)):
+            seen = RecordIndex(source)
+            seen.extend(prior.get(source) or [])
+            new_records[source] = [r for r in records if seen.find(r) is None]
+            merged[source] = list(prior.get(source) or []) + new_records[source]
+        all_papers, all_patents, all_news = (merged[source] for source in SEARCH_SOURCES)
+        print("New since last run: " + ", ".join(
+            f"{len(new_records[source])} {source}" for source in SEARCH_SOURCES
+        ))
+    
+    if response_cache is not None:
+        cache_stats = response_cache.get_stats()
+        print(f"\nResponse cache: {cache_stats['hits'] - cache_stats_before['hits']} hits, "
+              f"{cache_stats['misses'] - cache_stats_before['misses']} misses "
+              f"({cache_stats['entries']} entries, {cache_stats['bytes'] / 1e6:.1f} MB)")
+    
+    rate_limit_stats = get_rate_limit_stats()
+    if rate_limit_stats:
+        print("\nRate limiter waits:")
+        for host, stats in sorted(rate_limit_stats.items()):
+            print(f"  {host}: {stats['requests']} requests, "
+                  f"{stats['total_wait']:.1f}s total wait (max {stats['max_wait']:.1f}s)")
     
     # Load existing technologies if available
     existing_tech_file = osp.join(base_dir, "existing_technologies.json")
@@ -1015,11 +1609,73 @@ def scout_technologies(
         with open(existing_tech_file, "r") as f:
             existing_technologies = json.load(f)
     
-    # Format data for LLM
-    papers_str = json.dumps(all_papers[:50], indent=2)  # Limit for context
-    patents_str = json.dumps(all_patents[:30], indent=2)
-    news_str = json.dumps(all_news[:30], indent=2)
-    existing_str = json.dumps(existing_technologies, indent=2)
+    if new_records is not None:
+        if not any(new_records.values()):
+            # Nothing new: keep the previous analysis and advance the watermark
+            print("No new records since the last run; keeping previous technologies.")
+            results = dict(previous)
+            results["scouting_date"] = datetime.now().isoformat()
+            results["incremental"] = {
+                "since": since.isoformat(),
+                "new_records": {source: 0 for source in SEARCH_SOURCES},
+            }
+            with open(results_file, "w") as f:
+                json.dump(results, f, indent=2)
+            return results
+        
+        # Previously discovered technologies count as existing for discovery
+        existing_technologies = existing_technologies + (previous.get("technologies") or [])
+    
+    # Rank by relevance and focus-area coverage; the packer below sends as
+    # many of the top records as the model's token budget allows.
+    # Incremental runs prefer new records and fill up with the best of the
+    # previous corpus.
+    # Map-reduce mode orders every record by relevance instead, since all of
+    # them are sent (new records first in incremental runs).
+    selected = {}
+    for source, records in (("papers", all_papers), ("patents", all_patents), ("news", all_news)):
+        if new_records is not None:
+            old_count = len(records) - len(new_records[source])
+            if map_reduce:
+                selected[source] = (order_records(new_records[source], domain, focus_areas)
+                                    + order_records(records[:old_count], domain, focus_areas))
+            else:
+                selected[source] = select_incremental_evidence(
+                    new_records[source], records[:old_count], domain, focus_areas,
+                    PROMPT_LIMITS[source],
+                )
+        elif map_reduce:
+            selected[source] = order_records(records, domain, focus_areas)
+        else:
+            selected[source] = rank_records(records, domain, focus_areas, PROMPT_LIMITS[source])
+    
+    # Format data for LLM: compact record lines within the model's budget
+    # (one prompt-sized shard per discovery call in map-reduce mode)
+    existing_str = compact_json(existing_technologies)
+    budget = evidence_token_budget(
+        model, reserved_tokens=estimate_tokens(technology_discovery_prompt + existing_str)
+    )
+    shards = build_evidence_shards(selected, budget, max_shards) if map_reduce else []
+    if not shards:
+        shards = [pack_evidence(selected, budget)]
+    packed = shards[0]
+    if len(shards) > 1:
+        totals = {source: sum(shard["counts"][source] for shard in shards) for source in SEARCH_SOURCES}
+        print(f"Evidence for the LLM: {len(shards)} shards with "
+              + ", ".join(f"{totals[source]}/{len(selected[source])} {source}" for source in SEARCH_SOURCES)
+              + f" (~{budget:,} tokens each)")
+    else:
+        print(f"Evidence for the LLM: {describe_packing(packed)}")
+    
+    def discovery_prompt(shard: Dict) -> str:
+        return technology_discovery_prompt.format(
+            domain=domain,
+            focus_areas="\n".join(f"- {area}" for area in focus_areas),
+            papers=shard["text"]["papers"],
+            patents=shard["text"]["patents"],
+            news=shard["text"]["news"],
+            existing_technologies=existing_str,
+        )
     
     # Load system prompt from template if available
     prompt_file = osp.join(base_dir, "prompt.json")
@@ -1034,29 +1690,62 @@ def scout_technologies(
     print("\nAnalyzing collected data with LLM...")
     msg_history = []
     
-    text, msg_history = get_response_from_llm(
-        technology_discovery_prompt.format(
-            domain=domain,
-            focus_areas="\n".join(f"- {area}" for area in focus_areas),
-            papers=papers_str,
-            patents=patents_str,
-            news=news_str,
-            existing_technologies=existing_str,
-        ),
-        client=client,
-        model=model,
-        system_message=system_prompt,
-        msg_history=msg_history,
-    )
-    
-    technologies = extract_json_between_markers(text)
+    if len(shards) > 1:
+        # Map: one discovery call per shard, shard_concurrency at a time
+        print(f"Map step: {len(shards)} shards, {max(1, shard_concurrency)} at a time")
+        shard_semaphore = asyncio.Semaphore(max(1, shard_concurrency))
+        
+        async def discover_shard(shard: Dict) -> List[Dict]:
+            async with shard_semaphore:
+                shard_text, _ = await aget_response_from_llm(
+                    discovery_prompt(shard),
+                    client=client,
+                    model=model,
+                    system_message=system_prompt,
+                    msg_history=[],
+                )
+            shard_technologies = extract_json_between_markers(shard_text)
+            return shard_technologies if isinstance(shard_technologies, list) else []
+        
+        outcomes = await asyncio.gather(*(discover_shard(shard) for shard in shards), return_exceptions=True)
+        shard_lists = []
+        for i, outcome in enumerate(outcomes):
+            if isinstance(outcome, Exception):
+                print(f"  Shard {i + 1} failed: {outcome}")
+            else:
+                shard_lists.append(outcome)
+        
+        # Reduce: merge and deduplicate, then let refinement continue from
+        # the merged list with the top-ranked shard's evidence in view
+        technologies = reduce_technologies(shard_lists)
+        print(f"Reduce step: {sum(len(l) for l in shard_lists)} technologies from "
+              f"{len(shard_lists)} shards merged into {len(technologies)}")
+        text = (
+            f"ANALYSIS:\nMerged from the technologies found in {len(shard_lists)} evidence shards; "
+            f"the first shard is shown above.\n\nTECHNOLOGIES JSON:\n```json\n"
+            f"{json.dumps(technologies, indent=2)}\n```"
+        )
+        msg_history = [
+            {"role": "user", "content": discovery_prompt(shards[0])},
+            {"role": "assistant", "content": text},
+        ]
+    else:
+        text, msg_history = await aget_response_from_llm(
+            discovery_prompt(packed),
+            client=client,
+            model=model,
+            system_message=system_prompt,
+            msg_history=msg_history,
+        )
+        
+        technologies = extract_json_between_markers(text)
     
     # Refinement iterations
     if num_reflections > 1:
         for i in range(num_reflections - 1):
             print(f"Refinement iteration {i + 2}/{num_reflections}")
             
-            text, msg_history = get_response_from_llm(
+            text, msg_history = await aget_response_from_llm(
                 technology_refinement_prompt.format(
                     current_round=i + 2,
                     num_reflections=num_reflections,
@@ -1075,9 +1764,14 @@ def scout_technologies(
                 print(f"Analysis converged after {i + 2} iterations.")
                 break
     
+    if previous is not None:
+        technologies = merge_technologies(
+            previous.get("technologies") or [], technologies if isinstance(technologies, list) else []
+        )
+    
     # Generate trend analysis
     print("\nGenerating trend analysis...")
-    trend_text, _ = get_response_from_llm(
+    trend_text, _ = await aget_response_from_llm(
         trend_analysis_prompt.format(
             domain=domain,
             technologies=json.dumps(technologies, indent=2),
@@ -1109,6 +1803,16 @@ def scout_technologies(
             "news": all_news,
         },
     }
+    results["prompt_evidence"] = {
+        source: sum(shard["counts"][source] for shard in shards) for source in SEARCH_SOURCES
+    }
+    if map_reduce:
+        results["prompt_evidence"]["shards"] = len(shards)
+    if new_records is not None:
+        results["incremental"] = {
+            "since": since.isoformat(),
+            "new_records": {source: len(new_records[source]) for source in SEARCH_SOURCES},
+        }
     
     # Save results
     os.makedirs(base_dir, exist_ok=True)
@@ -1121,6 +1825,57 @@ def scout_technologies(
     return results
 
 
+def scout_technologies(
+    base_dir: str,
+    client,
+    model: str,
+    domain: str,
+    focus_areas: List[str],
+    search_queries: List[str],
+    skip_search: bool = False,
+    num_reflections: int = 3,
+    year_lookback: int = 3,
+    region_focus: Optional[str] = None,
+    max_workers: int = 1,
+    use_cache: bool = True,
+    refresh_cache: bool = False,
+    cache_dir: Optional[str] = None,
+    incremental: bool = False,
+    use_corpus: bool = True,
+    corpus_path: Optional[str] = None,
+    map_reduce: bool = False,
+    shard_concurrency: int = 4,
+    max_shards: int = MAX_DISCOVERY_SHARDS,
+) -> Dict:
+    """
+    Main function to scout for emerging technologies in a given domain.
+    
+    Blocking wrapper around ascout_technologies(); see it for arguments.
+    """
+    return run_sync(ascout_technologies(
+        base_dir=base_dir,
+        client=client,
+        model=model,
+        domain=domain,
+        focus_areas=focus_areas,
+        search_queries=search_queries,
+        skip_search=skip_search,
+        num_reflections=num_reflections,
+        year_lookback=year_lookback,
+        region_focus=region_focus,
+        max_workers=max_workers,
+        use_cache=use_cache,
+        refresh_cache=refresh_cache,
+        cache_dir=cache_dir,
+        incremental=incremental,
+        use_corpus=use_corpus,
+        corpus_path=corpus_path,
+        map_reduce=map_reduce,
+        shard_concurrency=shard_concurrency,
+        max_shards=max_shards,
+    ))
+
+
 def generate_search_queries(
     client,
     model: str,
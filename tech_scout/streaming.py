@@ -0,0 +1,207 @@
+"""
+Streaming Parse Module
+
+This module provides incremental parsers for large search responses so
+records can be normalized while the body is still arriving, without first
+building the whole document in memory.
+
+``iter_json_array`` walks a top-level JSON object chunk by chunk and yields
+the elements of one array member (e.g. OpenAlex's "results") one at a time;
+the other top-level members (e.g. "meta") are collected into a dict.
+``iter_xml_elements`` does the same for repeated XML elements (RSS items,
+Atom entries) and frees each element once the caller has processed it.
+
+Callers can stop iterating as soon as they have enough records; the rest of
+the body is then never read.
+"""
+
+import codecs
+import json
+import xml.etree.ElementTree as ET
+from typing import Collection, Dict, Iterable, Iterator, List, Optional
+
+# Bytes requested per read from a streamed response
+CHUNK_SIZE = 64 * 1024
+
+_decoder = json.JSONDecoder()
+_WHITESPACE = " \t\n\r"
+_NUMBER_CHARS = "0123456789.eE+-"
+
+
+class _Buffer:
+    """Text buffer fed from a byte-chunk iterator with an incremental UTF-8 decoder."""
+
+    def __init__(self, chunks: Iterable[bytes]):
+        self._chunks = iter(chunks)
+        self._decode = codecs.getincrementaldecoder("utf-8")().decode
+        self.text = ""
+        self.pos = 0
+        self.exhausted = False
+
+    def fill(self) -> bool:
+        """Append the next chunk; returns False once the input is exhausted."""
+        if self.exhausted:
+            return False
+        # Drop consumed text before growing the buffer
+        if self.pos > len(self.text) // 2:
+            self.text = self.text[self.pos:]
+            self.pos = 0
+        for chunk in self._chunks:
+            if chunk:
+                self.text += self._decode(chunk)
+                return True
+        self.text += self._decode(b"", final=True)
+        self.exhausted = True
+        return False
+
+    def drain(self):
+        """Read the remaining input so wrappers (e.g. the response cache) see a complete body."""
+        while self.fill():
+            pass
+
+    def skip(self, separators: str = _WHITESPACE) -> Optional[str]:
+        """Skip separator characters and return the next character (None at EOF)."""
+        while True:
+            while self.pos < len(self.text) and self.text[self.pos] in separators:
+                self.pos += 1
+            if self.pos < len(self.text):
+                return self.text[self.pos]
+            if not self.fill():
+                return None
+
+    def expect(self, char: str):
+        if self.skip() != char:
+            raise ValueError(f"Malformed JSON stream: expected {char!r} at offset {self.pos}")
+        self.pos += 1
+
+    def value(self):
+        """Decode the next complete JSON value, reading more input as needed."""
+        self.skip()
+        while True:
+            try:
+                value, end = _decoder.raw_decode(self.text, self.pos)
+            except json.JSONDecodeError:
+                # Most likely a value split across chunks; retry with more input
+                if not self.fill():
+                    raise
+                continue
+            # A number that reaches the end of the buffer (or stops at a partial
+            # fraction/exponent) may continue in the next chunk
+            if (isinstance(value, (int, float)) and not self.exhausted
+                    and (end == len(self.text) or self.text[end] in _NUMBER_CHARS)):
+                self.fill()
+                continue
+            self.pos = end
+            return value
+
+
+def iter_json_array(
+    chunks: Iterable[bytes],
+    key: str,
+    header: Optional[Dict] = None,
+) -> Iterator:
+    """
+    Stream the elements of ``document[key]`` from a JSON object.
+
+    Args:
+        chunks: Raw response body chunks (e.g. ``response.iter_content()``)
+        key: Top-level member holding the array to stream
+        header: Optional dict that receives every other top-level member
+            as soon as it has been parsed (members that precede ``key`` are
+            available before the first element is yielded)
+
+    Yields:
+        Each decoded element of the array, in order
+    """
+    buffer = _Buffer(chunks)
+    header = header if header is not None else {}
+
+    buffer.expect("{")
+    if buffer.skip() == "}":
+        buffer.drain()
+        return
+    while True:
+        name = buffer.value()
+        buffer.expect(":")
+        if name == key and buffer.skip() == "[":
+            buffer.pos += 1
+            if buffer.skip() == "]":
+                buffer.pos += 1
+            else:
+                while True:
+                    yield buffer.value()
+                    following = buffer.skip()
+                    buffer.pos += 1
+                    if following == "]":
+                        break
+                    if following != ",":
+                        raise ValueError(f"Malformed JSON stream: unexpected {following!r} in array")
+        else:
+            header[name] = buffer.value()
+
+        following = buffer.skip()
+        buffer.pos += 1
+        if following == "}":
+            buffer.drain()
+            return
+        if following != ",":
+            raise ValueError(f"Malformed JSON stream: unexpected {following!r} in object")
+
+
+def iter_xml_elements(chunks: Iterable[bytes], tags: Collection[str]) -> Iterator[ET.Element]:
+    """
+    Stream the elements of an XML document whose tag is in ``tags``.
+
+    Each element is yielded once its end tag has been parsed and is cleared
+    and detached from its parent when the caller asks for the next one, so
+    memory is bounded by a single element rather than the whole feed.
+
+    Args:
+        chunks: Raw response body chunks (e.g. ``response.iter_content()``)
+        tags: Tags to yield, including the namespace for namespaced
+            documents (e.g. "{http://www.w3.org/2005/Atom}entry")
+
+    Yields:
+        Each matching element, in document order
+
+    Raises:
+        xml.etree.ElementTree.ParseError: If the document is malformed
+    """
+    parser = ET.XMLPullParser(events=("start", "end"))
+    parents: List[ET.Element] = []
+
+    def matching(events):
+        for event, elem in events:
+            if event == "start":
+                parents.append(elem)
+                continue
+            parents.pop()
+            if elem.tag in tags:
+                yield elem
+                elem.clear()
+                if parents:
+                    parents[-1].remove(elem)
+
+    for chunk in chunks:
+        parser.feed(chunk)
+        yield from matching(parser.read_events())
+    parser.close()
+    yield from matching(parser.read_events())
+
+
+def abstract_from_inverted_index(inverted_index: Dict[str, List[int]]) -> str:
+    """
+    Rebuild abstract text from an OpenAlex ``abstract_inverted_index``.
+
+    Words are written straight into a position array sized from the highest
+    position instead of collecting and sorting (position, word) pairs.
+    """
+    size = 0
+    for positions in inverted_index.values():
+        if positions:
+            size = max(size, max(positions) + 1)
+    words: List[Optional[str]] = [None] * size
+    for word, positions in inverted_index.items():
+        for pos in positions:
+            words[pos] = word
+    return " ".join(filter(None, words))
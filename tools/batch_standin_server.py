@@ -0,0 +1,467 @@
+#!/usr/bin/env python3
+"""
+Local stand-in for the Anthropic and OpenAI batch APIs
+
+Serves the subset of both APIs that tech_scout uses, so batch mode (and
+the interactive path) can be exercised offline with the real SDKs:
+
+    OpenAI:     POST /v1/chat/completions
+                POST /v1/files, GET /v1/files/{id}, GET /v1/files/{id}/content
+                POST /v1/batches, GET /v1/batches/{id}, POST /v1/batches/{id}/cancel
+    Anthropic:  POST /v1/messages
+                POST /v1/messages/batches, GET /v1/messages/batches/{id},
+                GET /v1/messages/batches/{id}/results,
+                POST /v1/messages/batches/{id}/cancel
+
+Batches report "in progress" until ``--delay`` seconds after submission.
+Replies follow the JSON schema described in each prompt ("In <JSON>,
+provide:" bullet lists, including the nested objects of the fused
+evaluation prompt and the per-pair objects of the packed strategic fit
+prompt), with values derived from a hash of the prompt, so the
+same prompt always gets the same answer. Prompts without a JSON block get
+a short Markdown reply. ``--fail-rate`` makes that share of batch requests
+error out.
+
+Usage:
+    python tools/batch_standin_server.py --port 8765 --delay 5
+    # then, in another shell:
+    export OPENAI_BASE_URL=http://127.0.0.1:8765/v1 OPENAI_API_KEY=standin
+    export ANTHROPIC_BASE_URL=http://127.0.0.1:8765 ANTHROPIC_API_KEY=standin
+    python launch_techscout.py --template ... --skip-search --batch-api
+"""
+
+import argparse
+import hashlib
+import json
+import random
+import re
+import threading
+import time
+import uuid
+from datetime import datetime, timezone
+from email.parser import BytesParser
+from email.policy import HTTP
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Tuple
+
+_BULLET = re.compile(r'^(\s*)- "(\w+)":\s*(.*)$')
+_SECTION = re.compile(r'^"(\w+)": an object with')
+_CHOICES = re.compile(r"One of \[(.*?)\]")
+_RANGE = re.compile(r"(\d+)\s*-\s*(\d+)")
+_PAIR_IDS = re.compile(r"^(T\d+-O\d+(?:, T\d+-O\d+)*)$", re.MULTILINE)
+
+
+# =============================================================================
+# REPLY SYNTHESIS
+# =============================================================================
+
+def _pick(seed: str, field: str, count: int) -> int:
+    digest = hashlib.sha256(f"{seed}|{field}".encode("utf-8")).digest()
+    return int.from_bytes(digest[:4], "big") % count
+
+
+def _value(seed: str, field: str, description: str, children: List[Tuple]):
+    """Synthesize a value for one schema bullet from its description."""
+    if children:
+        return [_object(seed, children)]
+    choices = _CHOICES.search(description)
+    if choices:
+        options = [option.strip().strip('"') for option in choices.group(1).split(",")]
+        return options[_pick(seed, field, len(options))]
+    lowered = description.lower()
+    if lowered.startswith(("rating", "weighted score", "technology readiness level")) or "score" in field:
+        low, high = map(int, (_RANGE.search(description) or re.match(r"(1)(10)", "110")).groups())
+        return low + _pick(seed, field, high - low + 1)
+    if "years" in lowered:
+        return _pick(seed, field, 8)
+    if lowered.startswith(("list", "top ")):
+        return [f"Stand-in {field.replace('_', ' ')} {i + 1}" for i in range(2)]
+    if lowered.startswith("dict"):
+        return {}
+    return f"Stand-in {field.replace('_', ' ')}"
+
+
+def _object(seed: str, bullets: List[Tuple]) -> Dict:
+    return {field: _value(seed, field, description, children) for field, description, children in bullets}
+
+
+def _parse_bullets(lines: List[str]) -> List[Tuple]:
+    """Parse '- "field": description' lines (nested by indentation) into (field, description, children)."""
+    bullets: List[Tuple] = []
+    for line in lines:
+        match = _BULLET.match(line)
+        if not match:
+            continue
+        indent, field, description = match.groups()
+        if indent and bullets:
+            bullets[-1][2].append((field, description, []))
+        else:
+            bullets.append((field, description, []))
+    return bullets
+
+
+def standin_reply(prompt: str) -> str:
+    """Answer a tech_scout prompt with schema-shaped, prompt-deterministic content."""
+    seed = hashlib.sha256(prompt.encode("utf-8")).hexdigest()
+    markers = re.findall(r"^([A-Z][A-Z ]*JSON):\s*$", prompt, re.MULTILINE)
+    if not markers:
+        return "# Stand-in Brief\n\nThis reply was generated by the local batch stand-in server.\n"
+
+    schema = prompt.split(f"{markers[-1]}:")[-1].splitlines()
+    sections: Dict[str, List[str]] = {}
+    current: Optional[str] = None
+    top_level: List[str] = []
+    for line in schema:
+        match = _SECTION.match(line.strip())
+        if match:
+            current = match.group(1)
+            sections[current] = []
+        elif current is not None:
+            sections[current].append(line)
+        else:
+            top_level.append(line)
+
+    pair_ids = _PAIR_IDS.search(prompt)
+    if sections:
+        payload = {name: _object(seed, _parse_bullets(lines)) for name, lines in sections.items()}
+    elif "one key per pair ID" in prompt and pair_ids:
+        bullets = _parse_bullets(top_level)
+        payload = {key: _object(seed + key, bullets) for key in pair_ids.group(1).split(", ")}
+    else:
+        payload = _object(seed, _parse_bullets(top_level))
+    return (f"ANALYSIS:\nStand-in analysis.\n\n{markers[-1]}:\n"
+            f"```json\n{json.dumps(payload, indent=2)}\n```\n")
+
+
+def _prompt_of(messages: List[Dict]) -> str:
+    content = messages[-1]["content"] if messages else ""
+    if isinstance(content, list):
+        content = "".join(block.get("text", "") for block in content)
+    return content
+
+
+def _openai_completion(body: Dict) -> Dict:
+    prompt = _prompt_of(body.get("messages", []))
+    text = standin_reply(prompt)
+    return {
+        "id": f"chatcmpl-{uuid.uuid4().hex[:24]}",
+        "object": "chat.completion",
+        "created": int(time.time()),
+        "model": body.get("model", "standin"),
+        "choices": [
+            {"index": i, "message": {"role": "assistant", "content": text}, "finish_reason": "stop"}
+            for i in range(body.get("n") or 1)
+        ],
+        "usage": {
+            "prompt_tokens": len(prompt) // 4,
+            "completion_tokens": len(text) // 4,
+            "total_tokens": (len(prompt) + len(text)) // 4,
+        },
+    }
+
+
+def _anthropic_message(body: Dict) -> Dict:
+    prompt = _prompt_of(body.get("messages", []))
+    text = standin_reply(prompt)
+    return {
+        "id": f"msg_{uuid.uuid4().hex[:24]}",
+        "type": "message",
+        "role": "assistant",
+        "model": body.get("model", "standin"),
+        "content": [{"type": "text", "text": text}],
+        "stop_reason": "end_turn",
+        "stop_sequence": None,
+        "usage": {"input_tokens": len(prompt) // 4, "output_tokens": len(text) // 4},
+    }
+
+
+# =============================================================================
+# BATCH STATE
+# =============================================================================
+
+def _iso(timestamp: Optional[float]) -> Optional[str]:
+    if timestamp is None:
+        return None
+    return datetime.fromtimestamp(timestamp, timezone.utc).isoformat().replace("+00:00", "Z")
+
+
+class StandInState:
+    """Files and batches held in memory; batches finish ``delay`` seconds after creation."""
+
+    def __init__(self, delay: float, fail_rate: float, base_url: str = ""):
+        self.delay = delay
+        self.fail_rate = fail_rate
+        self.base_url = base_url
+        self.files: Dict[str, Dict] = {}
+        self.batches: Dict[str, Dict] = {}
+        self.message_batches: Dict[str, Dict] = {}
+        self._rng = random.Random(0)
+        self.lock = threading.Lock()
+
+    def _fails(self) -> bool:
+        return self.fail_rate > 0 and self._rng.random() < self.fail_rate
+
+    def add_file(self, filename: str, purpose: str, content: bytes) -> Dict:
+        file_id = f"file-{uuid.uuid4().hex[:24]}"
+        self.files[file_id] = {
+            "id": file_id,
+            "object": "file",
+            "bytes": len(content),
+            "created_at": int(time.time()),
+            "filename": filename,
+            "purpose": purpose,
+            "status": "processed",
+            "content": content,
+        }
+        return self.file_info(file_id)
+
+    def file_info(self, file_id: str) -> Dict:
+        return {k: v for k, v in self.files[file_id].items() if k != "content"}
+
+    # OpenAI batches
+
+    def create_batch(self, body: Dict) -> Dict:
+        batch_id = f"batch_{uuid.uuid4().hex[:24]}"
+        lines = [l for l in self.files[body["input_file_id"]]["content"].decode("utf-8").splitlines() if l.strip()]
+        now = time.time()
+        self.batches[batch_id] = {
+            "id": batch_id,
+            "object": "batch",
+            "endpoint": body["endpoint"],
+            "errors": None,
+            "input_file_id": body["input_file_id"],
+            "completion_window": body.get("completion_window", "24h"),
+            "status": "in_progress",
+            "output_file_id": None,
+            "error_file_id": None,
+            "created_at": int(now),
+            "in_progress_at": int(now),
+            "expires_at": int(now + 24 * 3600),
+            "completed_at": None,
+            "cancelled_at": None,
+            "request_counts": {"total": len(lines), "completed": 0, "failed": 0},
+            "metadata": body.get("metadata"),
+            "_requests": [json.loads(line) for line in lines],
+            "_ready_at": now + self.delay,
+        }
+        return self.batch_info(batch_id)
+
+    def batch_info(self, batch_id: str) -> Dict:
+        batch = self.batches[batch_id]
+        if batch["status"] == "in_progress" and time.time() >= batch["_ready_at"]:
+            self._finish_batch(batch)
+        return {k: v for k, v in batch.items() if not k.startswith("_")}
+
+    def _finish_batch(self, batch: Dict):
+        output, errors = [], []
+        for request in batch["_requests"]:
+            entry = {"id": f"batch_req_{uuid.uuid4().hex[:24]}", "custom_id": request["custom_id"]}
+            if self._fails():
+                entry.update(response={"status_code": 500, "request_id": uuid.uuid4().hex, "body": {
+                    "error": {"message": "Stand-in failure", "type": "server_error"}}}, error=None)
+            else:
+                entry.update(response={"status_code": 200, "request_id": uuid.uuid4().hex,
+                                       "body": _openai_completion(request["body"])}, error=None)
+            (output if entry["response"]["status_code"] == 200 else errors).append(entry)
+        batch["output_file_id"] = self.add_file(
+            "batch_output.jsonl", "batch_output", "\n".join(json.dumps(e) for e in output).encode("utf-8")
+        )["id"]
+        if errors:
+            batch["error_file_id"] = self.add_file(
+                "batch_errors.jsonl", "batch_output", "\n".join(json.dumps(e) for e in errors).encode("utf-8")
+            )["id"]
+        batch["status"] = "completed"
+        batch["completed_at"] = int(time.time())
+        batch["request_counts"].update(completed=len(output), failed=len(errors))
+
+    def cancel_batch(self, batch_id: str) -> Dict:
+        batch = self.batches[batch_id]
+        if batch["status"] == "in_progress":
+            batch["status"] = "cancelled"
+            batch["cancelled_at"] = int(time.time())
+        return self.batch_info(batch_id)
+
+    # Anthropic message batches
+
+    def create_message_batch(self, body: Dict) -> Dict:
+        batch_id = f"msgbatch_{uuid.uuid4().hex[:24]}"
+        now = time.time()
+        self.message_batches[batch_id] = {
+            "_requests": body["requests"],
+            "_results": None,
+            "_created": now,
+            "_ready_at": now + self.delay,
+            "_ended": None,
+            "_cancelled": None,
+        }
+        return self.message_batch_info(batch_id)
+
+    def message_batch_info(self, batch_id: str) -> Dict:
+        batch = self.message_batches[batch_id]
+        if batch["_ended"] is None and time.time() >= batch["_ready_at"]:
+            results = []
+            for request in batch["_requests"]:
+                if batch["_cancelled"] is not None:
+                    result = {"type": "canceled"}
+                elif self._fails():
+                    result = {"type": "errored", "error": {"type": "error", "error": {
+                        "type": "api_error", "message": "Stand-in failure"}}}
+                else:
+                    result = {"type": "succeeded", "message": _anthropic_message(request["params"])}
+                results.append({"custom_id": request["custom_id"], "result": result})
+            batch["_results"] = results
+            batch["_ended"] = time.time()
+
+        counts = {"processing": 0, "succeeded": 0, "errored": 0, "canceled": 0, "expired": 0}
+        if batch["_results"] is None:
+            counts["processing"] = len(batch["_requests"])
+        else:
+            for entry in batch["_results"]:
+                counts[entry["result"]["type"]] += 1
+        ended = batch["_ended"] is not None
+        return {
+            "id": batch_id,
+            "type": "message_batch",
+            "processing_status": "ended" if ended else ("canceling" if batch["_cancelled"] else "in_progress"),
+            "request_counts": counts,
+            "created_at": _iso(batch["_created"]),
+            "expires_at": _iso(batch["_created"] + 24 * 3600),
+            "ended_at": _iso(batch["_ended"]),
+            "cancel_initiated_at": _iso(batch["_cancelled"]),
+            "archived_at": None,
+            "results_url": f"{self.base_url}/v1/messages/batches/{batch_id}/results" if ended else None,
+        }
+
+    def cancel_message_batch(self, batch_id: str) -> Dict:
+        batch = self.message_batches[batch_id]
+        if batch["_ended"] is None:
+            batch["_cancelled"] = time.time()
+            batch["_ready_at"] = time.time()
+        return self.message_batch_info(batch_id)
+
+
+# =============================================================================
+# HTTP SERVER
+# =============================================================================
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """Routes API requests to the shared StandInState."""
+
+    protocol_version = "HTTP/1.1"
+    state: StandInState = None
+
+    def _send(self, status: int, payload, content_type: str = "application/json"):
+        body = payload if isinstance(payload, bytes) else json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _not_found(self):
+        self._send(404, {"error": {"type": "not_found_error", "message": f"No route for {self.path}"}})
+
+    def _body(self) -> bytes:
+        return self.rfile.read(int(self.headers.get("Content-Length") or 0))
+
+    def do_POST(self):
+        path = self.path.split("?")[0].rstrip("/")
+        raw = self._body()
+        state = self.state
+        with state.lock:
+            if path == "/v1/chat/completions":
+                return self._send(200, _openai_completion(json.loads(raw)))
+            if path == "/v1/messages":
+                return self._send(200, _anthropic_message(json.loads(raw)))
+            if path == "/v1/files":
+                return self._upload(raw)
+            if path == "/v1/batches":
+                return self._send(200, state.create_batch(json.loads(raw)))
+            if path == "/v1/messages/batches":
+                return self._send(200, state.create_message_batch(json.loads(raw)))
+            match = re.fullmatch(r"/v1/batches/([\w-]+)/cancel", path)
+            if match and match.group(1) in state.batches:
+                return self._send(200, state.cancel_batch(match.group(1)))
+            match = re.fullmatch(r"/v1/messages/batches/([\w-]+)/cancel", path)
+            if match and match.group(1) in state.message_batches:
+                return self._send(200, state.cancel_message_batch(match.group(1)))
+        self._not_found()
+
+    def _upload(self, raw: bytes):
+        header = f"Content-Type: {self.headers.get('Content-Type')}\r\n\r\n".encode("utf-8")
+        message = BytesParser(policy=HTTP).parsebytes(header + raw)
+        fields, filename, content = {}, "upload.jsonl", b""
+        for part in message.iter_parts():
+            name = part.get_param("name", header="content-disposition")
+            if name == "file":
+                filename = part.get_filename() or filename
+                content = part.get_payload(decode=True)
+            else:
+                fields[name] = part.get_content().strip()
+        self._send(200, self.state.add_file(filename, fields.get("purpose", "batch"), content))
+
+    def do_GET(self):
+        path = self.path.split("?")[0].rstrip("/")
+        state = self.state
+        with state.lock:
+            match = re.fullmatch(r"/v1/files/([\w-]+)(/content)?", path)
+            if match and match.group(1) in state.files:
+                if match.group(2):
+                    return self._send(200, state.files[match.group(1)]["content"], "application/octet-stream")
+                return self._send(200, state.file_info(match.group(1)))
+            match = re.fullmatch(r"/v1/batches/([\w-]+)", path)
+            if match and match.group(1) in state.batches:
+                return self._send(200, state.batch_info(match.group(1)))
+            match = re.fullmatch(r"/v1/messages/batches/([\w-]+)(/results)?", path)
+            if match and match.group(1) in state.message_batches:
+                info = state.message_batch_info(match.group(1))
+                if not match.group(2):
+                    return self._send(200, info)
+                results = state.message_batches[match.group(1)]["_results"]
+                if results is not None:
+                    body = "\n".join(json.dumps(entry) for entry in results).encode("utf-8")
+                    return self._send(200, body, "application/binary")
+        self._not_found()
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_server(host: str = "127.0.0.1", port: int = 0, delay: float = 2.0, fail_rate: float = 0.0):
+    """
+    Start the stand-in server on a background thread.
+
+    Returns:
+        Tuple of (server, base URL such as "http://127.0.0.1:8765"); call
+        ``server.shutdown()`` to stop it
+    """
+    handler = type("StandInServerHandler", (StandInHandler,), {})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    base_url = f"http://{server.server_address[0]}:{server.server_address[1]}"
+    handler.state = StandInState(delay, fail_rate, base_url)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, base_url
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local stand-in for the Anthropic and OpenAI batch APIs.")
+    parser.add_argument("--host", type=str, default="127.0.0.1", help="Interface to bind.")
+    parser.add_argument("--port", type=int, default=8765, help="Port to listen on.")
+    parser.add_argument("--delay", type=float, default=2.0, help="Seconds until a submitted batch completes.")
+    parser.add_argument("--fail-rate", type=float, default=0.0, help="Share of batch requests that error.")
+    args = parser.parse_args()
+
+    server, base_url = start_server(args.host, args.port, args.delay, args.fail_rate)
+    print(f"Batch stand-in listening on {base_url}")
+    print(f"  export OPENAI_BASE_URL={base_url}/v1 OPENAI_API_KEY=standin")
+    print(f"  export ANTHROPIC_BASE_URL={base_url} ANTHROPIC_API_KEY=standin")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()